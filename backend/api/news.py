@@ -3,16 +3,23 @@
 """
 
 from fastapi import APIRouter, Query, HTTPException
+from typing import Optional
+from datetime import date
+import asyncio
 import sys
 from pathlib import Path
 
 # 부모 디렉토리를 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from services.news_service import NewsService
+from services.news_service import get_news_service
+from services.config import env_int
 
 router = APIRouter()
-service = NewsService()
+service = get_news_service()
+
+# 일괄 뉴스 조회 시 최대 종목 수
+BULK_MAX_TICKERS = env_int("NEWS_BULK_MAX_TICKERS", 50, minimum=1)
 
 
 @router.get("/stock-news", tags=["News Search"])
@@ -35,6 +42,34 @@ async def get_stock_news(ticker: str = Query(..., description="종목 코드"),
     return result
 
 
+@router.get("/stock-news/bulk", tags=["News Search"])
+async def get_stock_news_bulk(
+    tickers: str = Query(..., description="쉼표로 구분한 종목 코드 (예: TSLA,NVDA,AAPL)"),
+    limit: int = Query(5, ge=1, le=25, description="종목별 결과 개수")
+):
+    """
+    여러 종목의 뉴스를 동시에 검색
+    
+    Parameters:
+    - tickers: 쉼표로 구분한 종목 코드 (최대 BULK_MAX_TICKERS개)
+    - limit: 종목별 결과 개수 (기본값: 5)
+    
+    Returns:
+    - 종목별 뉴스 검색 결과 (/stock-news 와 같은 형식)
+    """
+    symbols = list(dict.fromkeys(t.strip().upper() for t in tickers.split(",") if t.strip()))
+    if not symbols:
+        raise HTTPException(status_code=400, detail="유효한 종목 코드를 입력하세요.")
+    if len(symbols) > BULK_MAX_TICKERS:
+        raise HTTPException(status_code=400, detail=f"종목은 최대 {BULK_MAX_TICKERS}개까지 조회할 수 있습니다.")
+    
+    results = await service.search_stock_news_bulk(symbols, limit)
+    return {
+        "count": len(results),
+        "results": results
+    }
+
+
 @router.get("/", tags=["News Search"])
 async def get_market_news(limit: int = Query(10, description="결과 개수")):
     """
@@ -55,21 +90,40 @@ async def get_market_news(limit: int = Query(10, description="결과 개수")):
 
 
 @router.get("/search", tags=["News Search"])
-async def search_news(query: str = Query(..., description="검색 쿼리"), limit: int = Query(10, description="결과 개수")):
+async def search_news(
+    query: str = Query(..., description="검색 쿼리"),
+    limit: int = Query(10, ge=1, le=50, description="결과 개수"),
+    tickers: Optional[str] = Query(None, description="쉼표로 구분한 종목 코드 (예: TSLA,NVDA)"),
+    from_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD, 포함)"),
+    to_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD, 포함)")
+):
     """
-    뉴스 검색 (향후 구현)
+    수집된 뉴스 전문 검색 (로컬 색인, 업스트림 호출 없음)
+    
+    종목/시장 뉴스 조회 때 수집한 기사가 색인에 누적되며, 제목/요약을 BM25 관련도순으로 검색합니다.
     
     Parameters:
-    - query: 검색 쿼리
-    - limit: 결과 개수
+    - query: 검색 쿼리 (모든 단어 포함)
+    - limit: 결과 개수 (기본값: 10)
+    - tickers: 관련 종목 필터 (선택)
+    - from_date / to_date: 발행일 필터 (UTC, 선택)
     
     Returns:
-    - 검색 결과
+    - 검색 결과 (제목, URL, 발행일, 요약, 관련 종목, 점수)
     """
-    return {
-        "message": "뉴스 검색",
-        "query": query,
-        "limit": limit,
-        "results": []
-    }
-
+    symbols = None
+    if tickers is not None:
+        symbols = list(dict.fromkeys(t.strip().upper() for t in tickers.split(",") if t.strip()))
+        if not symbols:
+            raise HTTPException(status_code=400, detail="유효한 종목 코드를 입력하세요.")
+    
+    # SQLite 색인 검색은 이벤트 루프를 막지 않도록 스레드에서 실행
+    result = await asyncio.to_thread(
+        service.search_indexed_news, query, limit, tickers=symbols, from_date=from_date, to_date=to_date
+    )
+    
+    if result.get("status") == "error":
+        status_code = 503 if result.get("error_type") == "index_unavailable" else 400
+        raise HTTPException(status_code=status_code, detail=result.get("message"))
+    
+    return result
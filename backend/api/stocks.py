@@ -2,8 +2,10 @@
 주식 API 라우터
 """
 
-from fastapi import APIRouter, Query, HTTPException
-from typing import Literal
+from fastapi import APIRouter, Query, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, List, Literal
+import json
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -11,32 +13,103 @@ from datetime import datetime
 # 부모 디렉토리를 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from services.stock_service import StockService
-from services.news_service import NewsService
-from models.schemas import TrendingStockDetail, NewsItem
+from services.stock_service import StockService, MAX_TRENDING_COUNT
+from services.market_snapshot import MAX_SCREEN_LIMIT
+from services.quote_stream import QuoteStreamHub
+from services.config import env_float, env_int
+from services.news_service import get_news_service
+from models.schemas import TrendingStockDetail, NewsItem, ScreenRequest
 
 router = APIRouter()
 stock_service = StockService()
-news_service = NewsService()
+news_service = get_news_service()
+# 종목별 폴러 하나를 모든 스트림 구독자가 공유
+# (폴러는 시세 캐시를 건너뛰므로 STREAM_POLL_INTERVAL이 종목별 업스트림 조회 주기, QUOTE_CACHE_TTL과 무관)
+quote_stream = QuoteStreamHub(stock_service, interval=env_float("STREAM_POLL_INTERVAL", 5.0))
+
+# 스트림 연결당 최대 구독 종목 수 / 변경이 없을 때 연결 유지용 주석 전송 주기 (초)
+STREAM_MAX_TICKERS = env_int("STREAM_MAX_TICKERS", 20, minimum=1)
+STREAM_HEARTBEAT = 15.0
 
 # 스크리너 타입 리터럴
 ScreenerType = Literal["most_actives", "day_gainers", "day_losers"]
 
 
+async def get_related_news(ticker: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    종목 관련 뉴스 조회 후 NewsItem 형식으로 변환
+    
+    Parameters:
+    - ticker: 종목 코드
+    - limit: 결과 개수
+    
+    Returns:
+    - NewsItem 딕셔너리 목록 (조회 실패 시 빈 목록)
+    """
+    news_result = await news_service.search_stock_news(ticker, limit=limit)
+    return to_news_items(ticker, news_result)
+
+
+def to_news_items(ticker: str, news_result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    search_stock_news 결과를 NewsItem 형식으로 변환
+    
+    Parameters:
+    - ticker: 종목 코드
+    - news_result: search_stock_news 결과
+    
+    Returns:
+    - NewsItem 딕셔너리 목록 (조회 실패 시 빈 목록)
+    """
+    news_list = []
+    
+    if news_result.get("status") == "success":
+        for news in news_result.get("news", []):
+            try:
+                # published_date를 datetime으로 변환
+                pub_date = news.get("published_date", "")
+                if isinstance(pub_date, str) and pub_date:
+                    try:
+                        published_at = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
+                    except ValueError:
+                        published_at = datetime.now()
+                else:
+                    published_at = datetime.now()
+                
+                news_item = NewsItem(
+                    title=news.get("title", ""),
+                    summary=news.get("summary", ""),
+                    source="Exa",
+                    url=news.get("url", ""),
+                    published_at=published_at,
+                    related_tickers=news.get("related_tickers") or [ticker]
+                )
+                news_list.append(news_item.model_dump())
+            except (KeyError, ValueError, TypeError) as e:
+                # 개별 뉴스 파싱 오류 무시
+                pass
+    
+    return news_list
+
+
 @router.get("/trending", tags=["Stock Screener"])
-async def get_trending_stocks(screener_type: ScreenerType = Query("most_actives", description="스크리너 타입")):
+async def get_trending_stocks(
+    screener_type: ScreenerType = Query("most_actives", description="스크리너 타입"),
+    count: int = Query(1, ge=1, le=MAX_TRENDING_COUNT, description="조회할 상위 종목 수")
+):
     """
-    화제 종목 조회 (상위 1개 + 관련 뉴스)
+    화제 종목 조회 (상위 N개 + TOP 1 관련 뉴스)
     
     Parameters:
     - screener_type: most_actives (가장 거래량이 많은 종목), day_gainers (당일 상승), day_losers (당일 하락)
+    - count: 조회할 상위 종목 수 (기본값: 1)
     
     Returns:
-    - 선정된 TOP 1 종목의 상세 정보 + 관련 뉴스
+    - 선정된 TOP 1 종목의 상세 정보 + 관련 뉴스, 상위 N개 종목 목록(stocks)
     """
     try:
         # 종목 정보 조회
-        stock_result = await stock_service.get_trending_stocks(screener_type)
+        stock_result = await stock_service.get_trending_stocks(screener_type, count=count)
         
         if stock_result.get("status") == "error":
             raise HTTPException(status_code=400, detail=stock_result.get("message", "주식 조회 실패"))
@@ -46,43 +119,18 @@ async def get_trending_stocks(screener_type: ScreenerType = Query("most_actives"
         ticker = top_stock.get("ticker")
         
         # 관련 뉴스 조회 (5개)
-        news_result = await news_service.search_stock_news(ticker, limit=5)
-        news_list = []
-        
-        if news_result.get("status") == "success":
-            for news in news_result.get("news", []):
-                try:
-                    # published_date를 datetime으로 변환
-                    pub_date = news.get("published_date", "")
-                    if isinstance(pub_date, str) and pub_date:
-                        try:
-                            published_at = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
-                        except ValueError:
-                            published_at = datetime.now()
-                    else:
-                        published_at = datetime.now()
-                    
-                    news_item = NewsItem(
-                        title=news.get("title", ""),
-                        summary=news.get("summary", ""),
-                        source="Exa",
-                        url=news.get("url", ""),
-                        published_at=published_at,
-                        related_tickers=[ticker]
-                    )
-                    news_list.append(news_item)
-                except (KeyError, ValueError, TypeError) as e:
-                    # 개별 뉴스 파싱 오류 무시
-                    pass
+        news_list = await get_related_news(ticker, limit=5)
         
         # 통합 응답 구성
         response = {
             "status": "success",
             "screener_type": screener_type,
+            "count": stock_result.get("count", 1),
             "top_stock": {
                 **top_stock,
-                "news": [n.model_dump() for n in news_list]
-            }
+                "news": news_list
+            },
+            "stocks": stock_result.get("stocks", [top_stock])
         }
         
         return response
@@ -95,16 +143,209 @@ async def get_trending_stocks(screener_type: ScreenerType = Query("most_actives"
         raise HTTPException(status_code=500, detail=f"주식 조회 중 오류 발생: {str(e)}")
 
 
+@router.get("/trending/all", tags=["Stock Screener"])
+async def get_all_trending_stocks():
+    """
+    모든 스크리너 타입의 화제 종목 일괄 조회 (각 TOP 1 + 관련 뉴스)
+    
+    most_actives, day_gainers, day_losers를 한 번의 요청으로 조회하고,
+    여러 스크리너에 중복된 종목은 한 번만 조회합니다.
+    
+    Returns:
+    - results: 스크리너 타입별 /trending 과 같은 형식의 응답
+    """
+    try:
+        all_result = await stock_service.get_all_trending_stocks()
+        
+        if all_result.get("status") == "error":
+            raise HTTPException(status_code=400, detail=all_result.get("message", "주식 조회 실패"))
+        
+        results = all_result.get("results", {})
+        
+        # 선정된 종목들의 관련 뉴스를 일괄 조회 (중복 종목은 한 번만, NEWS_CONCURRENCY 적용)
+        tickers = [
+            section["top_stock"]["ticker"]
+            for section in results.values()
+            if section.get("status") == "success" and (section.get("top_stock") or {}).get("ticker")
+        ]
+        news_results = await news_service.search_stock_news_bulk(tickers, limit=5)
+        news_by_ticker = {ticker: to_news_items(ticker, result) for ticker, result in news_results.items()}
+        
+        response_results = {}
+        for screener_type, section in results.items():
+            if section.get("status") == "success":
+                top_stock = section.get("top_stock", {})
+                section = {
+                    **section,
+                    "top_stock": {
+                        **top_stock,
+                        "news": news_by_ticker.get(str(top_stock.get("ticker")).upper().strip(), [])
+                    }
+                }
+            response_results[screener_type] = section
+        
+        return {
+            "status": "success",
+            "results": response_results
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        import logging
+        logging.error(f"전체 화제 종목 조회 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"주식 조회 중 오류 발생: {str(e)}")
+
+
+# 시장 스냅샷 순위 리터럴
+RankingType = Literal["most_actives", "day_gainers", "day_losers", "unusual_volume"]
+
+# 스냅샷 기반 조회 오류 유형별 HTTP 상태 코드 (그 외 오류는 500)
+SNAPSHOT_ERROR_STATUS = {"validation_error": 400, "snapshot_unavailable": 503}
+
+
+@router.get("/rankings/{ranking}", tags=["Stock Screener"])
+async def get_ranking(
+    ranking: RankingType,
+    count: int = Query(10, ge=1, le=MAX_SCREEN_LIMIT, description="조회할 종목 수")
+):
+    """
+    시장 스냅샷 순위 조회 (미리 정렬된 순위에서 상위 N개)
+    
+    Parameters:
+    - ranking: most_actives (거래량), day_gainers (상승률), day_losers (하락률), unusual_volume (거래량 비율)
+    - count: 조회할 종목 수 (기본값: 10)
+    
+    Returns:
+    - 순위 상위 종목 목록
+    """
+    result = await stock_service.get_ranking(ranking, count=count)
+    
+    if result.get("status") == "error":
+        raise HTTPException(
+            status_code=SNAPSHOT_ERROR_STATUS.get(result.get("error_type"), 500),
+            detail=result.get("message", "순위 조회 실패")
+        )
+    
+    return result
+
+
+@router.post("/screen", tags=["Stock Screener"])
+async def screen_stocks(request: ScreenRequest):
+    """
+    조건 기반 종목 스크리닝 (메모리 내 시장 스냅샷 기준)
+    
+    Parameters:
+    - min_/max_ price, change_percent, volume, volume_ratio, market_cap, pe_ratio: 범위 조건
+    - sectors: 섹터 목록
+    - sort_by / descending / limit: 정렬 및 개수
+    
+    Returns:
+    - 조건에 맞는 종목 목록과 스냅샷 기준 시각
+    """
+    result = await stock_service.screen_stocks(request.model_dump())
+    
+    if result.get("status") == "error":
+        raise HTTPException(
+            status_code=SNAPSHOT_ERROR_STATUS.get(result.get("error_type"), 500),
+            detail=result.get("message")
+        )
+    
+    return result
+
+
+@router.get("/stream", tags=["Stock Info"])
+async def stream_quotes(
+    request: Request,
+    tickers: str = Query(..., description="쉼표로 구분한 종목 코드 (예: TSLA,NVDA)")
+):
+    """
+    실시간 시세 스트림 (Server-Sent Events)
+    
+    종목별 폴러 하나가 조회한 시세를 모든 연결에 전달하며, 값이 바뀐 경우에만
+    `quote` 이벤트를 보냅니다. 느린 클라이언트에는 종목별 최신 값만 전달됩니다.
+    
+    Parameters:
+    - tickers: 쉼표로 구분한 종목 코드 (최대 STREAM_MAX_TICKERS개)
+    
+    Returns:
+    - text/event-stream (event: quote, data: {ticker, price, change_percent, volume})
+    """
+    symbols = list(dict.fromkeys(t.strip().upper() for t in tickers.split(",") if t.strip()))
+    if not symbols:
+        raise HTTPException(status_code=400, detail="유효한 종목 코드를 입력하세요.")
+    if len(symbols) > STREAM_MAX_TICKERS:
+        raise HTTPException(status_code=400, detail=f"종목은 최대 {STREAM_MAX_TICKERS}개까지 구독할 수 있습니다.")
+    
+    async def event_source():
+        updates = quote_stream.stream(symbols, heartbeat=STREAM_HEARTBEAT)
+        try:
+            async for batch in updates:
+                if await request.is_disconnected():
+                    break
+                if not batch:
+                    yield ": keep-alive\n\n"
+                for update in batch:
+                    yield f"event: quote\ndata: {json.dumps(update)}\n\n"
+        finally:
+            await updates.aclose()
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/search", tags=["Stock Search"])
-async def search_stocks(query: str = Query(..., description="검색 쿼리")):
-    """주식 종목 검색"""
+async def search_stocks(
+    query: str = Query(..., description="검색 쿼리 (티커 또는 회사명)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 결과 수")
+):
+    """
+    주식 종목 검색
+    
+    시장 스냅샷으로 채워지는 메모리 인덱스에서 티커 접두어와 회사명(오타 허용)을 검색합니다.
+    """
+    results = stock_service.search_stocks(query, limit)
     return {
-        "message": "주식 검색",
         "query": query,
-        "results": []
+        "count": len(results),
+        "results": results
     }
 
 
+@router.get("/{ticker}/indicators", tags=["Stock Info"])
+async def get_stock_indicators(ticker: str):
+    """
+    종목의 기술적 지표 조회 (저장된 일봉 히스토리 기반)
+    
+    Parameters:
+    - ticker: 종목 코드 (예: AAPL, MSFT, NVDA)
+    
+    Returns:
+    - 기준일(as_of), 종가, 20/50/200일 이동평균, RSI(14), ATR(14), 20일 변동성(연율화), 거래량 z-score
+    """
+    try:
+        if not ticker or len(ticker.strip()) == 0:
+            raise HTTPException(status_code=400, detail="유효한 종목 코드를 입력하세요.")
+        
+        results = await stock_service.get_indicators([ticker])
+        result = results.get(ticker.upper().strip(), {})
+        
+        if result.get("status") != "success":
+            raise HTTPException(status_code=404, detail=result.get("error", "지표를 계산할 수 없습니다."))
+        
+        return result
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        import logging
+        logging.error(f"지표 조회 중 오류 ({ticker}): {str(e)}")
+        raise HTTPException(status_code=500, detail=f"지표 조회 중 오류 발생: {str(e)}")
+
+
 @router.get("/{ticker}", tags=["Stock Info"])
 async def get_stock_info(ticker: str):
     """
@@ -127,39 +368,12 @@ async def get_stock_info(ticker: str):
             raise HTTPException(status_code=400, detail=stock_result.get("error", "종목 정보 조회 실패"))
         
         # 관련 뉴스 조회 (5개)
-        news_result = await news_service.search_stock_news(ticker, limit=5)
-        news_list = []
-        
-        if news_result.get("status") == "success":
-            for news in news_result.get("news", []):
-                try:
-                    # published_date를 datetime으로 변환
-                    pub_date = news.get("published_date", "")
-                    if isinstance(pub_date, str) and pub_date:
-                        try:
-                            published_at = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
-                        except ValueError:
-                            published_at = datetime.now()
-                    else:
-                        published_at = datetime.now()
-                    
-                    news_item = NewsItem(
-                        title=news.get("title", ""),
-                        summary=news.get("summary", ""),
-                        source="Exa",
-                        url=news.get("url", ""),
-                        published_at=published_at,
-                        related_tickers=[ticker]
-                    )
-                    news_list.append(news_item)
-                except (KeyError, ValueError, TypeError) as e:
-                    # 개별 뉴스 파싱 오류 무시
-                    pass
+        news_list = await get_related_news(ticker, limit=5)
         
         # 통합 응답 구성 (stock_result를 기반으로 news 추가)
         response = {
             **stock_result,
-            "news": [n.model_dump() for n in news_list]
+            "news": news_list
         }
         
         return response
@@ -53,6 +53,56 @@ async def health_check():
 
 # 라우터 임포트
 from api import stocks, news, briefings
+from services.upstream_executor import executor_stats
+from services.rate_limiter import rate_limiter_stats
+from services.circuit_breaker import circuit_breaker_stats
+from services.config import env_float
+
+
+@app.get("/metrics", tags=["Health"])
+async def metrics():
+    """업스트림 호출 실행기 및 캐시 통계"""
+    return {
+        "executors": executor_stats(),
+        "rate_limits": rate_limiter_stats(),
+        "circuit_breakers": circuit_breaker_stats(),
+        "caches": {
+            "quotes": stocks.stock_service.quote_cache.stats(),
+            "profiles": stocks.stock_service.profile_cache.stats(),
+            "profile_misses": stocks.stock_service.profile_misses.stats(),
+            "profile_store": stocks.stock_service.profile_store.stats(),
+            "history_store": stocks.stock_service.history_store.stats(),
+            "news": stocks.news_service.news_cache.stats(),
+            "news_store": stocks.news_service.news_store.stats(),
+            "news_index": news.service.news_index.stats(),
+            "last_good": {
+                "stocks": stocks.stock_service.last_good.stats(),
+                "news": stocks.news_service.last_good.stats()
+            }
+        },
+        "snapshot": stocks.stock_service.snapshot.stats(),
+        "search_index": {"size": len(stocks.stock_service.search_index)},
+        "stream": stocks.quote_stream.stats(),
+        "singleflight": {
+            "stocks": stocks.stock_service.singleflight.stats(),
+            "news": stocks.news_service.singleflight.stats()
+        }
+    }
+
+
+@app.on_event("startup")
+async def start_background_tasks():
+    """시장 스냅샷 주기 갱신 시작 (SNAPSHOT_REFRESH_INTERVAL=0 이면 요청 시에만 갱신)"""
+    interval = env_float("SNAPSHOT_REFRESH_INTERVAL", 60.0)
+    if interval > 0:
+        stocks.stock_service.start_snapshot_refresh(interval)
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    """시장 스냅샷 주기 갱신 및 시세 스트림 폴러 중지"""
+    await stocks.stock_service.stop_snapshot_refresh()
+    await stocks.quote_stream.close()
 
 
 # 라우터 등록
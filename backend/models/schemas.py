@@ -3,7 +3,7 @@
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 
@@ -70,3 +70,25 @@ class StockDetailResponse(BaseModel):
     industry: Optional[str] = Field(None, description="산업")
     pe_ratio: Optional[str] = Field(None, description="PER")
     news: List[NewsItem] = Field(default_factory=list, description="관련 뉴스")
+
+
+class ScreenRequest(BaseModel):
+    """종목 스크리닝 조건"""
+    min_price: Optional[float] = Field(None, ge=0, description="최소 가격")
+    max_price: Optional[float] = Field(None, ge=0, description="최대 가격")
+    min_change_percent: Optional[float] = Field(None, description="최소 변동률 (%)")
+    max_change_percent: Optional[float] = Field(None, description="최대 변동률 (%)")
+    min_volume: Optional[float] = Field(None, ge=0, description="최소 거래량")
+    max_volume: Optional[float] = Field(None, ge=0, description="최대 거래량")
+    min_volume_ratio: Optional[float] = Field(None, ge=0, description="최소 거래량 비율 (당일 / 3개월 평균)")
+    max_volume_ratio: Optional[float] = Field(None, ge=0, description="최대 거래량 비율 (당일 / 3개월 평균)")
+    min_market_cap: Optional[float] = Field(None, ge=0, description="최소 시가총액 ($)")
+    max_market_cap: Optional[float] = Field(None, ge=0, description="최대 시가총액 ($)")
+    min_pe_ratio: Optional[float] = Field(None, description="최소 PER")
+    max_pe_ratio: Optional[float] = Field(None, description="최대 PER")
+    sectors: List[str] = Field(default_factory=list, description="섹터 목록 (예: Technology)")
+    sort_by: Literal[
+        "price", "change_percent", "volume", "avg_volume", "market_cap", "pe_ratio", "volume_ratio"
+    ] = Field("volume", description="정렬 기준")
+    descending: bool = Field(True, description="내림차순 정렬 여부")
+    limit: int = Field(50, ge=1, le=500, description="최대 결과 수")
@@ -15,6 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from services.stock_service import StockService
 from services.briefing_service import BriefingService
+from services.config import env_int
 
 # 로거 설정
 logging.basicConfig(
@@ -23,6 +24,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 스크리너별로 함께 저장할 상위 종목 수 (이메일 표용)
+TRENDING_COUNT = env_int("TRENDING_COUNT", 5, minimum=1)
+
 
 async def generate_briefings():
     """브리핑 생성 및 저장"""
@@ -38,12 +42,28 @@ async def generate_briefings():
         screener_types = ["most_actives", "day_gainers", "day_losers"]
         briefings = {}
         
+        # 스크리너별 화제 종목 조회
+        stock_results = {}
+        for screener_type in screener_types:
+            try:
+                stock_result = await stock_service.get_trending_stocks(screener_type, count=TRENDING_COUNT)
+            except Exception as e:
+                stock_result = {"status": "error", "message": str(e)}
+            stock_results[screener_type] = stock_result
+        
+        # 선정된 종목들의 뉴스를 일괄 조회 (중복 종목은 한 번만, NEWS_CONCURRENCY 적용)
+        tickers = [
+            result.get("top_stock", {}).get("ticker")
+            for result in stock_results.values()
+            if result.get("status") == "success"
+        ]
+        news_by_ticker = await briefing_service.news_service.get_stock_news_bulk(tickers)
+        
         for screener_type in screener_types:
             logger.info(f"\n[{screener_type.upper()}] 브리핑 생성 중...")
             
             try:
-                # 화제 종목 조회
-                stock_result = await stock_service.get_trending_stocks(screener_type)
+                stock_result = stock_results[screener_type]
                 
                 if stock_result.get("status") != "success":
                     logger.error(f"❌ 종목 조회 실패: {stock_result.get('message')}")
@@ -57,7 +77,8 @@ async def generate_briefings():
                 # 브리핑 콘텐츠 생성
                 briefing_content = await briefing_service.generate_briefing_content(
                     ticker=ticker,
-                    screener_type=screener_type
+                    screener_type=screener_type,
+                    news_items=news_by_ticker.get(str(ticker).upper().strip())
                 )
                 
                 briefings[screener_type] = {
@@ -65,7 +86,8 @@ async def generate_briefings():
                     "screener_type": screener_type,
                     "generated_at": datetime.now().isoformat(),
                     "content": briefing_content,
-                    "top_stock": top_stock
+                    "top_stock": top_stock,
+                    "stocks": stock_result.get("stocks", [top_stock])
                 }
                 
                 logger.info(f"✅ 완료: {ticker} 브리핑 생성됨")
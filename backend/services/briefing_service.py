@@ -6,7 +6,7 @@
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from .stock_service import StockService
-from .news_service import NewsService
+from .news_service import get_news_service
 import logging
 
 # 로거 설정
@@ -18,12 +18,13 @@ class BriefingService:
     
     def __init__(self):
         self.stock_service = StockService()
-        self.news_service = NewsService()
+        self.news_service = get_news_service()
     
     async def generate_briefing_content(
         self,
         ticker: str,
-        screener_type: str = "most_actives"
+        screener_type: str = "most_actives",
+        news_items: Optional[List[Dict[str, Any]]] = None
     ) -> str:
         """
         종목 기반 브리핑 마크다운 콘텐츠 생성
@@ -31,6 +32,7 @@ class BriefingService:
         Args:
             ticker: 종목 코드 (예: "TSLA")
             screener_type: 스크리너 유형 ("most_actives", "day_gainers", "day_losers")
+            news_items: 미리 조회한 뉴스 목록 (get_stock_news 형식, None이면 여기서 조회)
         
         Returns:
             브리핑 마크다운 텍스트
@@ -56,17 +58,28 @@ class BriefingService:
                 logger.error(f"종목 정보 조회 실패: {ticker} - {stock_info.get('error')}")
                 raise ValueError(f"{ticker} 종목 정보를 조회할 수 없습니다.")
             
-            # 2. 뉴스 조회
-            news_items_list = await self.news_service.get_stock_news(ticker)
+            # 2. 뉴스 조회 (일괄 조회한 뉴스가 있으면 재사용)
+            if news_items is None:
+                news_items_list = await self.news_service.get_stock_news(ticker)
+            else:
+                news_items_list = news_items
             
             logger.debug(f"뉴스 조회 완료: {ticker} ({len(news_items_list)}개)")
             
-            # 3. 마크다운 포맷 생성
+            # 3. 기술적 지표 조회 (실패해도 브리핑은 생성)
+            try:
+                indicators = (await self.stock_service.get_indicators([ticker])).get(ticker)
+            except Exception as e:
+                logger.warning(f"기술적 지표 조회 실패 ({ticker}): {str(e)}")
+                indicators = None
+            
+            # 4. 마크다운 포맷 생성
             briefing_md = self._format_briefing_markdown(
                 ticker=ticker,
                 stock_info=stock_info,
                 news_items=news_items_list,
-                screener_type=screener_type
+                screener_type=screener_type,
+                indicators=indicators
             )
             
             logger.info(f"브리핑 생성 완료: {ticker}")
@@ -86,7 +99,8 @@ class BriefingService:
         ticker: str,
         stock_info: Dict[str, Any],
         news_items: List[Dict[str, Any]],
-        screener_type: str
+        screener_type: str,
+        indicators: Optional[Dict[str, Any]] = None
     ) -> str:
         """마크다운 포맷 브리핑 생성"""
         
@@ -167,7 +181,7 @@ class BriefingService:
 - **거래 활동**: 거래량 {self._format_volume(volume)}
 - **기본 정보**: {sector} 섹터, {industry} 산업
 - **밸류에이션**: PER {pe_ratio}
-
+{self._format_indicator_summary(indicators)}
 이 브리핑은 실시간 시장 데이터를 기반으로 자동 생성되었습니다.
 
 ---
@@ -177,6 +191,46 @@ class BriefingService:
         
         return md
     
+    @staticmethod
+    def _format_indicator_summary(indicators: Optional[Dict[str, Any]]) -> str:
+        """기술적 지표를 분석 요약 항목으로 변환 (지표가 없으면 빈 문자열)"""
+        if not indicators or indicators.get("status") != "success":
+            return ""
+        
+        close = indicators.get("close")
+        lines = []
+        
+        # 추세: 종가 대비 이동평균 위치
+        trend = []
+        for window in (20, 50, 200):
+            ma = indicators.get(f"ma_{window}")
+            if ma and close:
+                trend.append(f"{window}일선 ${ma:.2f} ({(close / ma - 1) * 100:+.1f}%)")
+        if trend:
+            lines.append(f"- **추세**: {', '.join(trend)}")
+        
+        rsi = indicators.get("rsi_14")
+        if rsi is not None:
+            state = "과매수" if rsi >= 70 else "과매도" if rsi <= 30 else "중립"
+            lines.append(f"- **모멘텀**: RSI(14) {rsi:.1f} ({state})")
+        
+        volatility = []
+        if indicators.get("atr_14") is not None:
+            volatility.append(f"ATR(14) ${indicators['atr_14']:.2f}")
+        if indicators.get("volatility_20") is not None:
+            volatility.append(f"20일 변동성 {indicators['volatility_20'] * 100:.1f}% (연율화)")
+        if volatility:
+            lines.append(f"- **변동성**: {', '.join(volatility)}")
+        
+        zscore = indicators.get("volume_zscore")
+        if zscore is not None:
+            state = "평소 대비 급증" if zscore >= 2 else "평소 대비 감소" if zscore <= -1 else "평소 수준"
+            lines.append(f"- **거래량 이상치**: z-score {zscore:+.2f} ({state})")
+        
+        if not lines:
+            return ""
+        return "\n".join(lines) + f"\n\n*기술적 지표 기준일: {indicators.get('as_of')}*\n"
+    
     @staticmethod
     def _format_volume(volume: int) -> str:
         """거래량을 사람이 읽을 수 있는 형식으로 변환"""
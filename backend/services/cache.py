@@ -0,0 +1,116 @@
+"""
+인메모리 캐시
+TTL + LRU 제거 + 크기 제한, stale-while-revalidate 조회 지원
+"""
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+import threading
+import time
+
+# 조회 상태
+CACHE_HIT = "hit"
+CACHE_STALE = "stale"
+CACHE_MISS = "miss"
+
+
+class TTLCache:
+    """TTL과 LRU 제거를 지원하는 스레드 안전 캐시"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 15.0, max_stale: float = 0.0):
+        """
+        TTLCache 초기화
+
+        Args:
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            ttl: 항목이 신선한(fresh) 것으로 간주되는 시간 (초)
+            max_stale: TTL 경과 후에도 stale 값으로 제공할 수 있는 추가 시간 (초)
+        """
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Tuple[Optional[Any], str]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (값, 상태) 튜플. 상태는 "hit", "stale", "miss" 중 하나이며
+            miss인 경우 값은 None
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None, CACHE_MISS
+
+            value, stored_at = entry
+            age = now - stored_at
+            if age <= self.ttl:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return value, CACHE_HIT
+            if age <= self.ttl + self.max_stale:
+                self._data.move_to_end(key)
+                self._stale_hits += 1
+                return value, CACHE_STALE
+
+            # 완전히 만료된 항목 제거
+            del self._data[key]
+            self._misses += 1
+            return None, CACHE_MISS
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        캐시 저장 (크기 초과 시 LRU 항목 제거)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """캐시 항목 삭제"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스/stale 카운터 및 크기"""
+        with self._lock:
+            lookups = self._hits + self._stale_hits + self._misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "max_stale": self.max_stale,
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": round((self._hits + self._stale_hits) / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,242 @@
+"""
+업스트림 서킷 브레이커
+연속 실패 시 회로를 열어 업스트림 호출을 즉시 차단하고, 마지막 정상 응답으로 대체
+"""
+
+from typing import Any, Dict, Hashable, Optional
+import logging
+import threading
+import time
+
+from .cache import TTLCache, CACHE_HIT
+from .config import env_int, env_float
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 회로 상태
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# 기본값 (환경 변수 {NAME}_CIRCUIT_FAILURES / {NAME}_CIRCUIT_RESET 로 변경, FAILURES=0이면 비활성화)
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 업스트림 호출을 시도하지 않을 때 발생"""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"{name} 업스트림 회로 열림 ({retry_after:.1f}초 후 재시도)")
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커
+
+    closed: 정상 호출, 연속 실패가 failure_threshold에 도달하면 open
+    open: reset_timeout 동안 모든 호출을 즉시 거절 (CircuitOpenError)
+    half_open: 시험 호출 하나만 허용, 성공하면 closed / 실패하면 다시 open
+
+    회로가 열리거나 시험 호출이 시작될 때마다 세대(generation)가 바뀌며, before_call이 돌려준
+    세대와 현재 세대가 다른 호출(회로가 열리기 전에 시작된 호출 등)의 결과는 무시합니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, reset_timeout: float = DEFAULT_RESET_TIMEOUT):
+        """
+        CircuitBreaker 초기화
+
+        Args:
+            name: 업스트림 이름 (예: "yahoo", "exa")
+            failure_threshold: 회로를 여는 연속 실패 횟수 (0 이하이면 비활성화)
+            reset_timeout: 회로를 연 뒤 시험 호출을 허용하기까지의 시간 (초)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        # 시험 호출 시작 시각 (결과 없이 취소된 시험 호출은 reset_timeout 후 만료)
+        self._probe_started_at: Optional[float] = None
+        # 회로가 열리거나 시험 호출이 시작될 때마다 증가 (이전 세대 호출의 결과 무시)
+        self._generation = 0
+        self._opens = 0
+        self._rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        """서킷 브레이커 사용 여부"""
+        return self.failure_threshold > 0
+
+    @property
+    def state(self) -> str:
+        """현재 회로 상태 (open이라도 reset_timeout이 지났으면 half_open)"""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == CIRCUIT_OPEN and now - self._opened_at >= self.reset_timeout:
+            return CIRCUIT_HALF_OPEN
+        return self._state
+
+    def before_call(self) -> int:
+        """
+        호출 허용 여부 확인 (half_open이면 이 호출이 시험 호출이 됨)
+
+        Returns:
+            호출 세대 (호출 결과를 record_success / record_failure에 함께 전달)
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 다른 시험 호출이 진행 중인 경우
+        """
+        if not self.enabled:
+            return self._generation
+        now = time.monotonic()
+        with self._lock:
+            state = self._current_state(now)
+            if state == CIRCUIT_CLOSED:
+                return self._generation
+            if state == CIRCUIT_HALF_OPEN:
+                probing = self._probe_started_at is not None and now - self._probe_started_at < self.reset_timeout
+                if not probing:
+                    # 만료된 이전 시험 호출의 늦은 결과는 무시되도록 새 세대 시작
+                    self._state = CIRCUIT_HALF_OPEN
+                    self._probe_started_at = now
+                    self._generation += 1
+                    logger.info(f"서킷 브레이커 시험 호출: {self.name}")
+                    return self._generation
+                retry_after = self.reset_timeout - (now - self._probe_started_at)
+            else:
+                retry_after = self.reset_timeout - (now - self._opened_at)
+            self._rejected += 1
+        raise CircuitOpenError(self.name, max(retry_after, 0.0))
+
+    def record_success(self, generation: int) -> None:
+        """
+        호출 성공 기록 (시험 호출이 성공하면 회로를 닫음)
+
+        Args:
+            generation: 해당 호출의 before_call 반환값 (현재 세대가 아니면 무시)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            if self._state != CIRCUIT_CLOSED:
+                logger.info(f"서킷 브레이커 닫힘: {self.name}")
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+            self._probe_started_at = None
+
+    def record_failure(self, generation: int) -> None:
+        """
+        호출 실패 기록 (연속 실패가 임계값에 도달하거나 시험 호출이 실패하면 회로를 엶)
+
+        Args:
+            generation: 해당 호출의 before_call 반환값 (현재 세대가 아니면 무시)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._failures += 1
+            if self._state == CIRCUIT_HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != CIRCUIT_OPEN:
+                    self._opens += 1
+                    logger.warning(f"서킷 브레이커 열림: {self.name} (연속 실패 {self._failures}회)")
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+                self._generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """회로 상태 및 차단 통계"""
+        with self._lock:
+            return {
+                "name": self.name,
+                "enabled": self.enabled,
+                "state": self._current_state(time.monotonic()),
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout": self.reset_timeout,
+                "opens": self._opens,
+                "rejected": self._rejected,
+            }
+
+
+class LastKnownGood:
+    """회로가 열렸거나 업스트림이 실패할 때 대신 제공할 마지막 정상 응답 저장소"""
+
+    def __init__(self, maxsize: int = 2048, max_age: float = 86400.0):
+        """
+        LastKnownGood 초기화
+
+        Args:
+            maxsize: 최대 항목 수 (LRU 제거)
+            max_age: 대체 응답으로 사용할 수 있는 최대 경과 시간 (초)
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl=max_age)
+
+    def remember(self, key: Hashable, value: Dict[str, Any]) -> None:
+        """정상 응답 저장"""
+        self._cache.set(key, (time.time(), value))
+
+    def recall(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        마지막 정상 응답 조회
+
+        Returns:
+            응답 사본에 "stale": True와 "data_age_seconds"(저장 후 경과 시간)를 추가한 딕셔너리,
+            없거나 max_age가 지났으면 None
+        """
+        entry, state = self._cache.get(key)
+        if state != CACHE_HIT:
+            return None
+        stored_at, value = entry
+        return {**value, "stale": True, "data_age_seconds": round(time.time() - stored_at, 1)}
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 크기 및 적중 통계"""
+        return self._cache.stats()
+
+
+# 업스트림별 공유 서킷 브레이커
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    업스트림 이름별 공유 서킷 브레이커 조회 (없으면 환경 변수 설정으로 생성)
+
+    Args:
+        name: 업스트림 이름 (예: "yahoo", "exa")
+
+    Returns:
+        해당 업스트림의 CircuitBreaker
+    """
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(name)
+        if breaker is None:
+            prefix = name.upper()
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=env_int(f"{prefix}_CIRCUIT_FAILURES", DEFAULT_FAILURE_THRESHOLD),
+                reset_timeout=env_float(f"{prefix}_CIRCUIT_RESET", DEFAULT_RESET_TIMEOUT)
+            )
+            _circuit_breakers[name] = breaker
+        return breaker
+
+
+def circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 업스트림 서킷 브레이커의 통계"""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    return {breaker.name: breaker.stats() for breaker in breakers}
@@ -0,0 +1,77 @@
+"""
+환경 변수 설정 헬퍼
+서비스 튜닝 값(캐시 TTL, 풀 크기 등)을 환경 변수에서 안전하게 읽기
+"""
+
+import logging
+import os
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+def env_int(key: str, default: int, minimum: int = 0) -> int:
+    """
+    정수 환경 변수 조회 (값이 없거나 유효하지 않으면 기본값)
+
+    Args:
+        key: 환경 변수 이름
+        default: 기본값
+        minimum: 허용 최소값
+
+    Returns:
+        설정값
+    """
+    value = os.getenv(key)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+        if parsed >= minimum:
+            return parsed
+    except (ValueError, TypeError):
+        pass
+    logger.warning(f"유효하지 않은 {key}: {value}, 기본값 {default} 사용")
+    return default
+
+
+def env_float(key: str, default: float, minimum: float = 0.0) -> float:
+    """
+    실수 환경 변수 조회 (값이 없거나 유효하지 않으면 기본값)
+
+    Args:
+        key: 환경 변수 이름
+        default: 기본값
+        minimum: 허용 최소값
+
+    Returns:
+        설정값
+    """
+    value = os.getenv(key)
+    if not value:
+        return default
+    try:
+        parsed = float(value)
+        if parsed >= minimum:
+            return parsed
+    except (ValueError, TypeError):
+        pass
+    logger.warning(f"유효하지 않은 {key}: {value}, 기본값 {default} 사용")
+    return default
+
+
+def env_bool(key: str, default: bool) -> bool:
+    """
+    불리언 환경 변수 조회 ("1", "true", "yes", "on" → True)
+
+    Args:
+        key: 환경 변수 이름
+        default: 기본값
+
+    Returns:
+        설정값
+    """
+    value = os.getenv(key)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
@@ -225,14 +225,23 @@ class EmailService:
         
         # 데이터 안전성 검증
         most_actives = briefings.get("most_actives", [])
+        if isinstance(most_actives, dict):
+            # 브리핑 생성 결과 형식 ({..., "stocks": [상위 N개 종목]})
+            most_actives = most_actives.get("stocks", [])
         if not isinstance(most_actives, list):
             most_actives = []
         
         day_gainers = briefings.get("day_gainers", [])
+        if isinstance(day_gainers, dict):
+            # 브리핑 생성 결과 형식 ({..., "stocks": [상위 N개 종목]})
+            day_gainers = day_gainers.get("stocks", [])
         if not isinstance(day_gainers, list):
             day_gainers = []
             
         day_losers = briefings.get("day_losers", [])
+        if isinstance(day_losers, dict):
+            # 브리핑 생성 결과 형식 ({..., "stocks": [상위 N개 종목]})
+            day_losers = day_losers.get("stocks", [])
         if not isinstance(day_losers, list):
             day_losers = []
         
@@ -338,7 +347,7 @@ class EmailService:
                 
                 change_pct = float(stock.get("change_percent", 0))
                 change_class = "positive" if change_pct > 0 else "negative"
-                symbol = str(stock.get("symbol", "N/A"))
+                symbol = str(stock.get("symbol", stock.get("ticker", "N/A")))
                 name = str(stock.get("name", "N/A"))
                 price = float(stock.get("price", 0))
                 
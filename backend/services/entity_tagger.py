@@ -0,0 +1,204 @@
+"""
+뉴스 종목 태깅
+종목 코드/회사명 사전으로 만든 Aho-Corasick 오토마톤으로 기사 제목과 요약을 한 번에 훑어 관련 종목을 찾음
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import deque
+from pathlib import Path
+import logging
+import string
+
+from .search_index import SearchEntry, SearchIndex
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 회사명 끝에서 제거할 법인 형태 등 (예: "Apple Inc." → "apple", "Alphabet Inc. Class A" → "alphabet")
+NAME_SUFFIXES = frozenset({
+    "inc", "incorporated", "corp", "corporation", "co", "company", "companies", "ltd", "limited", "plc",
+    "llc", "lp", "sa", "nv", "ag", "se", "holdings", "holding", "group", "class", "a", "b", "c",
+    "adr", "ads", "the", "com",
+})
+
+# 일반 단어/약어와 같아서 "$TSLA"처럼 캐시태그로 쓰였을 때만 인정하는 종목 코드
+AMBIGUOUS_SYMBOLS = frozenset({
+    "A", "AI", "ALL", "AM", "AN", "ARE", "AT", "BE", "BIG", "CAN", "CEO", "CFO", "CPI", "DD", "EU", "EV",
+    "ETF", "FED", "FOR", "GDP", "GO", "HAS", "IPO", "IT", "KEY", "LOW", "NEW", "NOW", "ON", "ONE", "OPEN",
+    "OR", "OUT", "PM", "REAL", "SEC", "SO", "TV", "UK", "US", "USA", "YOU",
+})
+
+# 회사명 패턴 최소 길이 (정규화 후 글자 수, 너무 짧은 이름은 오탐이 많음)
+MIN_NAME_LENGTH = 3
+
+# 토큰 구분: ASCII 영숫자와 "$"(캐시태그, 예: "$TSLA") 외의 바이트는 모두 공백으로
+# (UTF-8 바이트에 translate/split을 쓰면 정규식 토큰화보다 두 배 이상 빠름)
+_TOKEN_BYTES = frozenset((string.ascii_letters + string.digits + "$").encode())
+_SEPARATORS = bytes(b if b in _TOKEN_BYTES else 0x20 for b in range(256))
+
+# 패턴 종류 (종목 코드 / 캐시태그 / 회사명)
+_SYMBOL, _CASHTAG, _NAME = 0, 1, 2
+
+# (토큰 수, 종목 코드, 종류)
+_Pattern = Tuple[int, str, int]
+
+
+def _split(text: str) -> bytes:
+    """토큰 구분 문자를 공백으로 바꾼 UTF-8 바이트 (split()하면 토큰 목록)"""
+    return text.encode("utf-8", "surrogatepass").translate(_SEPARATORS)
+
+
+def _key_tokens(text: str) -> Tuple[str, ...]:
+    """사전 항목을 비교용 소문자 토큰으로 변환"""
+    return tuple(token.lstrip(b"$").decode() for token in _split(text or "").lower().split())
+
+
+def _name_tokens(name: str) -> Tuple[str, ...]:
+    """회사명을 비교용 소문자 토큰으로 변환 (앞의 "the"와 끝의 법인 형태 제거)"""
+    tokens = list(_key_tokens(name))
+    while tokens and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    if tokens and tokens[0] == "the":
+        tokens.pop(0)
+    return tuple(tokens)
+
+
+class EntityTagger:
+    """
+    종목 코드/회사명 Aho-Corasick 태거
+
+    단어 단위 오토마톤이라 단어 경계에서만 일치하고, 기사 길이에 비례하는 한 번의 훑기로
+    사전 전체를 찾습니다. 생성 후 변경하지 않음 (사전이 바뀌면 새 태거로 교체).
+
+    - 종목 코드: 원문에서 대문자일 때만 (예: "TSLA"), 한 글자이거나 일반 단어와 같으면 "$TSLA"만
+    - 회사명: 한 단어 이름은 원문이 대문자로 시작할 때만 (예: "Apple"은 되고 "apple pie"는 안 됨)
+    """
+
+    def __init__(self, entries: Iterable[SearchEntry] = ()):
+        """
+        EntityTagger 초기화
+
+        Args:
+            entries: (심볼, 회사명, 인기도 점수) 목록 (같은 회사명은 인기도가 가장 높은 종목으로)
+        """
+        names: Dict[Tuple[str, ...], Tuple[float, str]] = {}
+        patterns: List[Tuple[Tuple[str, ...], _Pattern]] = []
+        for symbol, name, score in entries:
+            symbol = (symbol or "").upper().strip()
+            symbol_tokens = _key_tokens(symbol)
+            if not symbol_tokens:
+                continue
+            patterns.append((symbol_tokens, (len(symbol_tokens), symbol, _SYMBOL)))
+            patterns.append((("$" + symbol_tokens[0],) + symbol_tokens[1:], (len(symbol_tokens), symbol, _CASHTAG)))
+            name_tokens = _name_tokens(name)
+            if len("".join(name_tokens)) >= MIN_NAME_LENGTH and name_tokens != symbol_tokens:
+                score = float(score or 0)
+                if name_tokens not in names or score > names[name_tokens][0]:
+                    names[name_tokens] = (score, symbol)
+        patterns.extend((tokens, (len(tokens), symbol, _NAME)) for tokens, (_, symbol) in names.items())
+        self.size = (len(patterns) - len(names)) // 2
+
+        # 트라이 (상태별 다음 토큰(bytes) → 상태)
+        self._goto: List[Dict[bytes, int]] = [{}]
+        self._output: List[List[_Pattern]] = [[]]
+        for tokens, pattern in patterns:
+            state = 0
+            for token in (token.encode() for token in tokens):
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(pattern)
+
+        # 실패 링크 (BFS), 실패 상태의 출력을 합쳐 두어 훑을 때 링크를 따라가지 않아도 됨
+        self._fail: List[int] = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(token, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+                queue.append(next_state)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_search_index(cls, index: SearchIndex) -> "EntityTagger":
+        """종목 검색 인덱스의 사전으로 태거 생성"""
+        return cls(index.entries())
+
+    @classmethod
+    def load(cls, path: Optional[Path]) -> "EntityTagger":
+        """저장된 종목 검색 인덱스 파일로 태거 생성 (파일이 없으면 빈 태거)"""
+        tagger = cls.from_search_index(SearchIndex.load(path))
+        logger.info(f"종목 태거 생성: {len(tagger)}개 종목, {len(tagger._goto)}개 상태")
+        return tagger
+
+    def tag(self, text: str) -> List[str]:
+        """
+        텍스트에 언급된 종목 코드
+
+        Args:
+            text: 기사 제목/요약 등
+
+        Returns:
+            처음 언급된 순서의 종목 코드 목록 (중복 제거)
+        """
+        if not text or len(self._goto) == 1:
+            return []
+        buffer = _split(text)
+        # 원문 토큰 (대소문자 확인용)과 소문자 토큰 (오토마톤 입력)은 개수/순서가 같음
+        tokens = buffer.split()
+        goto, fail, output = self._goto, self._fail, self._output
+        root = goto[0]
+        found: Dict[str, None] = {}
+        state = 0
+        for end, key in enumerate(buffer.lower().split()):
+            if state:
+                while state and key not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(key, 0)
+            else:
+                state = root.get(key, 0)
+            if state and output[state]:
+                for length, symbol, kind in output[state]:
+                    if symbol not in found and self._accept(tokens, end - length + 1, end, symbol, kind):
+                        found[symbol] = None
+        return list(found)
+
+    @staticmethod
+    def _accept(tokens: List[bytes], start: int, end: int, symbol: str, kind: int) -> bool:
+        """원문 대소문자/캐시태그로 오탐 걸러내기"""
+        if kind == _CASHTAG:
+            return True
+        if kind == _SYMBOL:
+            if len(symbol) == 1 or symbol in AMBIGUOUS_SYMBOLS:
+                return False
+            return all(token.isupper() or token.isdigit() for token in tokens[start:end + 1])
+        return start != end or tokens[start][:1].isupper()
+
+    def tag_articles(self, articles: Iterable[Dict[str, Any]], primary: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        기사 목록에 관련 종목(related_tickers) 추가
+
+        Args:
+            articles: {"title", "summary", ...} 목록
+            primary: 항상 맨 앞에 둘 종목 (예: 검색한 종목, 본문에 언급이 없어도 포함)
+
+        Returns:
+            "related_tickers"가 추가된 기사 사본 목록
+        """
+        tagged = []
+        for article in articles:
+            summary = article.get("summary")
+            text = f"{article.get('title') or ''}\n{summary if isinstance(summary, str) else ''}"
+            tickers = ([primary] if primary else []) + self.tag(text)
+            tagged.append({**article, "related_tickers": list(dict.fromkeys(tickers))})
+        return tagged
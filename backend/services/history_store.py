@@ -0,0 +1,244 @@
+"""
+일봉(OHLCV) 히스토리 저장소
+종목별 컬럼형 NumPy 파일에 일봉을 보관하고 메모리 맵으로 기간 조회 (API 호출 없음)
+"""
+
+from typing import Any, Dict, List, Optional, Union
+from datetime import date, datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+import logging
+import os
+import re
+import threading
+
+import numpy as np
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 기본 저장 경로 (backend/output/history)
+DEFAULT_HISTORY_STORE_PATH = Path(__file__).parent.parent / "output" / "history"
+
+# 파일 내 행 순서 (각 행이 하나의 컬럼, 날짜는 1970-01-01 기준 일수)
+HISTORY_COLUMNS = ("date", "open", "high", "low", "close", "volume")
+PRICE_COLUMNS = HISTORY_COLUMNS[1:]
+
+DateLike = Union[str, date, np.datetime64]
+
+# 미국 시장 시간대 / 장 마감 시각 (이후에야 당일 봉이 확정)
+MARKET_TIMEZONE = "America/New_York"
+MARKET_CLOSE_HOUR = 16
+
+
+def _to_day(value: DateLike) -> float:
+    """날짜를 1970-01-01 기준 일수로 변환"""
+    return float(np.datetime64(value, "D").astype(np.int64))
+
+
+def latest_trading_day(now: Optional[datetime] = None) -> np.datetime64:
+    """
+    장이 마감된 가장 최근 거래일 (주말 제외, 휴장일은 고려하지 않음)
+
+    Args:
+        now: 기준 시각 (None이면 현재 미국 동부 시각)
+
+    Returns:
+        거래일 (datetime64[D])
+    """
+    now = now or datetime.now(ZoneInfo(MARKET_TIMEZONE))
+    day = np.datetime64(now.date(), "D")
+    if now.hour < MARKET_CLOSE_HOUR:
+        day -= 1
+    return np.busday_offset(day, 0, roll="backward")
+
+
+class PriceHistory:
+    """한 종목의 기간별 일봉 (가격/거래량 컬럼은 저장 파일의 zero-copy 뷰)"""
+
+    __slots__ = ("symbol", "_data")
+
+    def __init__(self, symbol: str, data: np.ndarray):
+        """
+        PriceHistory 초기화
+
+        Args:
+            symbol: 종목 심볼
+            data: (컬럼 수, 봉 개수) 형태의 배열
+        """
+        self.symbol = symbol
+        self._data = data
+
+    def __len__(self) -> int:
+        return self._data.shape[1]
+
+    @property
+    def dates(self) -> np.ndarray:
+        """거래일 (datetime64[D])"""
+        return self._data[0].astype(np.int64).astype("datetime64[D]")
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._data[1]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._data[2]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._data[3]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._data[4]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._data[5]
+
+
+class HistoryStore:
+    """종목별 일봉을 파일 하나씩 컬럼형으로 저장하는 히스토리 저장소"""
+
+    def __init__(self, root: Optional[Path]):
+        """
+        HistoryStore 초기화
+
+        Args:
+            root: 저장 디렉토리 (None이면 저장소 비활성화)
+        """
+        self.root = Path(root) if root else None
+        self._lock = threading.Lock()
+
+        if self.root is not None:
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"히스토리 저장소 초기화 실패 ({self.root}): {e}. 저장소를 비활성화합니다.")
+                self.root = None
+
+    @property
+    def enabled(self) -> bool:
+        """저장소 사용 가능 여부"""
+        return self.root is not None
+
+    def _path(self, symbol: str) -> Path:
+        """종목별 파일 경로 (파일명에 쓸 수 없는 문자는 '_'로 치환)"""
+        return self.root / f"{re.sub(r'[^A-Z0-9.=-]', '_', symbol.upper())}.npy"
+
+    def _load(self, symbol: str) -> Optional[np.ndarray]:
+        """저장된 배열을 읽기 전용 메모리 맵으로 열기"""
+        if not self.enabled:
+            return None
+        path = self._path(symbol)
+        if not path.exists():
+            return None
+        try:
+            return np.load(path, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            logger.warning(f"히스토리 파일 읽기 실패 ({path}): {e}")
+            return None
+
+    def last_date(self, symbol: str) -> Optional[np.datetime64]:
+        """
+        저장된 마지막 거래일 조회
+
+        Args:
+            symbol: 종목 심볼
+
+        Returns:
+            마지막 거래일 (저장된 봉이 없으면 None)
+        """
+        data = self._load(symbol)
+        if data is None or data.shape[1] == 0:
+            return None
+        return np.datetime64(int(data[0, -1]), "D")
+
+    def read(self, symbol: str, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> Optional[PriceHistory]:
+        """
+        기간별 일봉 조회
+
+        Args:
+            symbol: 종목 심볼
+            start: 시작일 (포함, None이면 처음부터)
+            end: 종료일 (포함, None이면 끝까지)
+
+        Returns:
+            PriceHistory (저장된 데이터가 없으면 None)
+        """
+        data = self._load(symbol)
+        if data is None:
+            return None
+
+        days = data[0]
+        lo = int(np.searchsorted(days, _to_day(start), side="left")) if start is not None else 0
+        hi = int(np.searchsorted(days, _to_day(end), side="right")) if end is not None else days.shape[0]
+        return PriceHistory(symbol.upper(), data[:, lo:hi])
+
+    def append(self, symbol: str, bars: Dict[str, np.ndarray]) -> int:
+        """
+        일봉 추가 (새 봉의 첫 거래일 이후로 저장된 봉은 새 값으로 교체)
+
+        장중에 저장된 마지막 봉이 다음 실행 때 확정값으로 덮어써지도록
+        겹치는 구간은 새 데이터를 우선합니다.
+
+        Args:
+            symbol: 종목 심볼
+            bars: {"date": datetime64[D] 배열, "open": ..., "volume": ...} 딕셔너리
+
+        Returns:
+            저장 후 늘어난 봉 개수
+        """
+        if not self.enabled:
+            return 0
+
+        days = np.asarray(bars["date"], dtype="datetime64[D]").astype(np.int64).astype(np.float64)
+        if days.size == 0:
+            return 0
+
+        new = np.empty((len(HISTORY_COLUMNS), days.size), dtype=np.float64)
+        new[0] = days
+        for row, column in enumerate(PRICE_COLUMNS, start=1):
+            new[row] = np.asarray(bars[column], dtype=np.float64)
+        order = np.argsort(new[0], kind="stable")
+        new = new[:, order]
+        # 같은 거래일이 중복되면 마지막 값만 유지
+        new = new[:, np.append(new[0, 1:] != new[0, :-1], True)]
+
+        path = self._path(symbol)
+        with self._lock:
+            current = self._load(symbol)
+            previous = 0
+            if current is not None:
+                previous = current.shape[1]
+                keep = int(np.searchsorted(current[0], new[0, 0], side="left"))
+                new = np.concatenate([np.asarray(current[:, :keep]), new], axis=1)
+                del current
+
+            # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 절반만 쓰인 파일을 보지 않도록 함
+            tmp_path = path.with_suffix(".tmp.npy")
+            try:
+                np.save(tmp_path, np.ascontiguousarray(new))
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"히스토리 파일 저장 실패 ({path}): {e}")
+                return 0
+
+        return new.shape[1] - previous
+
+    def symbols(self) -> List[str]:
+        """저장된 종목 목록"""
+        if not self.enabled:
+            return []
+        return sorted(p.stem for p in self.root.glob("*.npy") if not p.stem.endswith(".tmp"))
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 현황"""
+        symbols = self.symbols()
+        return {
+            "enabled": self.enabled,
+            "path": str(self.root) if self.root else None,
+            "symbols": len(symbols),
+            "bytes": sum(self._path(s).stat().st_size for s in symbols) if symbols else 0,
+        }
@@ -0,0 +1,129 @@
+"""
+공유 HTTP 세션
+업스트림 호출에 재사용할 keep-alive 커넥션 풀 세션 생성
+"""
+
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .rate_limiter import RateLimiter
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# Yahoo Finance가 브라우저 요청으로 인식하도록 하는 기본 헤더
+DEFAULT_HEADERS: Dict[str, str] = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+}
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    요청에 timeout이 지정되지 않으면 기본 timeout을 적용하는 어댑터
+
+    rate_limiter가 있으면 보내는 요청마다 토큰을 하나씩 획득합니다
+    (Ticker 초기화의 쿠키/crumb 요청, 종목별 quoteSummary 요청 등 호출 한 번에 여러 요청이 나가는 경우 포함).
+    """
+
+    def __init__(self, *args: Any, timeout: float = 5.0, rate_limiter: Optional[RateLimiter] = None, **kwargs: Any):
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire_blocking()
+        return super().send(request, **kwargs)
+
+
+def to_replay_url(replay_url: str, url: str) -> str:
+    """
+    업스트림 URL을 로컬 재생 서버 URL로 변환
+
+    https://query2.finance.yahoo.com/v1/x?a=1 → {replay_url}/query2.finance.yahoo.com/v1/x?a=1
+
+    Args:
+        replay_url: 재생 서버 주소 (예: "http://127.0.0.1:8765")
+        url: 원래 요청 URL
+    """
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{replay_url.rstrip('/')}/{parts.netloc}{parts.path}{query}"
+
+
+class ReplayHTTPAdapter(TimeoutHTTPAdapter):
+    """모든 요청을 로컬 재생 서버로 보내는 어댑터 (원래 호스트는 경로 첫 부분에 포함)"""
+
+    def __init__(self, *args: Any, replay_url: str, **kwargs: Any):
+        self.replay_url = replay_url
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if not request.url.startswith(self.replay_url):
+            request.url = to_replay_url(self.replay_url, request.url)
+        return super().send(request, **kwargs)
+
+
+def create_pooled_session(
+    pool_size: int = 10,
+    timeout: float = 5.0,
+    retries: int = 2,
+    replay_url: Optional[str] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    replay_retries: int = 0
+) -> requests.Session:
+    """
+    keep-alive 커넥션 풀을 사용하는 requests 세션 생성
+
+    Args:
+        pool_size: 호스트당 유지할 최대 커넥션 수 (동시 요청 수 이상으로 설정)
+        timeout: 기본 요청 timeout (초)
+        retries: 5xx 응답 재시도 횟수
+        replay_url: 로컬 재생 서버 주소 (지정 시 실제 업스트림 대신 재생 서버로 요청, 부하 테스트용)
+        rate_limiter: HTTP 요청마다 토큰을 획득할 속도 제한기 (None이면 제한 없음)
+        replay_retries: 재생 모드의 재시도 횟수 (retries 대신 사용, 기본 0이라 주입한 오류율이 그대로 관측됨)
+
+    Returns:
+        모든 업스트림 호출에서 공유할 세션
+    """
+    session = requests.Session()
+    if replay_url:
+        retries = replay_retries
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.3,
+        # 429는 재시도하면 속도 제한을 더 악화시키므로 제외 (호출자가 오류로 처리)
+        status_forcelist=[500, 502, 503, 504],
+    )
+    adapter_kwargs = dict(
+        timeout=timeout,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        # 재시도 0회면 Retry 없이 (5xx도 RetryError 대신 응답 그대로 반환)
+        max_retries=retry if retries > 0 else 0,
+        rate_limiter=rate_limiter,
+    )
+    adapter = (
+        ReplayHTTPAdapter(replay_url=replay_url.rstrip("/"), **adapter_kwargs)
+        if replay_url else TimeoutHTTPAdapter(**adapter_kwargs)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    logger.info(f"공유 HTTP 세션 생성 (pool: {pool_size}, timeout: {timeout}s, retries: {retries})")
+    if replay_url:
+        logger.warning(f"업스트림 재생 모드: 모든 요청을 {replay_url} 로 보냅니다.")
+    return session
@@ -0,0 +1,185 @@
+"""
+기술적 지표 계산
+이동평균 / RSI / ATR / 변동성 / 거래량 z-score를 여러 종목에 대해 배열 단위로 계산
+"""
+
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .history_store import PriceHistory
+
+# 이동평균 기간 / 지표 기본 기간
+MA_WINDOWS = (20, 50, 200)
+RSI_PERIOD = 14
+ATR_PERIOD = 14
+VOLATILITY_WINDOW = 20
+VOLUME_WINDOW = 20
+
+# 연율화에 사용하는 연간 거래일 수
+TRADING_DAYS = 252
+
+
+def stack(series: Sequence[np.ndarray], length: Optional[int] = None) -> np.ndarray:
+    """
+    길이가 다른 종목별 배열을 (종목 수, 길이) 행렬로 정렬 (마지막 봉 기준 오른쪽 정렬)
+
+    Args:
+        series: 종목별 1차원 배열 목록
+        length: 행렬 길이 (None이면 가장 긴 배열 길이, 짧으면 앞부분을 잘라냄)
+
+    Returns:
+        앞쪽 빈 구간이 NaN으로 채워진 2차원 배열
+    """
+    if length is None:
+        length = max((len(s) for s in series), default=0)
+    matrix = np.full((len(series), length), np.nan)
+    for row, values in enumerate(series):
+        values = np.asarray(values, dtype=np.float64)[-length:] if length else values[:0]
+        if values.size:
+            matrix[row, length - values.size:] = values
+    return matrix
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    마지막 축 기준 이동 합계 (누적합 차분, O(n))
+
+    창 안에 NaN이 하나라도 있으면 결과는 NaN입니다.
+    """
+    valid = ~np.isnan(values)
+    pad = np.zeros(values.shape[:-1] + (1,))
+    sums = np.concatenate([pad, np.cumsum(np.where(valid, values, 0.0), axis=-1)], axis=-1)
+    counts = np.concatenate([pad, np.cumsum(valid, axis=-1)], axis=-1)
+
+    out = np.full(values.shape, np.nan)
+    if window > values.shape[-1]:
+        return out
+    window_sums = sums[..., window:] - sums[..., :-window]
+    window_counts = counts[..., window:] - counts[..., :-window]
+    out[..., window - 1:] = np.where(window_counts == window, window_sums, np.nan)
+    return out
+
+
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    """단순 이동평균 (앞쪽 window-1개 봉은 NaN)"""
+    return _rolling_sum(np.asarray(values, dtype=np.float64), window) / window
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    이동 표준편차 (표본 표준편차, 앞쪽 window-1개 봉은 NaN)
+
+    합계/제곱합의 이동 합계로 계산하며, 정밀도 손실을 줄이기 위해
+    종목별 평균을 뺀 값을 사용합니다. (분산은 평행 이동에 불변)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if np.isnan(values).all():
+        return np.full(values.shape, np.nan)
+    with np.errstate(invalid="ignore"):
+        centered = values - np.nanmean(values, axis=-1, keepdims=True)
+    sums = _rolling_sum(centered, window)
+    squares = _rolling_sum(centered * centered, window)
+    variance = (squares - sums * sums / window) / (window - 1)
+    return np.sqrt(np.clip(variance, 0.0, None))
+
+
+def _shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """마지막 축 기준으로 periods 봉만큼 뒤로 민 배열 (앞쪽은 NaN)"""
+    out = np.full(values.shape, np.nan)
+    out[..., periods:] = values[..., :-periods]
+    return out
+
+
+def rsi(close: np.ndarray, period: int = RSI_PERIOD) -> np.ndarray:
+    """
+    RSI (상승폭/하락폭의 단순 이동평균을 사용하는 Cutler 방식)
+
+    Wilder 평활은 봉마다 이전 값에 의존해 반복문이 필요하므로,
+    전체 배열을 한 번에 계산할 수 있는 단순 이동평균 방식을 사용합니다.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    change = close - _shift(close)
+    gain = sma(np.clip(change, 0.0, None), period)
+    loss = sma(np.clip(-change, 0.0, None), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = 100.0 - 100.0 / (1.0 + gain / loss)
+    # 하락이 없는 구간은 100, 변동이 없는 구간은 50
+    value = np.where((loss == 0) & (gain > 0), 100.0, value)
+    return np.where((loss == 0) & (gain == 0), 50.0, value)
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = ATR_PERIOD) -> np.ndarray:
+    """ATR (True Range의 단순 이동평균)"""
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    prev_close = _shift(np.asarray(close, dtype=np.float64))
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return sma(true_range, period)
+
+
+def volatility(close: np.ndarray, window: int = VOLATILITY_WINDOW) -> np.ndarray:
+    """연율화 변동성 (일간 로그 수익률의 이동 표준편차 × √252)"""
+    close = np.asarray(close, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.log(close / _shift(close))
+    return rolling_std(returns, window) * np.sqrt(TRADING_DAYS)
+
+
+def volume_zscore(volume: np.ndarray, window: int = VOLUME_WINDOW) -> np.ndarray:
+    """거래량 z-score (직전 window개 봉의 평균/표준편차 대비 당일 거래량)"""
+    volume = np.asarray(volume, dtype=np.float64)
+    mean = _shift(sma(volume, window))
+    std = _shift(rolling_std(volume, window))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 0, (volume - mean) / std, np.nan)
+
+
+def _value(matrix: np.ndarray, row: int) -> Optional[float]:
+    """마지막 봉의 지표 값 (NaN은 None)"""
+    value = matrix[row, -1]
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def compute_indicators(histories: Mapping[str, PriceHistory]) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 종목의 최신 기술적 지표를 한 번에 계산
+
+    종목별 히스토리를 (종목 수, 봉 개수) 행렬로 쌓아 지표마다 배열 연산 한 번으로
+    전체 종목을 계산합니다. 필요한 봉이 부족한 지표는 None입니다.
+
+    Args:
+        histories: {티커: PriceHistory} 딕셔너리
+
+    Returns:
+        {티커: {"as_of", "bars", "close", "ma_20", ..., "volume_zscore"}} 딕셔너리
+    """
+    symbols = [symbol for symbol, history in histories.items() if history is not None and len(history)]
+    if not symbols:
+        return {}
+
+    items = [histories[symbol] for symbol in symbols]
+    # 가장 긴 지표 계산에 필요한 만큼만 사용 (200일 이동평균)
+    length = min(max(len(h) for h in items), max(MA_WINDOWS))
+    close = stack([h.close for h in items], length)
+    high = stack([h.high for h in items], length)
+    low = stack([h.low for h in items], length)
+    volume = stack([h.volume for h in items], length)
+
+    computed = {f"ma_{window}": sma(close, window) for window in MA_WINDOWS}
+    computed["rsi_14"] = rsi(close, RSI_PERIOD)
+    computed["atr_14"] = atr(high, low, close, ATR_PERIOD)
+    computed["volatility_20"] = volatility(close, VOLATILITY_WINDOW)
+    computed["volume_zscore"] = volume_zscore(volume, VOLUME_WINDOW)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for row, (symbol, history) in enumerate(zip(symbols, items)):
+        result = {
+            "as_of": str(history.dates[-1]),
+            "bars": len(history),
+            "close": _value(close, row),
+        }
+        for name, matrix in computed.items():
+            result[name] = _value(matrix, row)
+        results[symbol] = result
+    return results
@@ -134,6 +134,9 @@ class InstagramService:
             caption = f"📈 {current_date} 주식 브리핑\n\n"
             
             for screener_type, stocks in stocks_data.items():
+                if isinstance(stocks, dict):
+                    # 스크리너 결과 형식 ({..., "stocks": [상위 N개 종목]})
+                    stocks = stocks.get("stocks", [])
                 if not stocks:
                     continue
                 
@@ -147,7 +150,7 @@ class InstagramService:
                     caption += f"{screener_type}\n"
                 
                 for i, stock in enumerate(stocks[:3], 1):
-                    ticker = stock.get('symbol', 'N/A')
+                    ticker = stock.get('symbol', stock.get('ticker', 'N/A'))
                     price = stock.get('price', 'N/A')
                     change = stock.get('change_percent', '0')
                     caption += f"{i}. {ticker} ${price} {change:+.2f}%\n"
@@ -0,0 +1,221 @@
+"""
+시장 스냅샷
+종목 유니버스의 시세를 컬럼별 NumPy 배열로 보관하고 불리언 마스크로 조건 검색,
+거래량/변동률 순위는 생성 시 미리 정렬해 두고 상위 k개를 인덱스로 바로 읽음
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import time
+
+import numpy as np
+
+# 숫자 컬럼 (값이 없으면 NaN)
+NUMERIC_COLUMNS = ("price", "change_percent", "volume", "avg_volume", "market_cap", "pe_ratio", "volume_ratio")
+
+# 범위 조건 키 → (컬럼, 비교 방향)
+RANGE_CRITERIA: Dict[str, Tuple[str, str]] = {
+    "min_price": ("price", "min"),
+    "max_price": ("price", "max"),
+    "min_change_percent": ("change_percent", "min"),
+    "max_change_percent": ("change_percent", "max"),
+    "min_volume": ("volume", "min"),
+    "max_volume": ("volume", "max"),
+    "min_volume_ratio": ("volume_ratio", "min"),
+    "max_volume_ratio": ("volume_ratio", "max"),
+    "min_market_cap": ("market_cap", "min"),
+    "max_market_cap": ("market_cap", "max"),
+    "min_pe_ratio": ("pe_ratio", "min"),
+    "max_pe_ratio": ("pe_ratio", "max"),
+}
+
+# 거래량 급증으로 판단하는 거래량 비율 (당일 / 3개월 평균)
+UNUSUAL_VOLUME_RATIO = 2.0
+
+# 순위 이름 → (정렬 컬럼, 내림차순 여부, 포함 조건)
+RANKINGS: Dict[str, Tuple[str, bool, Callable[[Dict[str, np.ndarray]], np.ndarray]]] = {
+    "most_actives": ("volume", True, lambda c: c["volume"] > 0),
+    "day_gainers": ("change_percent", True, lambda c: c["change_percent"] > 0),
+    "day_losers": ("change_percent", False, lambda c: c["change_percent"] < 0),
+    "unusual_volume": ("volume_ratio", True, lambda c: c["volume_ratio"] >= UNUSUAL_VOLUME_RATIO),
+}
+
+# 정렬 가능한 컬럼 / 결과 개수 제한
+SORTABLE_COLUMNS = NUMERIC_COLUMNS
+DEFAULT_SCREEN_LIMIT = 50
+MAX_SCREEN_LIMIT = 500
+
+
+class MarketSnapshot:
+    """종목 유니버스의 시세 스냅샷 (컬럼별 배열 구조, 생성 후 변경하지 않음)"""
+
+    def __init__(
+        self,
+        stocks: Sequence[Dict[str, Any]],
+        columns: Dict[str, Sequence[Optional[float]]],
+        created_at: Optional[float] = None,
+        quotes: Optional[Sequence[Dict[str, Any]]] = None
+    ):
+        """
+        MarketSnapshot 초기화
+
+        Args:
+            stocks: 종목 정보 목록 (응답용, 배열과 같은 순서)
+            columns: {"price", "change_percent", "volume", "avg_volume", "market_cap", "pe_ratio"} 값 목록
+            created_at: 생성 시각 (time.time(), None이면 현재 시각)
+            quotes: 원본 스크리너 quote 목록 (배열과 같은 순서, 선택)
+        """
+        self.stocks = list(stocks)
+        self.quotes = list(quotes) if quotes is not None else [{} for _ in self.stocks]
+        self.created_at = time.time() if created_at is None else created_at
+        size = len(self.stocks)
+
+        self.columns: Dict[str, np.ndarray] = {}
+        for column in NUMERIC_COLUMNS:
+            if column == "volume_ratio":
+                continue
+            values = columns.get(column)
+            self.columns[column] = (
+                np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+                if values is not None else np.full(size, np.nan)
+            )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_volume = self.columns["avg_volume"]
+            self.columns["volume_ratio"] = np.where(avg_volume > 0, self.columns["volume"] / avg_volume, np.nan)
+
+        # 섹터는 정수 코드 배열 + 코드표로 보관
+        self.sector_names: List[str] = []
+        sector_index: Dict[str, int] = {}
+        codes = np.empty(size, dtype=np.int32)
+        for i, stock in enumerate(self.stocks):
+            sector = str(stock.get("sector") or "N/A")
+            code = sector_index.get(sector.lower())
+            if code is None:
+                code = sector_index[sector.lower()] = len(self.sector_names)
+                self.sector_names.append(sector)
+            codes[i] = code
+        self.sector_codes = codes
+        self._sector_index = sector_index
+
+        # 순위별 정렬 인덱스를 미리 계산 (조회 시에는 앞에서 k개만 읽음)
+        with np.errstate(invalid="ignore"):
+            self.rankings: Dict[str, np.ndarray] = {
+                name: self._order(np.flatnonzero(include(self.columns)), column, descending)
+                for name, (column, descending, include) in RANKINGS.items()
+            }
+
+    @classmethod
+    def empty(cls) -> "MarketSnapshot":
+        """빈 스냅샷 (생성 시각 0 → 항상 만료)"""
+        return cls([], {}, created_at=0.0)
+
+    def __len__(self) -> int:
+        return len(self.stocks)
+
+    @property
+    def age(self) -> float:
+        """생성 후 경과 시간 (초)"""
+        return time.time() - self.created_at
+
+    def screen(self, criteria: Dict[str, Any]) -> np.ndarray:
+        """
+        조건에 맞는 종목 인덱스 조회
+
+        Args:
+            criteria: 범위 조건(RANGE_CRITERIA 키), "sectors"(섹터 목록),
+                "sort_by"(정렬 컬럼, 기본 volume), "descending"(기본 True),
+                "limit"(기본 DEFAULT_SCREEN_LIMIT)
+
+        Returns:
+            정렬된 종목 인덱스 배열
+
+        Raises:
+            ValueError: 알 수 없는 조건 키 또는 잘못된 값
+        """
+        criteria = {key: value for key, value in (criteria or {}).items() if value is not None}
+        unknown = set(criteria) - set(RANGE_CRITERIA) - {"sectors", "sort_by", "descending", "limit"}
+        if unknown:
+            raise ValueError(f"알 수 없는 스크리닝 조건: {sorted(unknown)}")
+
+        mask = np.ones(len(self), dtype=bool)
+        for key, (column, direction) in RANGE_CRITERIA.items():
+            if key not in criteria:
+                continue
+            bound = float(criteria[key])
+            values = self.columns[column]
+            # NaN 비교는 False이므로 값이 없는 종목은 자연히 제외
+            mask &= values >= bound if direction == "min" else values <= bound
+
+        sectors = criteria.get("sectors")
+        if sectors:
+            if isinstance(sectors, str):
+                sectors = [sectors]
+            codes = [self._sector_index[s.lower()] for s in sectors if s.lower() in self._sector_index]
+            mask &= np.isin(self.sector_codes, codes)
+
+        sort_by = criteria.get("sort_by", "volume")
+        if sort_by not in SORTABLE_COLUMNS:
+            raise ValueError(f"정렬할 수 없는 컬럼: {sort_by}. 허용값: {list(SORTABLE_COLUMNS)}")
+        limit = int(criteria.get("limit", DEFAULT_SCREEN_LIMIT))
+        if limit < 1 or limit > MAX_SCREEN_LIMIT:
+            raise ValueError(f"유효하지 않은 limit: {limit}. 허용 범위: 1~{MAX_SCREEN_LIMIT}")
+
+        return self._order(np.flatnonzero(mask), sort_by, criteria.get("descending", True))[:limit]
+
+    def _order(self, indices: np.ndarray, column: str, descending: bool) -> np.ndarray:
+        """인덱스를 컬럼 값 기준으로 정렬 (NaN은 정렬 방향과 관계없이 마지막)"""
+        keys = self.columns[column][indices]
+        if descending:
+            keys = -keys
+        order = np.argsort(np.where(np.isnan(keys), np.inf, keys), kind="stable")
+        return indices[order]
+
+    def top(self, ranking: str, count: int) -> np.ndarray:
+        """
+        순위 상위 종목 인덱스 (미리 정렬된 인덱스의 앞부분, O(k))
+
+        Args:
+            ranking: RANKINGS 키 (예: "day_gainers")
+            count: 조회할 종목 수
+
+        Returns:
+            종목 인덱스 배열
+
+        Raises:
+            ValueError: 알 수 없는 순위 이름
+        """
+        if ranking not in self.rankings:
+            raise ValueError(f"알 수 없는 순위: {ranking}. 허용값: {list(self.rankings)}")
+        return self.rankings[ranking][:max(count, 0)]
+
+    def top_quotes(self, ranking: str, count: int) -> List[Dict[str, Any]]:
+        """순위 상위 종목의 원본 스크리너 quote 목록"""
+        return [self.quotes[i] for i in self.top(ranking, count)]
+
+    def rows(self, indices: Sequence[int]) -> List[Dict[str, Any]]:
+        """
+        인덱스에 해당하는 종목 정보 목록
+
+        Args:
+            indices: 종목 인덱스
+
+        Returns:
+            종목 정보 딕셔너리 목록 (거래량 비율 포함)
+        """
+        volume_ratio = self.columns["volume_ratio"]
+        results = []
+        for i in indices:
+            ratio = volume_ratio[i]
+            results.append({
+                **self.stocks[i],
+                "volume_ratio": None if np.isnan(ratio) else round(float(ratio), 2),
+            })
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """스냅샷 크기 및 생성 시각"""
+        return {
+            "size": len(self),
+            "sectors": len(self.sector_names),
+            "created_at": self.created_at,
+            "age_seconds": round(self.age, 1) if self.created_at else None,
+        }
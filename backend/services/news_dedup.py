@@ -0,0 +1,198 @@
+"""
+뉴스 중복 제거
+URL 정규화(추적 파라미터/AMP 제거)와 SimHash로 여러 매체에 배포된 같은 기사를 하나로 묶음
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+from itertools import combinations
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import hashlib
+import re
+
+import numpy as np
+
+# 제거할 추적용 쿼리 파라미터 (접두어 또는 전체 이름)
+TRACKING_PARAM_PREFIXES = ("utm_", "mc_", "pk_", "hsa_")
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "ocid", "cmpid", "ref", "ref_src",
+    "guccounter", "guce_referrer", "guce_referrer_sig", "smid", "smtyp", "outputtype", "amp",
+    "__twitter_impression", "mbid", "sr_share",
+})
+
+# SimHash 비트 수 / 같은 기사로 보는 최대 해밍 거리
+# 제목처럼 짧은 글은 한두 단어만 달라도 7~9비트가 바뀌고, 다른 기사는 보통 20비트 이상 차이남
+SIMHASH_BITS = 64
+MAX_HAMMING_DISTANCE = 9
+
+# 후보 탐색용 밴드 수 / 버킷당 최대 후보 수
+# 거리 d 이하인 두 해시는 B개 밴드 중 적어도 하나가 d // B비트 이내로만 다르므로, 밴드 값과
+# 그 거리 이내의 키만 찾아보면 놓치지 않음 (5개 밴드: 12~13비트 키 + 1비트 다른 키, 조회당 69개 키)
+# 버킷 크기를 제한해 조회당 비교 횟수가 기사 수와 무관하게 69 × SIMHASH_BUCKET_SIZE 이하
+SIMHASH_BANDS = 5
+SIMHASH_BUCKET_SIZE = 8
+
+# 요약이 이보다 짧으면 요약 비교는 생략 (제목만 비교)
+MIN_SUMMARY_WORDS = 8
+
+_BAND_BITS = -(-SIMHASH_BITS // SIMHASH_BANDS)
+_PROBE_RADIUS = MAX_HAMMING_DISTANCE // SIMHASH_BANDS
+
+
+def _band(band: int) -> Tuple[int, int, List[int]]:
+    """(시프트, 마스크, 탐색할 XOR 마스크 목록), 마지막 밴드가 남은 비트를 가짐"""
+    shift = band * _BAND_BITS
+    bits = min(_BAND_BITS, SIMHASH_BITS - shift)
+    probes = [0] + [
+        sum(1 << bit for bit in flipped)
+        for radius in range(1, _PROBE_RADIUS + 1)
+        for flipped in combinations(range(bits), radius)
+    ]
+    return shift, (1 << bits) - 1, probes
+
+
+_BANDS = [_band(band) for band in range(SIMHASH_BANDS)]
+_WORD = re.compile(r"\w+")
+
+
+def canonical_url(url: str) -> str:
+    """
+    비교용 정규 URL
+
+    스킴/호스트 소문자화, www./m./amp. 서브도메인과 /amp 경로 제거,
+    추적 파라미터와 fragment 제거, 남은 쿼리 파라미터 정렬, 끝 슬래시 제거
+
+    Args:
+        url: 원본 기사 URL
+
+    Returns:
+        정규화된 URL (해석할 수 없으면 원본)
+    """
+    if not isinstance(url, str) or not url.strip():
+        return url
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url
+
+    host = parts.netloc.lower()
+    for prefix in ("www.", "m.", "amp."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+
+    path = re.sub(r"/amp(?:/|\.html)?$|\.amp(?=\.html$|$)", "", parts.path) or "/"
+    if path.startswith("/amp/"):
+        path = path[len("/amp"):]
+    path = path.rstrip("/") or "/"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def _features(text: str) -> List[str]:
+    """SimHash 입력 특징 (소문자 단어와 인접 단어쌍)"""
+    words = _WORD.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def simhash(text: str) -> int:
+    """
+    64비트 SimHash (비슷한 글일수록 해밍 거리가 가까움)
+
+    Args:
+        text: 제목 + 요약 등 비교할 텍스트
+
+    Returns:
+        64비트 정수 (특징이 없으면 0)
+    """
+    features = _features(text)
+    if not features:
+        return 0
+    digests = b"".join(hashlib.blake2b(feature.encode(), digest_size=SIMHASH_BITS // 8).digest() for feature in features)
+    # 특징 해시를 비트 행렬로 펼쳐 비트별로 1인 특징 수가 절반을 넘으면 1 (상위 비트부터)
+    ones = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(len(features), SIMHASH_BITS).sum(axis=0)
+    return int("".join("1" if count * 2 > len(features) else "0" for count in ones.tolist()), 2)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 해시의 해밍 거리"""
+    return bin(a ^ b).count("1")
+
+
+class _SimHashIndex:
+    """
+    밴드별 버킷으로 가까운 SimHash를 찾는 색인
+
+    조회는 밴드마다 정해진 수의 키만 찾고 버킷마다 최대 SIMHASH_BUCKET_SIZE개만 비교하므로
+    비교 횟수에 상한이 있습니다. 버킷이 가득 차면 새 해시는 그 버킷에만 추가되지 않습니다
+    (다른 밴드로는 여전히 찾을 수 있음).
+    """
+
+    def __init__(self):
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in _BANDS]
+
+    def contains_near(self, fingerprint: int) -> bool:
+        """해밍 거리 MAX_HAMMING_DISTANCE 이내의 해시가 있는지 여부"""
+        for bucket, (shift, mask, probes) in zip(self._buckets, _BANDS):
+            key = (fingerprint >> shift) & mask
+            for probe in probes:
+                for other in bucket.get(key ^ probe, ()):
+                    if hamming_distance(fingerprint, other) <= MAX_HAMMING_DISTANCE:
+                        return True
+        return False
+
+    def add(self, fingerprint: int) -> None:
+        for bucket, (shift, mask, _) in zip(self._buckets, _BANDS):
+            candidates = bucket.setdefault((fingerprint >> shift) & mask, [])
+            if len(candidates) < SIMHASH_BUCKET_SIZE:
+                candidates.append(fingerprint)
+
+
+def _summary_text(article: Dict[str, Any]) -> str:
+    """요약 비교에 사용할 텍스트 (앞부분 300자, 너무 짧으면 빈 문자열)"""
+    summary = article.get("summary")
+    if not isinstance(summary, str) or summary == "N/A":
+        return ""
+    summary = summary[:300]
+    return summary if len(_WORD.findall(summary.lower())) >= MIN_SUMMARY_WORDS else ""
+
+
+def dedupe_articles(articles: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    같은 URL(정규화 기준)이거나 제목 또는 요약의 SimHash가 가까운 기사를 제거 (먼저 나온 기사 유지)
+
+    밴드별 해시 버킷으로 정해진 수 이하의 후보만 비교하므로 기사 수에 대해 선형 시간입니다.
+
+    Args:
+        articles: {"title", "url", "summary", ...} 목록 (우선순위 순, 예: 최신순)
+
+    Returns:
+        중복이 제거된 기사 목록 (순서 유지)
+    """
+    seen_urls = set()
+    titles = _SimHashIndex()
+    summaries = _SimHashIndex()
+    kept: List[Dict[str, Any]] = []
+    for article in articles:
+        url = canonical_url(article.get("url") or "")
+        if url and url in seen_urls:
+            continue
+
+        title_hash = simhash(str(article.get("title") or ""))
+        summary_hash = simhash(_summary_text(article))
+        if (title_hash and titles.contains_near(title_hash)) or (summary_hash and summaries.contains_near(summary_hash)):
+            continue
+
+        if url:
+            seen_urls.add(url)
+        if title_hash:
+            titles.add(title_hash)
+        if summary_hash:
+            summaries.add(summary_hash)
+        kept.append(article)
+    return kept
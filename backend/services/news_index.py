@@ -0,0 +1,292 @@
+"""
+로컬 뉴스 전문 검색 색인
+NewsService가 수집한 기사를 SQLite FTS5 색인에 누적하고 BM25 순위로 검색 (업스트림 호출 없음)
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+import logging
+import re
+import sqlite3
+import threading
+import time
+
+from .news_dedup import canonical_url
+from .news_store import normalize_published
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 기본 저장 경로 (backend/output/cache/news_index.db)
+DEFAULT_NEWS_INDEX_PATH = Path(__file__).parent.parent / "output" / "cache" / "news_index.db"
+
+# BM25 열 가중치 (제목 일치를 요약 일치보다 우선)
+TITLE_WEIGHT = 4.0
+SUMMARY_WEIGHT = 1.0
+
+_TERM = re.compile(r"\w+")
+
+
+def _match_query(query: str) -> Optional[str]:
+    """
+    사용자 검색어를 FTS5 MATCH 식으로 변환 (모든 단어 포함, FTS 문법 문자는 무시)
+
+    Returns:
+        MATCH 식 (검색할 단어가 없으면 None)
+    """
+    terms = _TERM.findall(query or "")
+    if not terms:
+        return None
+    return " ".join(f'"{term}"' for term in terms)
+
+
+class NewsIndex:
+    """수집한 뉴스 기사의 SQLite FTS5 전문 검색 색인"""
+
+    def __init__(self, path: Optional[Path]):
+        """
+        NewsIndex 초기화
+
+        Args:
+            path: SQLite 파일 경로 (None이면 색인 비활성화)
+        """
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._searches = 0
+        self._total_search_ms = 0.0
+
+        if self.path is not None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self._connect() as conn:
+                    # 정규화 URL 기준으로 한 번만 저장 (published_at: 정렬/필터용 UTC ISO, 없으면 수집 시각)
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS articles (
+                            id INTEGER PRIMARY KEY,
+                            canonical_url TEXT NOT NULL UNIQUE,
+                            url TEXT NOT NULL,
+                            title TEXT NOT NULL,
+                            summary TEXT NOT NULL,
+                            published_date TEXT NOT NULL,
+                            published_at TEXT NOT NULL,
+                            indexed_at REAL NOT NULL
+                        )
+                        """
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS articles_published_at ON articles (published_at)"
+                    )
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS article_tickers (
+                            ticker TEXT NOT NULL,
+                            article_id INTEGER NOT NULL,
+                            PRIMARY KEY (ticker, article_id)
+                        ) WITHOUT ROWID
+                        """
+                    )
+                    # articles 테이블을 원본으로 하는 외부 콘텐츠 FTS 색인 (트리거로 동기화)
+                    conn.execute(
+                        """
+                        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                            title, summary, content='articles', content_rowid='id', tokenize='porter unicode61'
+                        )
+                        """
+                    )
+                    conn.execute(
+                        """
+                        CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+                            INSERT INTO articles_fts (rowid, title, summary) VALUES (new.id, new.title, new.summary);
+                        END
+                        """
+                    )
+                    conn.execute(
+                        """
+                        CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+                            INSERT INTO articles_fts (articles_fts, rowid, title, summary)
+                            VALUES ('delete', old.id, old.title, old.summary);
+                        END
+                        """
+                    )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"뉴스 색인 초기화 실패 ({self.path}): {e}. 색인을 비활성화합니다.")
+                self.path = None
+
+    @property
+    def enabled(self) -> bool:
+        """색인 사용 가능 여부"""
+        return self.path is not None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """호출마다 새 연결 사용 (업스트림 워커 스레드에서도 안전), 트랜잭션 커밋/롤백 후 연결 닫음"""
+        conn = sqlite3.connect(str(self.path), timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add_articles(self, articles: Iterable[Dict[str, Any]], tickers: Iterable[str] = ()) -> int:
+        """
+        기사를 색인에 추가 (이미 있는 기사는 종목만 추가로 연결)
+
+        Args:
+            articles: {"title", "url", "published_date", "summary", "related_tickers"(선택)} 목록
+            tickers: 모든 기사와 연결할 종목 코드 (기사별 related_tickers와 함께 연결)
+
+        Returns:
+            새로 색인된 기사 수
+        """
+        if not self.enabled:
+            return 0
+        tickers = list(tickers)
+        indexed_at = time.time()
+        fetched_at = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0).isoformat()
+        rows = {}
+        links = set()
+        for article in articles:
+            url = article.get("url")
+            if not isinstance(url, str) or not url.strip():
+                continue
+            key = canonical_url(url)
+            for ticker in [*tickers, *(article.get("related_tickers") or [])]:
+                if isinstance(ticker, str) and ticker.strip():
+                    links.add((ticker.upper().strip(), key))
+            summary = article.get("summary")
+            rows.setdefault(key, (
+                url,
+                str(article.get("title") or ""),
+                summary if isinstance(summary, str) and summary != "N/A" else "",
+                str(article.get("published_date") or "N/A"),
+                normalize_published(article.get("published_date")) or fetched_at,
+            ))
+        if not rows:
+            return 0
+        try:
+            with self._lock, self._connect() as conn:
+                placeholders = ",".join("?" * len(rows))
+                existing = {url for (url,) in conn.execute(
+                    f"SELECT canonical_url FROM articles WHERE canonical_url IN ({placeholders})", list(rows)
+                )}
+                added = [(key, *row, indexed_at) for key, row in rows.items() if key not in existing]
+                conn.executemany(
+                    "INSERT INTO articles "
+                    "(canonical_url, url, title, summary, published_date, published_at, indexed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    added
+                )
+                if links:
+                    ids = dict(conn.execute(
+                        f"SELECT canonical_url, id FROM articles WHERE canonical_url IN ({placeholders})", list(rows)
+                    ))
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO article_tickers (ticker, article_id) VALUES (?, ?)",
+                        [(ticker, ids[key]) for ticker, key in links if key in ids]
+                    )
+            return len(added)
+        except sqlite3.Error as e:
+            logger.warning(f"뉴스 색인 저장 실패: {e}")
+            return 0
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        tickers: Optional[Iterable[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        BM25 순위로 기사 검색
+
+        Args:
+            query: 검색어 (모든 단어를 포함하는 기사, 영어는 어간 일치)
+            limit: 최대 결과 수
+            tickers: 이 종목 중 하나와 연결된 기사만 (None이면 전체)
+            since: 이 시각 이후 발행 기사만 (UTC ISO, 포함)
+            until: 이 시각 이전 발행 기사만 (UTC ISO, 미포함)
+
+        Returns:
+            관련도순 {"title", "url", "published_date", "summary", "tickers", "score"} 목록
+        """
+        match = _match_query(query)
+        if not self.enabled or match is None or limit <= 0:
+            return []
+
+        sql = [
+            "SELECT a.id, a.title, a.url, a.published_date, a.summary, bm25(articles_fts, ?, ?) AS rank",
+            "FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid",
+            "WHERE articles_fts MATCH ?",
+        ]
+        params: List[Any] = [TITLE_WEIGHT, SUMMARY_WEIGHT, match]
+        if since:
+            sql.append("AND a.published_at >= ?")
+            params.append(since)
+        if until:
+            sql.append("AND a.published_at < ?")
+            params.append(until)
+        if tickers is not None:
+            symbols = sorted({t.upper().strip() for t in tickers if isinstance(t, str) and t.strip()})
+            if not symbols:
+                return []
+            sql.append(
+                f"AND a.id IN (SELECT article_id FROM article_tickers WHERE ticker IN ({','.join('?' * len(symbols))}))"
+            )
+            params.extend(symbols)
+        sql.append("ORDER BY rank LIMIT ?")
+        params.append(limit)
+
+        started = time.perf_counter()
+        try:
+            with self._lock, self._connect() as conn:
+                rows = conn.execute(" ".join(sql), params).fetchall()
+                related: Dict[int, List[str]] = {}
+                if rows:
+                    ids = [row[0] for row in rows]
+                    for article_id, ticker in conn.execute(
+                        f"SELECT article_id, ticker FROM article_tickers WHERE article_id IN ({','.join('?' * len(ids))}) "
+                        "ORDER BY ticker",
+                        ids
+                    ):
+                        related.setdefault(article_id, []).append(ticker)
+                self._searches += 1
+                self._total_search_ms += (time.perf_counter() - started) * 1000
+        except sqlite3.Error as e:
+            logger.warning(f"뉴스 색인 검색 실패 ({query}): {e}")
+            return []
+
+        return [
+            {
+                "title": title,
+                "url": url,
+                "published_date": published_date,
+                "summary": summary or "N/A",
+                "tickers": related.get(article_id, []),
+                # bm25()는 관련도가 높을수록 작은 음수
+                "score": round(-rank, 4),
+            }
+            for article_id, title, url, published_date, summary, rank in rows
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """색인 크기 및 검색 통계"""
+        articles = tickers = 0
+        if self.enabled:
+            try:
+                with self._lock, self._connect() as conn:
+                    articles = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+                    tickers = conn.execute("SELECT COUNT(DISTINCT ticker) FROM article_tickers").fetchone()[0]
+            except sqlite3.Error:
+                pass
+        return {
+            "enabled": self.enabled,
+            "path": str(self.path) if self.path else None,
+            "articles": articles,
+            "tickers": tickers,
+            "searches": self._searches,
+            "avg_search_ms": round(self._total_search_ms / self._searches, 2) if self._searches else 0.0,
+        }
@@ -3,15 +3,42 @@
 Exa API를 사용한 뉴스 검색 및 수집
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Hashable, Iterable, Optional, Tuple
 from exa_py import Exa
+from .cache import TTLCache, CACHE_HIT
+from .circuit_breaker import LastKnownGood
+from .config import env_int, env_float
+from .entity_tagger import EntityTagger
+from .http_session import to_replay_url
+from .news_dedup import dedupe_articles
+from .news_index import NewsIndex, DEFAULT_NEWS_INDEX_PATH
+from .news_store import NewsStore, DEFAULT_NEWS_STORE_PATH
+from .search_index import DEFAULT_SEARCH_INDEX_PATH
+from .singleflight import SingleFlight
+from .upstream_executor import get_executor
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 import os
+import threading
+import time
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# Exa API 기본 주소
+EXA_BASE_URL = "https://api.exa.ai"
+
+# 여러 종목 뉴스 동시 조회 시 기본 동시 검색 수 (환경 변수 NEWS_CONCURRENCY 로 변경)
+DEFAULT_NEWS_CONCURRENCY = 8
+
+# 뉴스 검색 기간 (최근 24시간) / 기간 시작 시각을 맞추는 단위 (초, 같은 단위 안의 요청은 같은 캐시 키)
+NEWS_WINDOW = timedelta(days=1)
+DEFAULT_NEWS_WINDOW_BUCKET = 3600
+
+# 중복 기사를 제거해도 요청 개수를 채울 수 있도록 요청 개수의 몇 배까지 가져올지
+NEWS_DEDUP_OVERFETCH = 2
+
 
 class NewsService:
     """뉴스 데이터 관련 비즈니스 로직"""
@@ -20,11 +47,107 @@ class NewsService:
         """NewsService 초기화"""
         # Exa API 키 설정
         api_key = os.getenv("EXA_API_KEY")
-        if not api_key:
+        # 로컬 녹화/재생 서버 사용 시 (부하 테스트용, services/upstream_replay.py 참고)
+        replay_url = os.getenv("UPSTREAM_REPLAY_URL")
+        if replay_url:
+            logger.warning(f"업스트림 재생 모드: Exa 요청을 {replay_url} 로 보냅니다.")
+            self.client = Exa(api_key=api_key or "replay", base_url=to_replay_url(replay_url, EXA_BASE_URL))
+        elif not api_key:
             logger.warning("EXA_API_KEY 환경 변수가 설정되지 않았습니다.")
             self.client = None
         else:
             self.client = Exa(api_key=api_key)
+        # Exa 클라이언트는 동기 HTTP 호출이므로 전용 스레드 풀에서 실행
+        self.executor = get_executor("exa")
+        # 동시에 들어온 동일 검색 요청 병합
+        self.singleflight = SingleFlight("exa")
+        # 여러 종목 뉴스 동시 조회 상한 (서비스 전체 공유)
+        self.news_concurrency = env_int("NEWS_CONCURRENCY", DEFAULT_NEWS_CONCURRENCY, minimum=1)
+        self._news_semaphore = asyncio.Semaphore(self.news_concurrency)
+        # Exa 장애(회로 열림 포함) 시 대신 제공할 마지막 정상 응답
+        self.last_good = LastKnownGood(
+            maxsize=env_int("LAST_GOOD_MAXSIZE", 2048, minimum=1),
+            max_age=env_float("LAST_GOOD_MAX_AGE", 86400.0)
+        )
+        # 검색 결과 캐시 (메모리 LRU + 선택적 SQLite 디스크 계층, 키: 종목/개수/기간 시작 시각)
+        # Exa는 검색 건당 과금되므로 같은 종목 반복 조회는 업스트림 호출 없이 응답
+        news_cache_ttl = env_float("NEWS_CACHE_TTL", 1800.0)
+        self.news_cache = TTLCache(maxsize=env_int("NEWS_CACHE_SIZE", 512, minimum=1), ttl=news_cache_ttl)
+        self.news_store = NewsStore(
+            os.getenv("NEWS_CACHE_PATH", str(DEFAULT_NEWS_STORE_PATH)) or None,
+            ttl=news_cache_ttl
+        )
+        self.news_window_bucket = env_int("NEWS_WINDOW_BUCKET", DEFAULT_NEWS_WINDOW_BUCKET, minimum=1)
+        # 수집한 모든 기사를 누적하는 로컬 전문 검색 색인 (/api/news/search, 기간 제한 없음)
+        self.news_index = NewsIndex(os.getenv("NEWS_INDEX_PATH", str(DEFAULT_NEWS_INDEX_PATH)) or None)
+        # 기사 관련 종목 태거 (StockService가 저장하는 종목 검색 인덱스 사전으로 생성, 파일이 바뀌면 다시 생성)
+        self.entity_dictionary_path = os.getenv("SEARCH_INDEX_PATH", str(DEFAULT_SEARCH_INDEX_PATH)) or None
+        self._entity_dictionary_mtime: Optional[float] = None
+        self.entity_tagger = EntityTagger()
+        self._refresh_entity_tagger()
+    
+    def _refresh_entity_tagger(self) -> EntityTagger:
+        """종목 사전 파일이 바뀌었으면 태거를 다시 생성 (파일 상태 확인만 하므로 호출 비용은 작음)"""
+        try:
+            mtime = os.stat(self.entity_dictionary_path).st_mtime if self.entity_dictionary_path else None
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime != self._entity_dictionary_mtime:
+            self._entity_dictionary_mtime = mtime
+            self.entity_tagger = EntityTagger.load(self.entity_dictionary_path)
+        return self.entity_tagger
+    
+    def _tag_news(self, news_list: List[Dict[str, Any]], primary: Optional[str] = None) -> List[Dict[str, Any]]:
+        """기사마다 제목/요약에 언급된 종목을 related_tickers로 추가 (primary는 항상 맨 앞)"""
+        return self._refresh_entity_tagger().tag_articles(news_list, primary=primary)
+    
+    def _window_start(self) -> str:
+        """검색 기간 시작 시각 (24시간 전을 news_window_bucket 단위로 내림, UTC ISO 형식)"""
+        start = time.time() - NEWS_WINDOW.total_seconds()
+        start -= start % self.news_window_bucket
+        return datetime.fromtimestamp(start, tz=timezone.utc).replace(tzinfo=None).isoformat()
+    
+    async def _cached_news(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """메모리 → 디스크 순으로 캐시된 검색 결과 조회 (디스크 적중 시 메모리에 올림, SQLite 조회는 스레드에서)"""
+        cached, state = self.news_cache.get(key)
+        if state == CACHE_HIT:
+            return dict(cached)
+        stored = await asyncio.to_thread(self.news_store.get, key)
+        if stored is not None:
+            self.news_cache.set(key, stored)
+            return dict(stored)
+        return None
+    
+    async def _store_news(self, key: Hashable, result: Dict[str, Any]) -> None:
+        """검색 결과를 메모리/디스크 캐시에 저장 (SQLite 쓰기는 스레드에서)"""
+        self.news_cache.set(key, result)
+        await asyncio.to_thread(self.news_store.put, key, result)
+    
+    def _ingest_stock_news(
+        self,
+        ticker: str,
+        fetched: List[Dict[str, Any]],
+        window_start: str,
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        새로 조회한 기사를 색인/기사 창에 반영하고 응답할 기사 목록 생성 (SQLite 작업이므로 스레드에서 호출)
+        
+        Returns:
+            (응답 기사 목록, 새로 추가된 기사 수, 중복으로 제외된 기사 수)
+        """
+        fetched = self._tag_news(fetched, primary=ticker)
+        self.news_index.add_articles(fetched)
+        
+        # 새 기사를 기사 창에 합친 뒤 창에서 최신 기사로 응답 (저장소 비활성화 시 조회 결과 그대로)
+        # 여러 매체에 배포된 같은 기사는 최신 하나만 남기고 limit개로 자름
+        if not self.news_store.enabled:
+            news_list = dedupe_articles(fetched)[:limit]
+            return news_list, len(fetched), 0
+        added = self.news_store.merge_articles(ticker, fetched, window_start)
+        candidates = self.news_store.articles(ticker, window_start, limit * NEWS_DEDUP_OVERFETCH)
+        news_list = self._tag_news(dedupe_articles(candidates)[:limit], primary=ticker)
+        return news_list, added, len(candidates) - len(news_list)
     
     async def search_stock_news(self, ticker: str, limit: int = 5) -> Dict[str, Any]:
         """
@@ -51,53 +174,81 @@ class NewsService:
                 }
             
             ticker = ticker.upper().strip()
-            logger.info(f"주식 뉴스 검색 시작: {ticker}")
             
             # 검색 키워드 설정
             query = f"{ticker} stock news"
             
-            # 최근 24시간 기준 설정
-            start_published_date = (datetime.utcnow() - timedelta(days=1)).isoformat()
+            # 최근 24시간 기준 설정 (시작 시각을 단위 시간으로 맞춰 같은 기간의 검색은 캐시 재사용)
+            start_published_date = self._window_start()
+            cache_key = ("stock_news", ticker, limit, start_published_date)
+            cached = await self._cached_news(cache_key)
+            if cached is not None:
+                logger.debug(f"뉴스 캐시 적중: {ticker}")
+                return cached
             
-            logger.info(f"검색 쿼리: {query}, 기간: {start_published_date}~현재")
+            # 저장된 기사 창에 요청 개수 이상의 기사가 있으면 가장 최근 발행 시각(워터마크) 이후만 조회
+            # (업스트림 비용과 응답 크기가 창 크기가 아닌 새 기사 수에 비례)
+            since = start_published_date
+            held, watermark = await asyncio.to_thread(self.news_store.window_state, ticker, start_published_date)
+            if watermark is not None and held >= limit and watermark > since:
+                since = watermark
+            
+            logger.info(f"주식 뉴스 검색 시작: {ticker}")
+            logger.info(f"검색 쿼리: {query}, 기간: {since}~현재 (보유 기사 {held}개)")
             
             # Exa API를 사용하여 뉴스 검색
-            # search() 메서드 사용
-            results = self.client.search(
-                query=query,
-                num_results=limit,
-                start_published_date=start_published_date
+            # search() 메서드 사용 (이벤트 루프를 막지 않도록 스레드 풀에서 실행)
+            # 같은 종목/개수/기간의 동시 요청은 하나의 업스트림 호출로 병합
+            results = await self.singleflight.do(
+                ("stock_news", ticker, limit, since),
+                lambda: self.executor.run(
+                    self.client.search,
+                    query=query,
+                    num_results=limit * NEWS_DEDUP_OVERFETCH,
+                    start_published_date=since
+                )
             )
             
-            # 결과가 없을 경우 처리
-            if not results or not hasattr(results, 'results') or len(results.results) == 0:
-                logger.warning(f"검색 결과 없음: {ticker}")
-                return {
-                    "status": "empty",
-                    "message": f"{ticker}에 대한 뉴스 검색 결과가 없습니다.",
-                    "data": []
-                }
-            
             # 검색 결과 파싱
-            news_list = []
-            for item in results.results:
+            fetched = []
+            for item in getattr(results, 'results', None) or []:
                 news_item = {
                     "title": item.title,
                     "url": item.url,
                     "published_date": item.published_date if hasattr(item, 'published_date') else "N/A",
                     "summary": item.text if hasattr(item, 'text') else "N/A",
                 }
-                news_list.append(news_item)
+                fetched.append(news_item)
+            # 색인/기사 창 반영은 SQLite 작업이므로 이벤트 루프 밖에서 한 번에 처리
+            news_list, added, duplicates = await asyncio.to_thread(
+                self._ingest_stock_news, ticker, fetched, start_published_date, limit
+            )
+            logger.info(
+                f"뉴스 검색 완료: {ticker} (새 기사 {added}개 / 중복 {duplicates}개 제외 / 응답 {len(news_list)}개)"
+            )
             
-            logger.info(f"뉴스 검색 완료: {ticker} ({len(news_list)}개)")
+            # 결과가 없을 경우 처리
+            if not news_list:
+                logger.warning(f"검색 결과 없음: {ticker}")
+                empty = {
+                    "status": "empty",
+                    "message": f"{ticker}에 대한 뉴스 검색 결과가 없습니다.",
+                    "data": []
+                }
+                # 결과가 없는 검색도 과금되므로 캐시
+                await self._store_news(cache_key, empty)
+                return empty
             
-            return {
+            result = {
                 "status": "success",
                 "ticker": ticker,
                 "query": query,
                 "count": len(news_list),
                 "news": news_list
             }
+            await self._store_news(cache_key, result)
+            self.last_good.remember(("stock_news", ticker, limit), result)
+            return result
         
         except ValueError as e:
             logger.error(f"입력값 오류: {str(e)}")
@@ -108,6 +259,10 @@ class NewsService:
                 "data": None
             }
         except Exception as e:
+            fallback = self.last_good.recall(("stock_news", ticker, limit))
+            if fallback is not None:
+                logger.warning(f"뉴스 검색 실패, 마지막 정상 응답 사용 ({ticker}, {fallback['data_age_seconds']}초 전): {e}")
+                return fallback
             logger.error(f"뉴스 검색 중 오류: {str(e)}")
             import traceback
             logger.error(traceback.format_exc())
@@ -118,6 +273,59 @@ class NewsService:
                 "data": None
             }
     
+    async def iter_stock_news(self, tickers: Iterable[str], limit: int = 5) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        여러 종목의 뉴스를 동시에 검색하여 완료되는 순서대로 반환
+        
+        종목별 검색은 서비스 전체가 공유하는 세마포어(NEWS_CONCURRENCY) 안에서 동시에 실행되므로,
+        전체 소요 시간은 검색 시간의 합이 아니라 가장 느린 검색에 가깝습니다.
+        반복을 중간에 멈추면 남은 검색은 취소됩니다.
+        
+        Args:
+            tickers: 종목 코드 목록 (중복은 한 번만 검색)
+            limit: 종목별 결과 개수
+        
+        Yields:
+            (티커, search_stock_news 결과) 튜플
+        """
+        symbols = list(dict.fromkeys(
+            ticker.upper().strip() for ticker in tickers if isinstance(ticker, str) and ticker.strip()
+        ))
+        
+        async def fetch(symbol: str) -> Tuple[str, Dict[str, Any]]:
+            async with self._news_semaphore:
+                return symbol, await self.search_stock_news(symbol, limit)
+        
+        tasks = [asyncio.ensure_future(fetch(symbol)) for symbol in symbols]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def search_stock_news_bulk(self, tickers: Iterable[str], limit: int = 5) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목의 뉴스를 동시에 검색
+        
+        Args:
+            tickers: 종목 코드 목록
+            limit: 종목별 결과 개수
+        
+        Returns:
+            {티커: search_stock_news 결과} 딕셔너리 (입력 순서 유지, 중복 제거)
+        """
+        tickers = list(tickers)
+        logger.info(f"뉴스 일괄 검색 시작: {len(tickers)}개 종목 (동시 {self.news_concurrency}개)")
+        results = {symbol: result async for symbol, result in self.iter_stock_news(tickers, limit)}
+        ordered = {
+            symbol: results[symbol]
+            for symbol in dict.fromkeys(t.upper().strip() for t in tickers if isinstance(t, str))
+            if symbol in results
+        }
+        logger.info(f"뉴스 일괄 검색 완료: {len(ordered)}개 종목")
+        return ordered
+    
     async def get_market_news(self, limit: int = 10) -> Dict[str, Any]:
         """
         시장 관련 뉴스 조회
@@ -137,16 +345,25 @@ class NewsService:
                     "data": None
                 }
             
-            logger.info("시장 뉴스 조회 시작")
-            
             # 시장 관련 뉴스 검색
             query = "stock market news"
-            start_published_date = (datetime.utcnow() - timedelta(days=1)).isoformat()
+            start_published_date = self._window_start()
+            cache_key = ("market_news", limit, start_published_date)
+            cached = await self._cached_news(cache_key)
+            if cached is not None:
+                logger.debug("시장 뉴스 캐시 적중")
+                return cached
+            
+            logger.info("시장 뉴스 조회 시작")
             
-            results = self.client.search(
-                query=query,
-                num_results=limit,
-                start_published_date=start_published_date
+            results = await self.singleflight.do(
+                ("market_news", limit),
+                lambda: self.executor.run(
+                    self.client.search,
+                    query=query,
+                    num_results=limit * NEWS_DEDUP_OVERFETCH,
+                    start_published_date=start_published_date
+                )
             )
             
             if not results or not hasattr(results, 'results') or len(results.results) == 0:
@@ -166,17 +383,27 @@ class NewsService:
                     "summary": item.text if hasattr(item, 'text') else "N/A",
                 }
                 news_list.append(news_item)
+            news_list = self._tag_news(news_list)
+            await asyncio.to_thread(self.news_index.add_articles, news_list)
+            news_list = dedupe_articles(news_list)[:limit]
             
             logger.info(f"시장 뉴스 조회 완료 ({len(news_list)}개)")
             
-            return {
+            result = {
                 "status": "success",
                 "query": query,
                 "count": len(news_list),
                 "news": news_list
             }
+            await self._store_news(cache_key, result)
+            self.last_good.remember(("market_news", limit), result)
+            return result
         
         except Exception as e:
+            fallback = self.last_good.recall(("market_news", limit))
+            if fallback is not None:
+                logger.warning(f"시장 뉴스 조회 실패, 마지막 정상 응답 사용 ({fallback['data_age_seconds']}초 전): {e}")
+                return fallback
             logger.error(f"시장 뉴스 조회 중 오류: {str(e)}")
             return {
                 "status": "error",
@@ -184,6 +411,65 @@ class NewsService:
                 "data": None
             }
     
+    def search_indexed_news(
+        self,
+        query: str,
+        limit: int = 10,
+        tickers: Optional[Iterable[str]] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        지금까지 수집한 기사를 로컬 색인에서 검색 (업스트림 호출 없음)
+        
+        Args:
+            query: 검색어 (모든 단어를 포함하는 기사를 BM25 관련도순으로)
+            limit: 결과 개수
+            tickers: 이 종목 중 하나와 관련된 기사만 (None이면 전체)
+            from_date: 이 날짜부터 발행된 기사만 (UTC, 포함)
+            to_date: 이 날짜까지 발행된 기사만 (UTC, 포함)
+        
+        Returns:
+            검색 결과 (중복 기사 제거)
+        """
+        if not query or not query.strip():
+            return {
+                "status": "error",
+                "error_type": "validation_error",
+                "message": "검색어를 입력하세요.",
+                "data": None
+            }
+        if from_date and to_date and from_date > to_date:
+            return {
+                "status": "error",
+                "error_type": "validation_error",
+                "message": f"시작 날짜({from_date})가 종료 날짜({to_date})보다 늦습니다.",
+                "data": None
+            }
+        if not self.news_index.enabled:
+            return {
+                "status": "error",
+                "error_type": "index_unavailable",
+                "message": "뉴스 색인을 사용할 수 없습니다.",
+                "data": None
+            }
+        
+        candidates = self.news_index.search(
+            query,
+            limit=limit * NEWS_DEDUP_OVERFETCH,
+            tickers=tickers,
+            since=from_date.isoformat() if from_date else None,
+            until=(to_date + timedelta(days=1)).isoformat() if to_date else None
+        )
+        results = dedupe_articles(candidates)[:limit]
+        logger.info(f"뉴스 색인 검색: {query} ({len(results)}개)")
+        return {
+            "status": "success" if results else "empty",
+            "query": query,
+            "count": len(results),
+            "results": results
+        }
+    
     async def get_stock_news(self, ticker: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         특정 종목 관련 뉴스 조회
@@ -206,32 +492,76 @@ class NewsService:
                 return []
             
             result = await self.search_stock_news(ticker, limit)
-            
-            # 성공 시 뉴스 리스트 반환
-            if result.get("status") == "success" and "news" in result:
-                news_list = result.get("news", [])
-                # 형식 정규화
-                formatted_news = []
-                for news in news_list:
-                    try:
-                        formatted_news.append({
-                            "title": news.get("title", ""),
-                            "summary": news.get("summary", ""),
-                            "source": news.get("source", "Exa"),
-                            "url": news.get("url", ""),
-                            "published_at": news.get("published_date", "")
-                        })
-                    except (TypeError, AttributeError) as e:
-                        logger.warning(f"뉴스 항목 파싱 실패: {e}")
-                        continue
-                return formatted_news
-            
-            # 결과가 없거나 실패 시 빈 배열 반환
-            logger.debug(f"{ticker}의 뉴스 조회 결과: {result.get('status')}")
-            return []
+            return self._format_stock_news(ticker, result)
             
         except Exception as e:
             logger.error(f"종목 뉴스 조회 중 오류 ({ticker}): {str(e)}")
             import traceback
             logger.error(traceback.format_exc())
             return []
+    
+    async def get_stock_news_bulk(self, tickers: Iterable[str], limit: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 종목 관련 뉴스를 동시에 조회 (search_stock_news_bulk 사용, NEWS_CONCURRENCY 적용)
+        
+        Args:
+            tickers: 종목 심볼 목록
+            limit: 종목별 결과 개수
+        
+        Returns:
+            {티커: get_stock_news와 같은 형식의 뉴스 목록} 딕셔너리 (조회 실패 종목은 빈 목록)
+        """
+        symbols = list(dict.fromkeys(
+            ticker.upper().strip() for ticker in tickers if isinstance(ticker, str) and ticker.strip()
+        ))
+        if not self.client:
+            logger.warning(f"EXA API 클라이언트 없음. {len(symbols)}개 종목의 뉴스를 조회할 수 없습니다.")
+            return {symbol: [] for symbol in symbols}
+        
+        try:
+            results = await self.search_stock_news_bulk(symbols, limit)
+        except Exception as e:
+            logger.error(f"종목 뉴스 일괄 조회 중 오류: {str(e)}")
+            results = {}
+        return {symbol: self._format_stock_news(symbol, results.get(symbol, {})) for symbol in symbols}
+    
+    def _format_stock_news(self, ticker: str, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """search_stock_news 결과를 종목 뉴스 목록 형식으로 정규화 (성공이 아니면 빈 목록)"""
+        if result.get("status") != "success" or "news" not in result:
+            logger.debug(f"{ticker}의 뉴스 조회 결과: {result.get('status')}")
+            return []
+        
+        formatted_news = []
+        for news in result.get("news", []):
+            try:
+                formatted_news.append({
+                    "title": news.get("title", ""),
+                    "summary": news.get("summary", ""),
+                    "source": news.get("source", "Exa"),
+                    "url": news.get("url", ""),
+                    "published_at": news.get("published_date", ""),
+                    "related_tickers": news.get("related_tickers") or [ticker]
+                })
+            except (TypeError, AttributeError) as e:
+                logger.warning(f"뉴스 항목 파싱 실패: {e}")
+                continue
+        return formatted_news
+
+
+# API 라우터와 브리핑 서비스가 함께 쓰는 공유 인스턴스 (캐시/요청 병합/동시 조회 세마포어 공유)
+_news_service: Optional[NewsService] = None
+_news_service_lock = threading.Lock()
+
+
+def get_news_service() -> NewsService:
+    """
+    공유 NewsService 조회 (없으면 생성)
+    
+    Returns:
+        프로세스 전체가 공유하는 NewsService
+    """
+    global _news_service
+    with _news_service_lock:
+        if _news_service is None:
+            _news_service = NewsService()
+        return _news_service
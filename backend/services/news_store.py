@@ -0,0 +1,284 @@
+"""
+뉴스 검색 결과 디스크 캐시
+Exa 검색 결과를 SQLite 파일에 TTL 동안 보관 (재시작 후나 다른 NewsService 인스턴스와도 공유)하고,
+종목별 최근 기사 창(rolling window)을 유지하여 새 기사만 추가로 조회할 수 있도록 함
+"""
+
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 기본 저장 경로 (backend/output/cache/news.db)
+DEFAULT_NEWS_STORE_PATH = Path(__file__).parent.parent / "output" / "cache" / "news.db"
+
+
+def normalize_published(value: Any) -> Optional[str]:
+    """
+    기사 발행 시각을 정렬 가능한 UTC ISO 문자열로 변환 (워터마크 비교용)
+
+    Args:
+        value: Exa published_date (예: "2026-01-01T12:34:56.000Z")
+
+    Returns:
+        "2026-01-01T12:34:56" 형식 (해석할 수 없으면 None)
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.replace(microsecond=0).isoformat()
+
+
+def _key(key: Hashable) -> str:
+    """캐시 키를 문자열로 변환 (튜플은 '|'로 연결)"""
+    if isinstance(key, tuple):
+        return "|".join(str(part) for part in key)
+    return str(key)
+
+
+class NewsStore:
+    """검색 키별 뉴스 검색 결과를 저장하는 SQLite 기반 캐시"""
+
+    def __init__(self, path: Optional[Path], ttl: float = 1800.0):
+        """
+        NewsStore 초기화
+
+        Args:
+            path: SQLite 파일 경로 (None이면 저장소 비활성화)
+            ttl: 결과를 재사용할 수 있는 시간 (초)
+        """
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        if self.path is not None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self._connect() as conn:
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS news_results (
+                            cache_key TEXT PRIMARY KEY,
+                            payload TEXT NOT NULL,
+                            stored_at REAL NOT NULL
+                        )
+                        """
+                    )
+                    # 종목별 최근 기사 창 (published_at: 정렬용 UTC ISO, 발행 시각이 없으면 수집 시각이며
+                    # 이 경우 dated=0으로 표시해 워터마크 계산에서 제외)
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS news_articles (
+                            ticker TEXT NOT NULL,
+                            url TEXT NOT NULL,
+                            title TEXT NOT NULL,
+                            published_date TEXT NOT NULL,
+                            published_at TEXT NOT NULL,
+                            summary TEXT NOT NULL,
+                            dated INTEGER NOT NULL,
+                            PRIMARY KEY (ticker, url)
+                        )
+                        """
+                    )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"뉴스 저장소 초기화 실패 ({self.path}): {e}. 저장소를 비활성화합니다.")
+                self.path = None
+
+    @property
+    def enabled(self) -> bool:
+        """저장소 사용 가능 여부"""
+        return self.path is not None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """호출마다 새 연결 사용 (업스트림 워커 스레드에서도 안전), 트랜잭션 커밋/롤백 후 연결 닫음"""
+        conn = sqlite3.connect(str(self.path), timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        TTL 이내의 검색 결과 조회
+
+        Args:
+            key: 검색 키 (예: ("stock_news", "TSLA", 5, "2026-01-01T00:00:00"))
+
+        Returns:
+            저장된 결과 (없거나 만료되었으면 None)
+        """
+        if not self.enabled:
+            return None
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT payload FROM news_results WHERE cache_key = ? AND stored_at >= ?",
+                    (_key(key), time.time() - self.ttl)
+                ).fetchone()
+                if row is None:
+                    self._misses += 1
+                    return None
+                self._hits += 1
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"뉴스 저장소 조회 실패: {e}")
+            return None
+
+    def put(self, key: Hashable, value: Dict[str, Any]) -> None:
+        """
+        검색 결과 저장 (만료된 항목은 함께 정리)
+
+        Args:
+            key: 검색 키
+            value: JSON으로 직렬화할 수 있는 결과
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        try:
+            payload = json.dumps(value, ensure_ascii=False, default=str)
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO news_results (cache_key, payload, stored_at) VALUES (?, ?, ?)",
+                    (_key(key), payload, now)
+                )
+                conn.execute("DELETE FROM news_results WHERE stored_at < ?", (now - self.ttl,))
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"뉴스 저장소 저장 실패: {e}")
+
+    def window_state(self, ticker: str, window_start: str) -> Tuple[int, Optional[str]]:
+        """
+        종목의 기사 창 상태
+
+        Args:
+            ticker: 정규화된 종목 코드
+            window_start: 창 시작 시각 (UTC ISO)
+
+        Returns:
+            (창 안의 기사 수, 가장 최근 발행 시각 = 워터마크)
+        """
+        if not self.enabled:
+            return 0, None
+        try:
+            with self._lock, self._connect() as conn:
+                count, newest = conn.execute(
+                    "SELECT COUNT(*), MAX(CASE WHEN dated THEN published_at END) FROM news_articles "
+                    "WHERE ticker = ? AND published_at >= ?",
+                    (ticker, window_start)
+                ).fetchone()
+            return count, newest
+        except sqlite3.Error as e:
+            logger.warning(f"뉴스 기사 창 조회 실패: {e}")
+            return 0, None
+
+    def merge_articles(self, ticker: str, articles: List[Dict[str, Any]], window_start: str) -> int:
+        """
+        새 기사를 종목의 기사 창에 합치고 창 밖의 기사는 정리 (같은 URL은 한 번만)
+
+        Args:
+            ticker: 정규화된 종목 코드
+            articles: {"title", "url", "published_date", "summary"} 목록
+            window_start: 창 시작 시각 (UTC ISO, 이전 기사는 삭제)
+
+        Returns:
+            새로 추가된 기사 수
+        """
+        if not self.enabled:
+            return 0
+        fetched_at = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0).isoformat()
+        rows = []
+        for article in articles:
+            if not article.get("url"):
+                continue
+            published_at = normalize_published(article.get("published_date"))
+            rows.append((
+                ticker,
+                article["url"],
+                article.get("title") or "",
+                str(article.get("published_date") or "N/A"),
+                published_at or fetched_at,
+                str(article.get("summary") or ""),
+                published_at is not None,
+            ))
+        try:
+            with self._lock, self._connect() as conn:
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO news_articles "
+                    "(ticker, url, title, published_date, published_at, summary, dated) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                added = conn.total_changes - before
+                conn.execute(
+                    "DELETE FROM news_articles WHERE ticker = ? AND published_at < ?", (ticker, window_start)
+                )
+            return added
+        except sqlite3.Error as e:
+            logger.warning(f"뉴스 기사 저장 실패 ({ticker}): {e}")
+            return 0
+
+    def articles(self, ticker: str, window_start: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        종목의 기사 창에서 최신 기사 조회
+
+        Args:
+            ticker: 정규화된 종목 코드
+            window_start: 창 시작 시각 (UTC ISO)
+            limit: 최대 기사 수
+
+        Returns:
+            최신순 {"title", "url", "published_date", "summary"} 목록
+        """
+        if not self.enabled:
+            return []
+        try:
+            with self._lock, self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT title, url, published_date, summary FROM news_articles "
+                    "WHERE ticker = ? AND published_at >= ? ORDER BY published_at DESC LIMIT ?",
+                    (ticker, window_start, limit)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"뉴스 기사 조회 실패 ({ticker}): {e}")
+            return []
+        return [
+            {"title": title, "url": url, "published_date": published_date, "summary": summary}
+            for title, url, published_date, summary in rows
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 적중/미스 통계"""
+        size = articles = 0
+        if self.enabled:
+            try:
+                with self._lock, self._connect() as conn:
+                    size = conn.execute("SELECT COUNT(*) FROM news_results").fetchone()[0]
+                    articles = conn.execute("SELECT COUNT(*) FROM news_articles").fetchone()[0]
+            except sqlite3.Error:
+                pass
+        return {
+            "enabled": self.enabled,
+            "path": str(self.path) if self.path else None,
+            "ttl": self.ttl,
+            "size": size,
+            "articles": articles,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
@@ -0,0 +1,156 @@
+"""
+회사 프로필 영구 저장소
+회사명/섹터/산업처럼 거의 변하지 않는 정보를 SQLite 파일에 보관 (재시작 후에도 유지)
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Optional
+from contextlib import contextmanager
+from pathlib import Path
+import logging
+import sqlite3
+import threading
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 기본 저장 경로 (backend/output/cache/profiles.db)
+DEFAULT_PROFILE_STORE_PATH = Path(__file__).parent.parent / "output" / "cache" / "profiles.db"
+
+# SQLite 변수 개수 제한을 피하기 위한 IN 절 분할 크기
+_CHUNK_SIZE = 500
+
+
+class ProfileStore:
+    """티커별 회사 프로필을 저장하는 SQLite 기반 저장소"""
+
+    def __init__(self, path: Optional[Path], refresh_days: float = 7.0):
+        """
+        ProfileStore 초기화
+
+        Args:
+            path: SQLite 파일 경로 (None이면 저장소 비활성화)
+            refresh_days: 프로필을 다시 조회하기까지의 기간 (일)
+        """
+        self.path = Path(path) if path else None
+        self.refresh_seconds = refresh_days * 86400
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        if self.path is not None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self._connect() as conn:
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS profiles (
+                            symbol TEXT PRIMARY KEY,
+                            name TEXT NOT NULL,
+                            sector TEXT NOT NULL,
+                            industry TEXT NOT NULL,
+                            fetched_at REAL NOT NULL
+                        )
+                        """
+                    )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"프로필 저장소 초기화 실패 ({self.path}): {e}. 저장소를 비활성화합니다.")
+                self.path = None
+
+    @property
+    def enabled(self) -> bool:
+        """저장소 사용 가능 여부"""
+        return self.path is not None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """호출마다 새 연결 사용 (업스트림 워커 스레드에서도 안전), 트랜잭션 커밋/롤백 후 연결 닫음"""
+        conn = sqlite3.connect(str(self.path), timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, symbols: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """
+        갱신 주기 이내의 프로필 조회
+
+        Args:
+            symbols: 정규화된(대문자) 종목 심볼 목록
+
+        Returns:
+            {티커: 프로필} 딕셔너리 (없거나 오래된 종목은 제외)
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not self.enabled or not symbols:
+            return {}
+
+        cutoff = time.time() - self.refresh_seconds
+        profiles: Dict[str, Dict[str, str]] = {}
+        try:
+            with self._lock, self._connect() as conn:
+                for i in range(0, len(symbols), _CHUNK_SIZE):
+                    chunk = symbols[i:i + _CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT symbol, name, sector, industry FROM profiles "
+                        f"WHERE symbol IN ({placeholders}) AND fetched_at >= ?",
+                        (*chunk, cutoff)
+                    ).fetchall()
+                    for symbol, name, sector, industry in rows:
+                        profiles[symbol] = {"name": name, "sector": sector, "industry": industry}
+                self._hits += len(profiles)
+                self._misses += len(symbols) - len(profiles)
+        except sqlite3.Error as e:
+            logger.warning(f"프로필 저장소 조회 실패: {e}")
+        return profiles
+
+    def put_many(self, profiles: Dict[str, Dict[str, str]]) -> None:
+        """
+        프로필 저장 (기존 항목은 덮어쓰고 조회 시각 갱신)
+
+        Args:
+            profiles: {티커: {"name", "sector", "industry"}} 딕셔너리
+        """
+        if not self.enabled or not profiles:
+            return
+
+        now = time.time()
+        rows = [
+            (
+                symbol,
+                profile.get("name", "N/A"),
+                profile.get("sector", "N/A"),
+                profile.get("industry", "N/A"),
+                now,
+            )
+            for symbol, profile in profiles.items()
+        ]
+        try:
+            with self._lock, self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO profiles (symbol, name, sector, industry, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"프로필 저장소 저장 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 적중/미스 통계"""
+        size = 0
+        if self.enabled:
+            try:
+                with self._lock, self._connect() as conn:
+                    size = conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+            except sqlite3.Error:
+                pass
+        return {
+            "enabled": self.enabled,
+            "path": str(self.path) if self.path else None,
+            "refresh_days": self.refresh_seconds / 86400,
+            "size": size,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
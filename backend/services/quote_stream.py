@@ -0,0 +1,168 @@
+"""
+실시간 시세 스트림
+종목별 폴러 하나가 조회한 시세를 구독 중인 모든 클라이언트에게 전달 (SSE용)
+"""
+
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set
+import asyncio
+import logging
+
+from .stock_service import StockService
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 변경 여부를 비교하는 시세 필드
+STREAM_FIELDS = ("price", "change_percent", "volume")
+
+
+class QuoteSubscription:
+    """클라이언트 한 명의 구독 (종목별 최신 값만 보관하여 느린 클라이언트는 중간 값을 건너뜀)"""
+
+    def __init__(self, tickers: List[str]):
+        """
+        QuoteSubscription 초기화
+
+        Args:
+            tickers: 구독할 종목 심볼 목록 (정규화된 대문자)
+        """
+        self.tickers = tickers
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._event = asyncio.Event()
+
+    def push(self, update: Dict[str, Any]) -> None:
+        """시세 변경 전달 (아직 보내지 않은 같은 종목 값은 덮어씀)"""
+        self._pending[update["ticker"]] = update
+        self._event.set()
+
+    async def next_batch(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        대기 중인 시세 변경 목록 (없으면 도착할 때까지 대기)
+
+        Args:
+            timeout: 최대 대기 시간 (초, 초과 시 빈 목록)
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        self._event.clear()
+        updates, self._pending = list(self._pending.values()), {}
+        return updates
+
+
+class QuoteStreamHub:
+    """종목별 폴러와 구독자를 관리하는 시세 팬아웃 허브"""
+
+    def __init__(self, stock_service: StockService, interval: float = 5.0):
+        """
+        QuoteStreamHub 초기화
+
+        Args:
+            stock_service: 시세 조회에 사용할 StockService (요청 병합 공유)
+            interval: 종목별 폴링 주기 (초). 폴러는 시세 캐시(QUOTE_CACHE_TTL)를 건너뛰고
+                조회하므로 이 주기가 곧 종목별 업스트림 조회 주기이며, 조회 결과로 캐시도 갱신됩니다.
+        """
+        self.stock_service = stock_service
+        self.interval = interval
+        self._subscribers: Dict[str, Set[QuoteSubscription]] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._polls = 0
+        self._published = 0
+
+    def subscribe(self, tickers: Iterable[str]) -> QuoteSubscription:
+        """
+        종목 구독 (해당 종목의 폴러가 없으면 시작, 마지막 값이 있으면 즉시 전달)
+
+        Args:
+            tickers: 종목 심볼 목록
+
+        Returns:
+            QuoteSubscription
+        """
+        symbols = list(dict.fromkeys(t.upper().strip() for t in tickers if t and t.strip()))
+        subscription = QuoteSubscription(symbols)
+        for symbol in symbols:
+            self._subscribers.setdefault(symbol, set()).add(subscription)
+            if symbol in self._latest:
+                subscription.push(self._latest[symbol])
+            if symbol not in self._pollers:
+                self._pollers[symbol] = asyncio.ensure_future(self._poll(symbol))
+                logger.info(f"시세 폴러 시작: {symbol}")
+        return subscription
+
+    def unsubscribe(self, subscription: QuoteSubscription) -> None:
+        """구독 해제 (구독자가 없는 종목의 폴러는 중지)"""
+        for symbol in subscription.tickers:
+            subscribers = self._subscribers.get(symbol)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[symbol]
+                self._latest.pop(symbol, None)
+                poller = self._pollers.pop(symbol, None)
+                if poller is not None:
+                    poller.cancel()
+                    logger.info(f"시세 폴러 중지: {symbol}")
+
+    async def stream(self, tickers: Iterable[str], heartbeat: float = 15.0) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        구독 후 시세 변경 목록을 차례로 반환 (종료 시 자동 구독 해제)
+
+        Args:
+            tickers: 종목 심볼 목록
+            heartbeat: 변경이 없을 때 빈 목록을 반환하는 주기 (초, 연결 유지용)
+        """
+        subscription = self.subscribe(tickers)
+        try:
+            while True:
+                yield await subscription.next_batch(timeout=heartbeat)
+        finally:
+            self.unsubscribe(subscription)
+
+    async def _poll(self, symbol: str) -> None:
+        """interval마다 시세를 조회하여 값이 바뀐 경우에만 구독자에게 전달"""
+        while True:
+            try:
+                self._polls += 1
+                # 캐시(QUOTE_CACHE_TTL)를 거치면 interval이 TTL보다 짧을 때 같은 값만 반복되므로 항상 새로 조회
+                info = await self.stock_service.get_stock_info(symbol, fresh=True)
+                if info.get("status") == "success":
+                    self._publish(symbol, info)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"시세 폴링 실패 ({symbol}): {e}")
+            await asyncio.sleep(self.interval)
+
+    def _publish(self, symbol: str, info: Dict[str, Any]) -> None:
+        """값이 바뀐 시세를 해당 종목 구독자 모두에게 전달"""
+        update = {"ticker": symbol, **{field: info.get(field) for field in STREAM_FIELDS}}
+        previous = self._latest.get(symbol)
+        if previous is not None and all(previous[f] == update[f] for f in STREAM_FIELDS):
+            return
+        self._latest[symbol] = update
+        for subscription in list(self._subscribers.get(symbol, ())):
+            subscription.push(update)
+        self._published += 1
+
+    async def close(self) -> None:
+        """모든 폴러 중지"""
+        pollers = list(self._pollers.values())
+        self._pollers.clear()
+        self._subscribers.clear()
+        for poller in pollers:
+            poller.cancel()
+        await asyncio.gather(*pollers, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """구독/폴링 통계"""
+        return {
+            "tickers": len(self._pollers),
+            "subscriptions": len({s for subs in self._subscribers.values() for s in subs}),
+            "interval": self.interval,
+            "polls": self._polls,
+            "published": self._published,
+        }
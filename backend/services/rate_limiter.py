@@ -0,0 +1,253 @@
+"""
+업스트림 호출 속도 제한
+업스트림별 토큰 버킷으로 초당 요청 수를 제한 (대기열 모드 / 즉시 실패 모드)
+"""
+
+from typing import Any, Dict, Iterator, Optional, Tuple
+from contextlib import contextmanager
+import asyncio
+import logging
+import os
+import threading
+import time
+
+from .config import env_float
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 속도 제한 모드
+MODE_QUEUE = "queue"
+MODE_FAIL_FAST = "fail_fast"
+RATE_LIMIT_MODES = (MODE_QUEUE, MODE_FAIL_FAST)
+
+# 업스트림별 기본값 (초당 요청 수, 버스트 크기), 목록에 없는 업스트림은 제한 없음
+# 환경 변수 {NAME}_RATE_LIMIT / {NAME}_RATE_BURST 로 변경 가능 (RATE_LIMIT=0이면 비활성화)
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    "yahoo": (5.0, 10.0),
+    "exa": (5.0, 5.0),
+}
+
+
+class RateLimitExceeded(Exception):
+    """즉시 실패 모드에서 토큰이 없거나, 대기 시간이 최대 대기 시간을 넘을 때 발생"""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"{name} 요청 속도 제한 초과 ({retry_after:.2f}초 후 재시도)")
+
+
+class RateLimiter:
+    """
+    토큰 버킷 속도 제한기
+
+    초당 rate개씩 토큰이 채워지고 최대 burst개까지 쌓입니다.
+    대기열 모드에서는 토큰을 미리 예약(잔량이 음수가 될 수 있음)하고 예약된 시점까지
+    기다리므로, 요청은 도착 순서대로 rate 간격에 맞춰 고르게 나갑니다.
+
+    토큰은 HTTP 요청 한 건당 하나입니다. UpstreamExecutor는 호출 전에 이벤트 루프에서
+    토큰 하나를 미리 받아 두고(prepaid), 호출 중 세션 어댑터가 보내는 요청마다
+    acquire_blocking()으로 토큰을 소비합니다 (첫 요청은 미리 받은 토큰 사용).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: Optional[float] = None,
+        mode: str = MODE_QUEUE,
+        max_wait: Optional[float] = None
+    ):
+        """
+        RateLimiter 초기화
+
+        Args:
+            name: 업스트림 이름 (예: "yahoo", "exa")
+            rate: 초당 허용 요청 수 (0 이하이면 제한 없음)
+            burst: 최대 버스트 크기 (기본값: max(rate, 1))
+            mode: "queue"(토큰이 생길 때까지 대기) 또는 "fail_fast"(즉시 RateLimitExceeded)
+            max_wait: 대기열 모드의 최대 대기 시간 (초, 초과할 요청은 즉시 실패, None이면 무제한)
+        """
+        if mode not in RATE_LIMIT_MODES:
+            raise ValueError(f"유효하지 않은 속도 제한 모드: {mode}. 허용값: {list(RATE_LIMIT_MODES)}")
+        self.name = name
+        self.rate = rate
+        self.burst = burst if burst and burst > 0 else max(rate, 1.0)
+        self.mode = mode
+        self.max_wait = max_wait
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        # 여러 이벤트 루프/스레드에서 호출되어도 토큰 계산은 원자적으로
+        self._lock = threading.Lock()
+        # 워커 스레드별로 미리 받아 둔 토큰 수
+        self._prepaid = threading.local()
+        self._acquired = 0
+        self._waited = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait_seen = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """속도 제한 사용 여부"""
+        return self.rate > 0
+
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 토큰 충전 (최대 burst)"""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 기다려야 할 시간을 반환
+
+        Raises:
+            RateLimitExceeded: 즉시 실패 모드에서 토큰이 없거나 대기 시간이 max_wait를 넘는 경우
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if wait > 0 and (self.mode == MODE_FAIL_FAST or (self.max_wait is not None and wait > self.max_wait)):
+                self._rejected += 1
+                raise RateLimitExceeded(self.name, wait)
+            self._tokens -= 1
+            self._acquired += 1
+            if wait > 0:
+                self._waited += 1
+                self._total_wait += wait
+                self._max_wait_seen = max(self._max_wait_seen, wait)
+            return wait
+
+    def _release(self) -> None:
+        """예약한 토큰 반환 (대기 중 취소된 경우)"""
+        with self._lock:
+            self._tokens += 1
+
+    async def acquire(self) -> float:
+        """
+        요청 한 건의 토큰 획득 (대기열 모드에서는 토큰이 생길 때까지 대기)
+
+        Returns:
+            대기한 시간 (초)
+
+        Raises:
+            RateLimitExceeded: 즉시 실패 모드에서 토큰이 없거나 대기 시간이 max_wait를 넘는 경우
+        """
+        if not self.enabled:
+            return 0.0
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._release()
+                raise
+        return wait
+
+    @contextmanager
+    def prepaid(self, tokens: int = 1) -> Iterator[None]:
+        """
+        현재 스레드에서 acquire()로 미리 받은 토큰을 사용하도록 설정
+
+        Args:
+            tokens: 미리 받은 토큰 수 (블록 안의 첫 요청들이 대기 없이 사용)
+        """
+        previous = getattr(self._prepaid, "tokens", 0)
+        self._prepaid.tokens = tokens
+        try:
+            yield
+        finally:
+            self._prepaid.tokens = previous
+
+    def acquire_blocking(self) -> float:
+        """
+        워커 스레드에서 HTTP 요청 한 건의 토큰 획득 (미리 받은 토큰이 있으면 먼저 사용)
+
+        Returns:
+            대기한 시간 (초)
+
+        Raises:
+            RateLimitExceeded: 즉시 실패 모드에서 토큰이 없거나 대기 시간이 max_wait를 넘는 경우
+        """
+        if not self.enabled:
+            return 0.0
+        prepaid = getattr(self._prepaid, "tokens", 0)
+        if prepaid > 0:
+            self._prepaid.tokens = prepaid - 1
+            return 0.0
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """토큰 잔량 및 대기/거절 통계"""
+        with self._lock:
+            if self.enabled:
+                self._refill(time.monotonic())
+            return {
+                "name": self.name,
+                "enabled": self.enabled,
+                "rate": self.rate,
+                "burst": self.burst,
+                "mode": self.mode,
+                "tokens": round(self._tokens, 2),
+                "acquired": self._acquired,
+                "waited": self._waited,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._total_wait / self._acquired * 1000, 2) if self._acquired else 0.0,
+                "max_wait_ms": round(self._max_wait_seen * 1000, 2),
+            }
+
+
+def _rate_limiter_from_env(name: str) -> RateLimiter:
+    """환경 변수({NAME}_RATE_LIMIT / _RATE_BURST / _RATE_MODE / _RATE_MAX_WAIT)로 속도 제한기 생성"""
+    prefix = name.upper()
+    default_rate, default_burst = DEFAULT_RATE_LIMITS.get(name, (0.0, 0.0))
+    mode = os.getenv(f"{prefix}_RATE_MODE", MODE_QUEUE).strip().lower()
+    if mode not in RATE_LIMIT_MODES:
+        logger.warning(f"유효하지 않은 {prefix}_RATE_MODE: {mode}, 기본값 {MODE_QUEUE} 사용")
+        mode = MODE_QUEUE
+    max_wait = env_float(f"{prefix}_RATE_MAX_WAIT", 0.0)
+    return RateLimiter(
+        name,
+        rate=env_float(f"{prefix}_RATE_LIMIT", default_rate),
+        burst=env_float(f"{prefix}_RATE_BURST", default_burst),
+        mode=mode,
+        max_wait=max_wait or None
+    )
+
+
+# 업스트림별 공유 속도 제한기
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str) -> RateLimiter:
+    """
+    업스트림 이름별 공유 속도 제한기 조회 (없으면 환경 변수 설정으로 생성)
+
+    Args:
+        name: 업스트림 이름 (예: "yahoo", "exa")
+
+    Returns:
+        해당 업스트림의 RateLimiter
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(name)
+        if limiter is None:
+            limiter = _rate_limiter_from_env(name)
+            _rate_limiters[name] = limiter
+            if limiter.enabled:
+                logger.info(
+                    f"속도 제한기 생성: {name} ({limiter.rate}/s, burst {limiter.burst}, {limiter.mode})"
+                )
+        return limiter
+
+
+def rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 업스트림 속도 제한기의 통계"""
+    with _rate_limiters_lock:
+        limiters = list(_rate_limiters.values())
+    return {limiter.name: limiter.stats() for limiter in limiters}
@@ -14,6 +14,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from services.stock_service import StockService
+from services.config import env_int
 
 # 로거 설정
 logging.basicConfig(
@@ -22,6 +23,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 스크리너별로 저장할 상위 종목 수 (이메일 표 / 인스타그램 캡션용)
+TRENDING_COUNT = env_int("TRENDING_COUNT", 5, minimum=1)
+
 
 async def run_screener():
     """화제 종목 조회 실행"""
@@ -39,7 +43,7 @@ async def run_screener():
         for screener_type in screener_types:
             logger.info(f"\n[{screener_type.upper()}] 조회 중...")
             
-            result = await service.get_trending_stocks(screener_type)
+            result = await service.get_trending_stocks(screener_type, count=TRENDING_COUNT)
             
             if result.get("status") == "success":
                 top_stock = result.get("top_stock", {})
@@ -52,6 +56,18 @@ async def run_screener():
                 logger.error(f"❌ 실패: {result.get('message')}")
                 results[screener_type] = result
         
+        # 조회된 종목의 일봉 히스토리 갱신 (누락된 봉만 추가)
+        tickers = [
+            stock.get("ticker")
+            for result in results.values()
+            for stock in result.get("stocks", [])
+        ]
+        try:
+            added = await service.update_history(tickers)
+            logger.info(f"\n📈 히스토리 갱신: {len(added)}개 종목, {sum(added.values())}개 봉 추가")
+        except Exception as e:
+            logger.warning(f"히스토리 갱신 실패: {str(e)}")
+        
         # 결과를 JSON 파일로 저장
         output_dir = Path(__file__).parent.parent / "output" / "data"
         output_dir.mkdir(parents=True, exist_ok=True)
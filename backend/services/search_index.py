@@ -0,0 +1,195 @@
+"""
+종목 검색 인덱스
+티커 접두어(정렬 배열 + 이진 탐색)와 회사명 퍼지 검색(트라이그램 역색인)을 지원하는 메모리 인덱스
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from bisect import bisect_left
+from collections import defaultdict
+from pathlib import Path
+import gzip
+import logging
+import os
+import re
+
+import numpy as np
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 기본 저장 경로 (backend/output/cache/search_index.tsv.gz)
+DEFAULT_SEARCH_INDEX_PATH = Path(__file__).parent.parent / "output" / "cache" / "search_index.tsv.gz"
+
+# 회사명 퍼지 매칭 최소 유사도 (검색어 트라이그램 중 회사명에 포함된 비율,
+# 회사명 일부만 입력해도 매칭되도록 Jaccard 대신 포함 비율 사용)
+MIN_SIMILARITY = 0.5
+
+# 매칭 종류별 우선순위 (작을수록 먼저)
+_EXACT, _TICKER_PREFIX, _NAME_PREFIX, _FUZZY = range(4)
+
+# (심볼, 회사명, 인기도 점수)
+SearchEntry = Tuple[str, str, float]
+
+
+def _normalize(text: str) -> str:
+    """비교용 회사명 정규화 (소문자, 영숫자 외 문자는 공백 하나로)"""
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+def _trigrams(text: str) -> set:
+    """앞뒤 공백을 붙인 정규화 문자열의 트라이그램 집합"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """티커/회사명 검색 인덱스 (생성 후 변경하지 않음, 갱신은 새 인덱스로 교체)"""
+
+    def __init__(self, entries: Iterable[SearchEntry] = ()):
+        """
+        SearchIndex 초기화
+
+        Args:
+            entries: (심볼, 회사명, 인기도 점수) 목록 (같은 심볼은 마지막 값 사용)
+        """
+        merged: Dict[str, SearchEntry] = {}
+        for symbol, name, score in entries:
+            symbol = symbol.upper().strip()
+            if symbol:
+                merged[symbol] = (symbol, name or symbol, float(score or 0))
+
+        # 티커 순으로 정렬한 병렬 배열 (접두어 검색은 bisect 두 번)
+        self.symbols: List[str] = sorted(merged)
+        self.names: List[str] = [merged[s][1] for s in self.symbols]
+        self.scores: List[float] = [merged[s][2] for s in self.symbols]
+
+        # 정규화 회사명 정렬 배열 (회사명 접두어 검색)
+        normalized = [_normalize(name) for name in self.names]
+        self._name_keys: List[Tuple[str, int]] = sorted((key, i) for i, key in enumerate(normalized))
+
+        # 트라이그램 → 종목 인덱스 역색인 (공통 개수는 bincount 한 번으로 집계)
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for i, key in enumerate(normalized):
+            for gram in _trigrams(key):
+                postings[gram].append(i)
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        i = bisect_left(self.symbols, symbol)
+        return i < len(self.symbols) and self.symbols[i] == symbol
+
+    def entries(self) -> List[SearchEntry]:
+        """인덱스의 전체 항목"""
+        return list(zip(self.symbols, self.names, self.scores))
+
+    def merged(self, entries: Iterable[SearchEntry]) -> "SearchIndex":
+        """기존 항목에 새 항목을 덮어쓴 새 인덱스"""
+        return SearchIndex([*self.entries(), *entries])
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        종목 검색
+
+        정확히 일치하는 티커 > 티커 접두어 > 회사명 접두어 > 회사명 퍼지 매칭 순으로,
+        같은 순위 안에서는 유사도와 인기도 점수가 높은 순으로 정렬합니다.
+
+        Args:
+            query: 검색어 (티커 또는 회사명 일부)
+            limit: 최대 결과 수
+
+        Returns:
+            [{"ticker", "name", "score", "match"}] 목록
+        """
+        query = (query or "").strip()
+        if not query or not self.symbols:
+            return []
+
+        # 인덱스 → (우선순위, 유사도)
+        matches: Dict[int, Tuple[int, float]] = {}
+
+        def add(index: int, rank: int, similarity: float = 1.0) -> None:
+            current = matches.get(index)
+            if current is None or (rank, -similarity) < (current[0], -current[1]):
+                matches[index] = (rank, similarity)
+
+        ticker = query.upper()
+        lo = bisect_left(self.symbols, ticker)
+        hi = bisect_left(self.symbols, ticker + "\uffff")
+        for i in range(lo, hi):
+            add(i, _EXACT if self.symbols[i] == ticker else _TICKER_PREFIX)
+
+        key = _normalize(query)
+        if key:
+            lo = bisect_left(self._name_keys, (key,))
+            hi = bisect_left(self._name_keys, (key + "\uffff",))
+            for _, i in self._name_keys[lo:hi]:
+                add(i, _NAME_PREFIX)
+
+            # 트라이그램 공통 개수로 유사도 계산
+            if len(key) >= 3:
+                grams = _trigrams(key)
+                lists = [self._postings[gram] for gram in grams if gram in self._postings]
+                if lists:
+                    common = np.bincount(np.concatenate(lists), minlength=len(self.symbols))
+                    similarity = common / len(grams)
+                    for i in np.flatnonzero(similarity >= MIN_SIMILARITY):
+                        add(int(i), _FUZZY, float(similarity[i]))
+
+        ranked = sorted(matches.items(), key=lambda item: (item[1][0], -item[1][1], -self.scores[item[0]]))
+        labels = ("exact", "ticker_prefix", "name_prefix", "fuzzy")
+        return [
+            {
+                "ticker": self.symbols[i],
+                "name": self.names[i],
+                "score": self.scores[i],
+                "match": labels[rank],
+            }
+            for i, (rank, _) in ranked[:limit]
+        ]
+
+    @classmethod
+    def load(cls, path: Optional[Path]) -> "SearchIndex":
+        """
+        저장된 인덱스 불러오기 (파일이 없거나 읽을 수 없으면 빈 인덱스)
+
+        Args:
+            path: gzip 압축 TSV 파일 경로 (심볼\\t회사명\\t점수)
+        """
+        if not path or not Path(path).exists():
+            return cls()
+        entries = []
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.rstrip("\n").split("\t")
+                    if len(parts) == 3:
+                        entries.append((parts[0], parts[1], float(parts[2] or 0)))
+        except (OSError, ValueError) as e:
+            logger.warning(f"검색 인덱스 읽기 실패 ({path}): {e}")
+            return cls()
+        logger.info(f"검색 인덱스 로드: {len(entries)}개 종목 ({path})")
+        return cls(entries)
+
+    def save(self, path: Optional[Path]) -> None:
+        """
+        인덱스를 gzip 압축 TSV 파일로 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path: 저장 경로 (None이면 저장하지 않음)
+        """
+        if not path:
+            return
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                for symbol, name, score in self.entries():
+                    clean_name = name.replace("\t", " ").replace("\n", " ")
+                    f.write(f"{symbol}\t{clean_name}\t{score:.0f}\n")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"검색 인덱스 저장 실패 ({path}): {e}")
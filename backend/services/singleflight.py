@@ -0,0 +1,72 @@
+"""
+Single-flight 요청 병합
+같은 키로 동시에 들어온 업스트림 호출을 하나로 합쳐 결과를 공유
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+import asyncio
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """키별로 진행 중인 호출을 하나만 유지하는 요청 병합기"""
+
+    def __init__(self, name: str = "default"):
+        """
+        SingleFlight 초기화
+
+        Args:
+            name: 통계 표시용 이름
+        """
+        self.name = name
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._calls = 0
+        self._shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        키에 대한 호출 실행 (이미 진행 중이면 그 결과를 함께 기다림)
+
+        결과 객체는 모든 대기자에게 공유되므로 호출자가 변경하지 않아야 합니다.
+
+        Args:
+            key: 병합 키 (예: ("quote", "TSLA"))
+            fn: 실제 호출을 수행하는 코루틴 함수
+
+        Returns:
+            호출 결과 (예외는 모든 대기자에게 전파)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self._calls += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._forget(k, _t))
+        else:
+            self._shared += 1
+            logger.debug(f"진행 중인 요청에 합류: {self.name} {key}")
+
+        # 대기자 하나가 취소되어도 공유 호출은 계속 진행
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """완료된 호출 제거"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우 예외 미확인 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """실제 호출 수와 병합된 호출 수"""
+        return {
+            "name": self.name,
+            "inflight": len(self._inflight),
+            "calls": self._calls,
+            "shared": self._shared,
+        }
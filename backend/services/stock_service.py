@@ -3,15 +3,62 @@
 yahooquery를 사용한 주식 정보 조회
 """
 
-from typing import List, Dict, Any, Optional, Literal
+from typing import List, Dict, Any, Iterator, Optional, Literal, Set
+from contextlib import contextmanager
 from yahooquery import Screener, Ticker
+from .cache import TTLCache, CACHE_HIT, CACHE_STALE, CACHE_MISS
+from .circuit_breaker import LastKnownGood
+from .config import env_int, env_float, env_bool
+from .history_store import (
+    HistoryStore, PriceHistory, DateLike, PRICE_COLUMNS, DEFAULT_HISTORY_STORE_PATH, latest_trading_day
+)
+from .http_session import create_pooled_session
+from .indicators import compute_indicators
+from .market_snapshot import MarketSnapshot, RANKINGS, MAX_SCREEN_LIMIT
+from .profile_store import ProfileStore, DEFAULT_PROFILE_STORE_PATH
+from .search_index import SearchIndex, DEFAULT_SEARCH_INDEX_PATH
+from .singleflight import SingleFlight
+from .upstream_executor import get_executor
+import asyncio
 import logging
+import os
+import queue
+from datetime import datetime
+
+import numpy as np
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 # 스크리너 타입 리터럴
 ScreenerType = Literal["most_actives", "day_gainers", "day_losers"]
+VALID_SCREENER_TYPES = ("most_actives", "day_gainers", "day_losers")
+
+# 스크리너 기본 조회 개수 / 화제 종목 최대 조회 개수
+DEFAULT_SCREENER_COUNT = 25
+MAX_TRENDING_COUNT = 100
+
+# 프로필 조회 실패 시 기본값
+EMPTY_PROFILE = {"name": "N/A", "sector": "N/A", "industry": "N/A"}
+
+# 히스토리가 없는 종목의 최초 백필 기간 (yahooquery history period)
+DEFAULT_HISTORY_BACKFILL_PERIOD = "2y"
+
+# 섹터별 스크리너 → 섹터명 (스냅샷 종목의 섹터를 프로필 조회 없이 채움)
+SECTOR_SCREENERS = {
+    "ms_basic_materials": "Basic Materials",
+    "ms_communication_services": "Communication Services",
+    "ms_consumer_cyclical": "Consumer Cyclical",
+    "ms_energy": "Energy",
+    "ms_financial_services": "Financial Services",
+    "ms_healthcare": "Healthcare",
+    "ms_technology": "Technology",
+    "ms_utilities": "Utilities",
+}
+
+# 시장 스냅샷 유니버스를 구성하는 스크리너 / 스크리너별 조회 개수 (Yahoo 최대 250)
+DEFAULT_SNAPSHOT_SCREENERS = VALID_SCREENER_TYPES + tuple(SECTOR_SCREENERS)
+SNAPSHOT_SCREENER_COUNT = 250
 
 
 class StockService:
@@ -19,9 +66,75 @@ class StockService:
     
     def __init__(self):
         """StockService 초기화"""
-        self.screener = Screener()
+        # yahooquery는 동기 HTTP 클라이언트이므로 전용 스레드 풀에서 실행
+        self.executor = get_executor("yahoo")
+        # 모든 Ticker/Screener가 공유하는 keep-alive 커넥션 풀 세션
+        # (UPSTREAM_REPLAY_URL이 있으면 로컬 녹화/재생 서버로 요청, services/upstream_replay.py 참고)
+        self.session = create_pooled_session(
+            pool_size=env_int("YAHOO_POOL_SIZE", self.executor.max_workers, minimum=1),
+            timeout=env_float("YAHOO_TIMEOUT", 5.0),
+            retries=env_int("YAHOO_RETRIES", 2),
+            replay_url=os.getenv("UPSTREAM_REPLAY_URL") or None,
+            replay_retries=env_int("UPSTREAM_REPLAY_RETRIES", 0),
+            # 호출 한 번에 여러 요청이 나가도(다중 스크리너, 종목별 quoteSummary 등) 요청마다 토큰 소비
+            rate_limiter=self.executor.rate_limiter
+        )
+        self.screener = Screener(session=self.session)
+        # 쿠키/crumb 초기화가 끝난 Ticker 재사용 (생성 시마다 발생하는 초기화 요청 방지)
+        self._idle_tickers: "queue.SimpleQueue[Ticker]" = queue.SimpleQueue()
+        # 종목별 시세 캐시 (TTL 경과 후 max_stale 동안은 stale 값 제공 + 백그라운드 갱신)
+        self.quote_cache = TTLCache(
+            maxsize=env_int("QUOTE_CACHE_SIZE", 1024, minimum=1),
+            ttl=env_float("QUOTE_CACHE_TTL", 15.0),
+            max_stale=env_float("QUOTE_CACHE_MAX_STALE", 300.0)
+        )
+        self._refreshing: Set[str] = set()
+        # 동시에 들어온 동일 업스트림 요청 병합
+        self.singleflight = SingleFlight("yahoo")
+        self._background_tasks: Set[asyncio.Task] = set()
+        # 회사명/섹터/산업처럼 거의 변하지 않는 프로필 캐시
+        self.profile_cache = TTLCache(
+            maxsize=env_int("PROFILE_CACHE_SIZE", 4096, minimum=1),
+            ttl=env_float("PROFILE_CACHE_TTL", 86400.0)
+        )
+        # assetProfile이 없는 종목(ETF 등) 캐시 (PROFILE_MISS_TTL 동안 재조회하지 않고 N/A 프로필로 응답)
+        self.profile_misses = TTLCache(
+            maxsize=env_int("PROFILE_CACHE_SIZE", 4096, minimum=1),
+            ttl=env_float("PROFILE_MISS_TTL", 21600.0)
+        )
+        # 프로필 영구 저장소 (재시작 후에도 유지, PROFILE_REFRESH_DAYS 주기로 재조회)
+        self.profile_store = ProfileStore(
+            os.getenv("PROFILE_STORE_PATH", str(DEFAULT_PROFILE_STORE_PATH)) or None,
+            refresh_days=env_float("PROFILE_REFRESH_DAYS", 7.0)
+        )
+        # 스크리너 quote로 화제 종목 응답을 바로 구성 (상세 재조회 생략)
+        self.use_screener_quotes = env_bool("TRENDING_FAST_PATH", True)
+        # 일봉 히스토리 저장소 (최초 1회 백필 후 누락된 봉만 추가)
+        self.history_store = HistoryStore(os.getenv("HISTORY_STORE_PATH", str(DEFAULT_HISTORY_STORE_PATH)) or None)
+        self.history_backfill_period = os.getenv("HISTORY_BACKFILL_PERIOD", DEFAULT_HISTORY_BACKFILL_PERIOD)
+        # 종목별로 마지막 거래일 기준 갱신을 시도한 거래일 (상장폐지/휴장일 등으로 봉이 없어도 하루 한 번만 재조회)
+        self._history_checked: Dict[str, np.datetime64] = {}
+        # 로컬 스크리닝/순위용 시장 스냅샷 (SNAPSHOT_TTL이 지나면 재구성, 교체는 참조 한 번으로 원자적)
+        self.snapshot = MarketSnapshot.empty()
+        self.snapshot_ttl = env_float("SNAPSHOT_TTL", 60.0)
+        self.snapshot_screeners = [
+            name.strip()
+            for name in os.getenv("SNAPSHOT_SCREENERS", ",".join(DEFAULT_SNAPSHOT_SCREENERS)).split(",")
+            if name.strip()
+        ]
+        # 화제 종목 조회 시 신선한 스냅샷의 순위를 우선 사용
+        self.trending_from_snapshot = env_bool("TRENDING_FROM_SNAPSHOT", True)
+        self._snapshot_task: Optional[asyncio.Task] = None
+        # 종목 검색 인덱스 (스냅샷 갱신 시 새 종목을 합쳐 새 인덱스로 교체, 파일로 보존)
+        self.search_index_path = os.getenv("SEARCH_INDEX_PATH", str(DEFAULT_SEARCH_INDEX_PATH)) or None
+        self.search_index = SearchIndex.load(self.search_index_path)
+        # 업스트림 장애(회로 열림 포함) 시 대신 제공할 마지막 정상 응답 (경과 시간 표시)
+        self.last_good = LastKnownGood(
+            maxsize=env_int("LAST_GOOD_MAXSIZE", 2048, minimum=1),
+            max_age=env_float("LAST_GOOD_MAX_AGE", 86400.0)
+        )
     
-    async def get_trending_stocks(self, screener_type: ScreenerType = "most_actives") -> Dict[str, Any]:
+    async def get_trending_stocks(self, screener_type: ScreenerType = "most_actives", count: int = 1) -> Dict[str, Any]:
         """
         화제 종목 조회 (트렌딩 중인 주식 종목)
         
@@ -30,34 +143,45 @@ class StockService:
                 - "most_actives": 가장 거래량이 많은 종목
                 - "day_gainers": 당일 가장 많이 오른 종목
                 - "day_losers": 당일 가장 많이 내린 종목
+            count: 조회할 상위 종목 수 (기본값: 1, 최대: MAX_TRENDING_COUNT)
         
         Returns:
-            선정된 TOP 1 종목의 상세 정보
+            선정된 TOP 1 종목(top_stock)과 상위 N개 종목(stocks)의 상세 정보
         """
         try:
             # 유효한 스크리너 타입 확인
-            valid_types = {"most_actives", "day_gainers", "day_losers"}
-            if screener_type not in valid_types:
-                raise ValueError(f"유효하지 않은 스크리너 타입: {screener_type}. 허용값: {valid_types}")
+            if screener_type not in VALID_SCREENER_TYPES:
+                raise ValueError(f"유효하지 않은 스크리너 타입: {screener_type}. 허용값: {set(VALID_SCREENER_TYPES)}")
             
-            logger.info(f"화제 종목 조회 시작 (타입: {screener_type})")
+            if not isinstance(count, int) or count < 1 or count > MAX_TRENDING_COUNT:
+                raise ValueError(f"유효하지 않은 count: {count}. 허용 범위: 1~{MAX_TRENDING_COUNT}")
             
-            # Screener를 사용하여 종목 목록 조회
-            # get_screeners()는 {screener_name: {데이터}}  형태의 dict 반환
-            screened_result = self.screener.get_screeners(screener_type)
+            logger.info(f"화제 종목 조회 시작 (타입: {screener_type}, 개수: {count})")
             
-            # 결과 파싱
-            if screened_result is None:
-                logger.warning(f"스크리너 결과 없음: {screener_type}")
-                return {
-                    "status": "empty",
-                    "message": f"{screener_type}에 대한 결과가 없습니다.",
-                    "data": None
-                }
-            
-            # screened_result[screener_type] 에서 quotes 추출
-            screened_data = screened_result.get(screener_type, {})
-            quotes = screened_data.get('quotes', [])
+            # 신선한 시장 스냅샷이 있으면 미리 정렬된 순위에서 상위 N개를 바로 읽음
+            quotes = self._snapshot_quotes(screener_type, count)
+            if quotes is None:
+                # Screener를 사용하여 종목 목록 조회
+                # get_screeners()는 {screener_name: {데이터}}  형태의 dict 반환
+                # 같은 스크리너에 대한 동시 요청은 하나의 업스트림 호출로 병합
+                screener_count = max(count, DEFAULT_SCREENER_COUNT)
+                screened_result = await self.singleflight.do(
+                    ("screener", screener_type, screener_count),
+                    lambda: self.executor.run(self.screener.get_screeners, screener_type, screener_count)
+                )
+                
+                # 결과 파싱
+                if screened_result is None:
+                    logger.warning(f"스크리너 결과 없음: {screener_type}")
+                    return {
+                        "status": "empty",
+                        "message": f"{screener_type}에 대한 결과가 없습니다.",
+                        "data": None
+                    }
+                
+                # screened_result[screener_type] 에서 quotes 추출
+                screened_data = screened_result.get(screener_type, {})
+                quotes = screened_data.get('quotes', [])
             
             if not quotes or len(quotes) == 0:
                 logger.warning(f"스크리너 결과 없음: {screener_type}")
@@ -67,23 +191,31 @@ class StockService:
                     "data": None
                 }
             
-            # 첫 번째 종목 (TOP 1) 선정
-            top_stock_data = quotes[0]
-            ticker_symbol = top_stock_data.get('symbol')
+            # 상위 N개 종목 선정 (첫 번째 종목이 TOP 1)
+            top_quotes = [quote for quote in quotes[:count] if isinstance(quote, dict)]
+            ticker_symbol = top_quotes[0].get('symbol') if top_quotes else None
             
             if not ticker_symbol:
                 raise ValueError("종목 심볼을 찾을 수 없습니다.")
             
-            logger.info(f"TOP 1 종목 선정: {ticker_symbol}")
+            top_quotes = [quote for quote in top_quotes if quote.get('symbol')]
+            logger.info(f"TOP {len(top_quotes)} 종목 선정: {[quote['symbol'] for quote in top_quotes]}")
             
-            # 선정된 종목의 상세 정보 조회
-            stock_detail = await self.get_stock_info(ticker_symbol)
+            # 스크리너 quote에 시세가 있으면 그대로 사용하고 프로필만 캐시에서 보강,
+            # 없으면 선정된 종목들의 상세 정보를 한 번에 조회
+            details = await self._resolve_quote_details(top_quotes)
+            symbols = list(dict.fromkeys(quote['symbol'].upper().strip() for quote in top_quotes))
+            stocks = [details[symbol] for symbol in symbols]
             
-            return {
+            result = {
                 "status": "success",
                 "screener_type": screener_type,
-                "top_stock": stock_detail
+                "count": len(stocks),
+                "top_stock": stocks[0],
+                "stocks": stocks
             }
+            self.last_good.remember(("trending", screener_type, count), result)
+            return result
         
         except ValueError as e:
             logger.error(f"입력값 오류: {str(e)}")
@@ -94,6 +226,10 @@ class StockService:
                 "data": None
             }
         except Exception as e:
+            fallback = self.last_good.recall(("trending", screener_type, count))
+            if fallback is not None:
+                logger.warning(f"화제 종목 조회 실패, 마지막 정상 응답 사용 ({fallback['data_age_seconds']}초 전): {e}")
+                return fallback
             logger.error(f"화제 종목 조회 중 오류: {str(e)}")
             import traceback
             logger.error(traceback.format_exc())
@@ -104,12 +240,331 @@ class StockService:
                 "data": None
             }
     
-    async def get_stock_info(self, ticker: str) -> Dict[str, Any]:
+    async def get_all_trending_stocks(self) -> Dict[str, Any]:
+        """
+        모든 스크리너 타입의 화제 종목을 한 번에 조회
+        
+        스크리너 세 개를 한 번의 get_screeners 호출로 받고, 선정된 종목들의
+        합집합을 한 번에 보강하므로 여러 스크리너에 중복된 종목은 한 번만 조회합니다.
+        
+        Returns:
+            {"status": ..., "results": {스크리너 타입: get_trending_stocks와 같은 형식}}
+        """
+        screener_types = list(VALID_SCREENER_TYPES)
+        try:
+            logger.info(f"전체 화제 종목 조회 시작: {screener_types}")
+            
+            snapshot_quotes = {screener_type: self._snapshot_quotes(screener_type, 1) for screener_type in screener_types}
+            if all(quotes is not None for quotes in snapshot_quotes.values()):
+                screened_result = {screener_type: {"quotes": quotes} for screener_type, quotes in snapshot_quotes.items()}
+            else:
+                screened_result = await self.singleflight.do(
+                    ("screener", tuple(screener_types)),
+                    lambda: self.executor.run(self.screener.get_screeners, screener_types)
+                )
+                if not isinstance(screened_result, dict):
+                    screened_result = {}
+            
+            # 스크리너별 TOP 1 quote 선정
+            top_quotes: Dict[str, Dict[str, Any]] = {}
+            results: Dict[str, Dict[str, Any]] = {}
+            for screener_type in screener_types:
+                screened_data = screened_result.get(screener_type)
+                quotes = screened_data.get("quotes", []) if isinstance(screened_data, dict) else []
+                if not quotes:
+                    logger.warning(f"스크리너 결과 없음: {screener_type}")
+                    results[screener_type] = {
+                        "status": "empty",
+                        "message": f"{screener_type}에 대한 결과가 없습니다.",
+                        "data": None
+                    }
+                elif not quotes[0].get("symbol"):
+                    results[screener_type] = {
+                        "status": "error",
+                        "error_type": "validation_error",
+                        "message": "종목 심볼을 찾을 수 없습니다.",
+                        "data": None
+                    }
+                else:
+                    top_quotes[screener_type] = quotes[0]
+            
+            # 선정된 종목 합집합을 한 번에 보강
+            details = await self._resolve_quote_details(list(top_quotes.values()))
+            for screener_type, quote in top_quotes.items():
+                results[screener_type] = {
+                    "status": "success",
+                    "screener_type": screener_type,
+                    "top_stock": details[quote["symbol"].upper().strip()]
+                }
+            
+            logger.info(f"전체 화제 종목 조회 완료: {len(top_quotes)}개 스크리너")
+            result = {
+                "status": "success",
+                "results": {screener_type: results[screener_type] for screener_type in screener_types}
+            }
+            self.last_good.remember(("trending_all",), result)
+            return result
+        
+        except Exception as e:
+            fallback = self.last_good.recall(("trending_all",))
+            if fallback is not None:
+                logger.warning(f"전체 화제 종목 조회 실패, 마지막 정상 응답 사용 ({fallback['data_age_seconds']}초 전): {e}")
+                return fallback
+            logger.error(f"전체 화제 종목 조회 중 오류: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            return {
+                "status": "error",
+                "error_type": type(e).__name__,
+                "message": str(e),
+                "results": {}
+            }
+    
+    async def _resolve_quote_details(self, quotes: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        스크리너 quote 목록을 종목 상세 정보로 변환
+        
+        시세가 있는 quote는 그대로 사용하고 섹터/산업만 프로필 캐시에서 한 번에 보강합니다.
+        시세가 없는 quote(또는 fast path 비활성화)는 상세 정보를 한 번에 조회합니다.
+        
+        Args:
+            quotes: Screener.get_screeners() 응답의 quote 항목 목록 (symbol 필수)
+        
+        Returns:
+            {티커: 종목 상세 정보} 딕셔너리 (중복 종목은 한 번만 조회)
+        """
+        details: Dict[str, Dict[str, Any]] = {}
+        fallback: List[str] = []
+        for quote in quotes:
+            symbol = quote["symbol"].upper().strip()
+            if symbol in details or symbol in fallback:
+                continue
+            detail = self._parse_screener_quote(quote) if self.use_screener_quotes else None
+            if detail is None:
+                fallback.append(symbol)
+            else:
+                details[symbol] = detail
+        
+        if details:
+            profiles = await self._get_profiles(list(details))
+            for symbol, detail in details.items():
+                profile = profiles.get(symbol, EMPTY_PROFILE)
+                if detail["name"] == "N/A":
+                    detail["name"] = profile["name"]
+                detail["sector"] = profile["sector"]
+                detail["industry"] = profile["industry"]
+                # 방금 받은 시세이므로 종목 조회 캐시에도 반영
+                self.quote_cache.set(symbol, detail)
+                details[symbol] = dict(detail)
+        
+        if len(fallback) == 1:
+            details[fallback[0]] = await self.get_stock_info(fallback[0])
+        elif fallback:
+            batch = await self.get_stock_info_batch(fallback)
+            if all(detail.get("status") == "error" for detail in batch.values()):
+                # 다중 심볼 요청 자체가 실패하면 종목별 조회를 병렬로 시도
+                logger.warning(f"일괄 조회 실패, 종목별 병렬 조회로 전환: {fallback}")
+                results = await asyncio.gather(*(self.get_stock_info(symbol) for symbol in fallback))
+                batch = dict(zip(fallback, results))
+            details.update(batch)
+        
+        return details
+    
+    async def _get_profiles(self, symbols: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        종목 프로필(회사명/섹터/산업) 조회
+        
+        메모리 캐시 → 디스크 저장소 순으로 찾고, 둘 다 없는 종목만 조회합니다.
+        assetProfile은 종목당 요청 1회이므로 종목별로 나눠 동시에 조회합니다
+        (같은 종목의 동시 조회는 하나로 병합).
+        
+        Args:
+            symbols: 정규화된(대문자) 종목 심볼 목록
+        
+        Returns:
+            {티커: 프로필} 딕셔너리 (조회 실패 종목은 N/A 프로필)
+        """
+        profiles = await self._known_profiles(symbols)
+        pending = [symbol for symbol in symbols if symbol not in profiles]
+        
+        async def fetch(symbol: str) -> Optional[Dict[str, str]]:
+            async def load() -> Optional[Dict[str, str]]:
+                # 저장소 조회를 기다리는 동안 다른 요청이 먼저 조회를 마쳤을 수 있음
+                cached, state = self.profile_cache.get(symbol)
+                if state != CACHE_MISS:
+                    return cached
+                if self.profile_misses.get(symbol)[1] != CACHE_MISS:
+                    return None
+                profile = await self.executor.run(self._fetch_profile, symbol)
+                # 병합이 끝난 직후 들어온 요청도 다시 조회하지 않도록 바로 메모리 캐시에 기록
+                # (프로필이 없는 종목도 기억해 PROFILE_MISS_TTL 동안 요청마다 다시 조회하지 않음)
+                if profile is None:
+                    self.profile_misses.set(symbol, EMPTY_PROFILE)
+                else:
+                    self.profile_cache.set(symbol, profile)
+                return profile
+            
+            return await self.singleflight.do(("profile", symbol), load)
+        
+        if pending:
+            results = await asyncio.gather(*(fetch(symbol) for symbol in pending), return_exceptions=True)
+            fetched = {}
+            for symbol, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"프로필 조회 실패 ({symbol}): {result}")
+                elif result is None:
+                    profiles[symbol] = EMPTY_PROFILE
+                else:
+                    fetched[symbol] = result
+            if fetched:
+                await self._store_profiles(fetched)
+                profiles.update(fetched)
+        
+        return {symbol: profiles.get(symbol, EMPTY_PROFILE) for symbol in symbols}
+    
+    async def _known_profiles(self, symbols: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        업스트림 호출 없이 알고 있는 프로필 조회 (메모리 캐시 → 디스크 저장소, SQLite 조회는 스레드에서)
+        
+        Args:
+            symbols: 정규화된(대문자) 종목 심볼 목록
+        
+        Returns:
+            {티커: 프로필} 딕셔너리 (프로필이 없다고 확인된 종목은 N/A 프로필, 모르는 종목은 제외)
+        """
+        profiles: Dict[str, Dict[str, str]] = {}
+        for symbol in symbols:
+            cached, state = self.profile_cache.get(symbol)
+            if state == CACHE_MISS:
+                cached, state = self.profile_misses.get(symbol)
+            if state != CACHE_MISS:
+                profiles[symbol] = cached
+        
+        missing = [symbol for symbol in symbols if symbol not in profiles]
+        if missing:
+            stored = await asyncio.to_thread(self.profile_store.get_many, missing)
+            for symbol, profile in stored.items():
+                self.profile_cache.set(symbol, profile)
+            profiles.update(stored)
+        return profiles
+    
+    async def _store_profiles(self, profiles: Dict[str, Dict[str, str]]) -> None:
+        """프로필을 메모리 캐시와 디스크 저장소에 저장 (SQLite 쓰기는 스레드에서)"""
+        for symbol, profile in profiles.items():
+            self.profile_cache.set(symbol, profile)
+        await asyncio.to_thread(self.profile_store.put_many, profiles)
+    
+    def _fetch_profile(self, symbol: str) -> Optional[Dict[str, str]]:
+        """
+        한 종목의 assetProfile 모듈 조회 (동기 호출)
+        
+        Args:
+            symbol: 정규화된(대문자) 종목 심볼
+        
+        Returns:
+            프로필 (응답이 없는 종목은 None)
+        """
+        with self._ticker([symbol]) as stock:
+            asset_profile_data = stock.asset_profile
+        if not isinstance(asset_profile_data, dict):
+            raise ValueError(f"assetProfile 응답 형식 오류 ({symbol}): {asset_profile_data}")
+        
+        profile = asset_profile_data.get(symbol)
+        return self._extract_profile(profile) if isinstance(profile, dict) else None
+    
+    @contextmanager
+    def _ticker(self, symbols: List[str]) -> Iterator[Ticker]:
+        """
+        공유 세션을 사용하는 Ticker 대여 (유휴 인스턴스가 있으면 심볼만 바꿔 재사용)
+        
+        yahooquery Ticker는 생성할 때마다 쿠키/crumb 초기화 요청을 보내므로,
+        워커 스레드 수만큼만 생성하고 이후에는 재사용합니다. 한 인스턴스는
+        동시에 한 스레드에서만 사용됩니다.
+        
+        Args:
+            symbols: 조회할 종목 심볼 목록
+        """
+        try:
+            stock = self._idle_tickers.get_nowait()
+        except queue.Empty:
+            stock = Ticker(list(symbols), session=self.session)
+        stock.symbols = list(symbols)
+        try:
+            yield stock
+        finally:
+            self._idle_tickers.put(stock)
+    
+    @staticmethod
+    def _extract_profile(profile: Dict[str, Any]) -> Dict[str, str]:
+        """assetProfile 응답에서 회사명/섹터/산업 추출"""
+        return {
+            "name": profile.get("longName", profile.get("website", "N/A")),
+            "sector": profile.get("sector", "N/A"),
+            "industry": profile.get("industry", "N/A"),
+        }
+    
+    @classmethod
+    def _parse_screener_quote(cls, quote: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        스크리너 quote 항목을 프론트엔드 호환 형식으로 변환
+        
+        Args:
+            quote: Screener.get_screeners() 응답의 quote 항목
+        
+        Returns:
+            종목 정보 (섹터/산업은 N/A), 시세 필드가 없으면 None
+        """
+        if not isinstance(quote, dict):
+            return None
+        
+        ticker = quote.get("symbol")
+        price = quote.get("regularMarketPrice") or 0
+        if not ticker or not isinstance(price, (int, float)) or price <= 0:
+            return None
+        
+        previous_close = quote.get("regularMarketPreviousClose") or 0
+        change_percent = quote.get("regularMarketChangePercent")
+        if change_percent is None:
+            change_percent = ((price - previous_close) / previous_close) * 100 if previous_close > 0 else 0
+        
+        return {
+            "ticker": ticker.upper().strip(),
+            "name": quote.get("longName") or quote.get("shortName") or "N/A",
+            "price": price,
+            "change_percent": change_percent,
+            "volume": quote.get("regularMarketVolume", 0) or 0,
+            "market_cap": cls._format_market_cap(quote.get("marketCap")),
+            "sector": "N/A",
+            "industry": "N/A",
+            "pe_ratio": cls._format_pe_ratio(quote.get("trailingPE")),
+            "status": "success"
+        }
+    
+    @staticmethod
+    def _format_market_cap(market_cap_value: Any) -> str:
+        """시가총액을 $1.2T / $3.4B / $5.6M 형식으로 변환"""
+        if not market_cap_value or not isinstance(market_cap_value, (int, float)) or market_cap_value <= 0:
+            return "N/A"
+        if market_cap_value >= 1e12:
+            return f"${market_cap_value / 1e12:.1f}T"
+        elif market_cap_value >= 1e9:
+            return f"${market_cap_value / 1e9:.1f}B"
+        return f"${market_cap_value / 1e6:.1f}M"
+    
+    @staticmethod
+    def _format_pe_ratio(pe_ratio_value: Any) -> str:
+        """PER을 소수점 2자리 문자열로 변환"""
+        if not pe_ratio_value or not isinstance(pe_ratio_value, (int, float)):
+            return "N/A"
+        return f"{pe_ratio_value:.2f}"
+    
+    async def get_stock_info(self, ticker: str, fresh: bool = False) -> Dict[str, Any]:
         """
         특정 종목의 상세 정보 조회
         
         Args:
             ticker: 종목 심볼 (예: "AAPL", "MSFT")
+            fresh: True면 시세 캐시를 건너뛰고 업스트림에서 조회 (결과는 캐시에 저장, 동시 요청은 병합)
         
         Returns:
             종목의 상세 정보 (프론트엔드 호환 형식)
@@ -119,102 +574,29 @@ class StockService:
                 raise ValueError(f"유효하지 않은 티커: {ticker}")
             
             ticker = ticker.upper().strip()
-            logger.info(f"종목 정보 조회: {ticker}")
             
-            # yahooquery Ticker를 사용하여 종목 정보 조회
-            stock = Ticker(ticker)
-            
-            # 기본값 설정
-            name = "N/A"
-            sector = "N/A"
-            industry = "N/A"
-            price = 0
-            previous_close = 0
-            day_high = 0
-            day_low = 0
-            week_52_high = 0
-            week_52_low = 0
-            volume = 0
-            avg_volume = 0
-            market_cap = "N/A"
-            pe_ratio = "N/A"
-            
-            # asset_profile에서 기본 정보
-            try:
-                asset_profile_data = stock.asset_profile
-                if isinstance(asset_profile_data, dict):
-                    profile = asset_profile_data.get(ticker, {})
-                    if isinstance(profile, dict):
-                        name = profile.get("longName", profile.get("website", "N/A"))
-                        sector = profile.get("sector", "N/A")
-                        industry = profile.get("industry", "N/A")
-            except Exception as e:
-                logger.warning(f"asset_profile 로드 실패 ({ticker}): {e}")
+            # 캐시 조회 (stale이면 즉시 반환하고 백그라운드에서 갱신)
+            cached, state = (None, CACHE_MISS) if fresh else self.quote_cache.get(ticker)
+            if state == CACHE_HIT:
+                logger.debug(f"종목 정보 캐시 적중: {ticker}")
+                return dict(cached)
+            if state == CACHE_STALE:
+                logger.debug(f"종목 정보 stale 캐시 반환, 백그라운드 갱신: {ticker}")
+                self._schedule_refresh(ticker)
+                return dict(cached)
             
-            # summary_detail에서 가격 정보
-            try:
-                summary_data = stock.summary_detail
-                if isinstance(summary_data, dict) and ticker in summary_data:
-                    summary = summary_data[ticker]
-                    # 현재가 구하기 (regularMarketPrice가 없으면 bid/ask 평균 또는 open 사용)
-                    if "regularMarketPrice" in summary and summary["regularMarketPrice"] and summary["regularMarketPrice"] > 0:
-                        price = summary["regularMarketPrice"]
-                        logger.debug(f"가격 source: regularMarketPrice ({ticker})")
-                    elif "bid" in summary and "ask" in summary and summary.get("bid", 0) > 0 and summary.get("ask", 0) > 0:
-                        price = (summary["bid"] + summary["ask"]) / 2
-                        logger.debug(f"가격 source: bid/ask average ({ticker})")
-                    elif "regularMarketOpen" in summary and summary["regularMarketOpen"] and summary["regularMarketOpen"] > 0:
-                        price = summary["regularMarketOpen"]
-                        logger.debug(f"가격 source: regularMarketOpen ({ticker})")
-                    else:
-                        logger.warning(f"유효한 가격 정보를 찾을 수 없습니다 ({ticker})")
-                    
-                    previous_close = summary.get("regularMarketPreviousClose", 0) or 0
-                    day_high = summary.get("regularMarketDayHigh", 0) or 0
-                    day_low = summary.get("regularMarketDayLow", 0) or 0
-                    week_52_high = summary.get("fiftyTwoWeekHigh", 0) or 0
-                    week_52_low = summary.get("fiftyTwoWeekLow", 0) or 0
-                    volume = summary.get("regularMarketVolume", 0) or 0
-                    avg_volume = summary.get("averageVolume", 0) or 0
-                    market_cap_value = summary.get("marketCap", 0)
-                    if market_cap_value and market_cap_value > 0:
-                        if market_cap_value >= 1e12:
-                            market_cap = f"${market_cap_value / 1e12:.1f}T"
-                        elif market_cap_value >= 1e9:
-                            market_cap = f"${market_cap_value / 1e9:.1f}B"
-                        else:
-                            market_cap = f"${market_cap_value / 1e6:.1f}M"
-                    pe_ratio_value = summary.get("trailingPE")
-                    if pe_ratio_value:
-                        pe_ratio = f"{pe_ratio_value:.2f}"
-            except Exception as e:
-                logger.warning(f"summary_detail 로드 실패 ({ticker}): {e}")
+            logger.info(f"종목 정보 조회: {ticker}")
             
-            # change_percent 계산 (0으로 나누기 방지)
-            change_percent = 0
-            if previous_close and previous_close > 0 and price:
-                change_percent = ((price - previous_close) / previous_close) * 100
-            elif previous_close == 0 and price > 0:
-                logger.warning(f"previous_close가 0입니다 ({ticker}). change_percent를 계산할 수 없습니다.")
-                change_percent = 0
+            stock_detail = await self._load_stock_info(ticker)
             
             logger.info(f"종목 정보 조회 완료: {ticker}")
-            
-            # 프론트엔드 호환 형식으로 반환
-            return {
-                "ticker": ticker,
-                "name": name,
-                "price": price,
-                "change_percent": change_percent,
-                "volume": volume,
-                "market_cap": market_cap,
-                "sector": sector,
-                "industry": industry,
-                "pe_ratio": pe_ratio,
-                "status": "success"
-            }
+            return stock_detail
         
         except Exception as e:
+            fallback = self.last_good.recall(("quote", ticker))
+            if fallback is not None:
+                logger.warning(f"종목 정보 조회 실패, 마지막 정상 응답 사용 ({ticker}, {fallback['data_age_seconds']}초 전): {e}")
+                return fallback
             logger.error(f"종목 정보 조회 중 오류 ({ticker}): {str(e)}")
             return {
                 "ticker": ticker,
@@ -222,23 +604,651 @@ class StockService:
                 "status": "error"
             }
     
-    async def screen_stocks(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _load_stock_info(self, ticker: str) -> Dict[str, Any]:
+        """업스트림에서 종목 정보를 조회하고 성공 시 캐시에 저장 (동시 요청은 병합)"""
+        async def load() -> Dict[str, Any]:
+            details = await self._fetch_stock_details([ticker])
+            stock_detail = details[ticker]
+            if stock_detail.get("status") == "success":
+                self.quote_cache.set(ticker, stock_detail)
+                self.last_good.remember(("quote", ticker), stock_detail)
+                await self._remember_profile(stock_detail)
+            return stock_detail
+        
+        stock_detail = await self.singleflight.do(("quote", ticker), load)
+        return dict(stock_detail)
+    
+    async def _remember_profile(self, stock_detail: Dict[str, Any]) -> None:
+        """상세 조회 결과의 프로필 필드를 프로필 캐시/저장소에 저장"""
+        if stock_detail.get("sector", "N/A") == "N/A" and stock_detail.get("industry", "N/A") == "N/A":
+            return
+        await self._store_profiles({
+            stock_detail["ticker"]: {
+                "name": stock_detail.get("name", "N/A"),
+                "sector": stock_detail.get("sector", "N/A"),
+                "industry": stock_detail.get("industry", "N/A"),
+            }
+        })
+    
+    def _schedule_refresh(self, ticker: str) -> None:
+        """stale 캐시 항목의 백그라운드 갱신 예약 (종목당 1개만 진행)"""
+        if ticker in self._refreshing:
+            return
+        self._refreshing.add(ticker)
+        task = asyncio.create_task(self._refresh_stock_info(ticker))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _refresh_stock_info(self, ticker: str) -> None:
+        """백그라운드 캐시 갱신 (실패 시 기존 stale 값 유지)"""
+        try:
+            await self._load_stock_info(ticker)
+            logger.debug(f"종목 정보 캐시 갱신 완료: {ticker}")
+        except Exception as e:
+            logger.warning(f"종목 정보 캐시 갱신 실패 ({ticker}): {e}")
+        finally:
+            self._refreshing.discard(ticker)
+    
+    async def get_stock_info_batch(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목의 상세 정보를 일괄 조회
+        
+        시세는 다중 심볼 quote 요청 한 번으로 조회하고, 프로필은 캐시/저장소에 없는
+        종목만 따로 조회합니다. 시세 캐시에 신선한 항목이 있는 종목은
+        업스트림 조회에서 제외됩니다.
+        
+        Args:
+            tickers: 종목 심볼 목록 (예: ["AAPL", "MSFT"])
+        
+        Returns:
+            {티커: 종목 상세 정보} 딕셔너리 (입력 순서 유지, 중복 제거)
+        """
+        symbols: List[str] = []
+        pending: List[str] = []
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            for ticker in tickers or []:
+                if not ticker or not isinstance(ticker, str):
+                    raise ValueError(f"유효하지 않은 티커: {ticker}")
+                symbol = ticker.upper().strip()
+                if symbol and symbol not in symbols:
+                    symbols.append(symbol)
+            
+            if not symbols:
+                raise ValueError("조회할 티커가 없습니다.")
+            
+            # 신선한 캐시 항목은 그대로 사용하고 나머지만 한 번에 조회
+            for symbol in symbols:
+                cached, state = self.quote_cache.get(symbol)
+                if state == CACHE_HIT:
+                    results[symbol] = dict(cached)
+                else:
+                    pending.append(symbol)
+            
+            if pending:
+                logger.info(f"종목 정보 일괄 조회: {pending} (캐시 적중 {len(results)}개)")
+                details = await self._fetch_stock_details(pending)
+                for symbol, detail in details.items():
+                    if detail.get("status") == "success":
+                        self.quote_cache.set(symbol, detail)
+                        self.last_good.remember(("quote", symbol), detail)
+                        await self._remember_profile(detail)
+                    results[symbol] = dict(detail)
+            
+            logger.info(f"종목 정보 일괄 조회 완료: {len(results)}개")
+            return {symbol: results[symbol] for symbol in symbols}
+        
+        except Exception as e:
+            logger.error(f"종목 정보 일괄 조회 중 오류 ({symbols}): {str(e)}")
+            return {
+                symbol: results.get(symbol) or self.last_good.recall(("quote", symbol)) or {
+                    "ticker": symbol,
+                    "error": str(e),
+                    "status": "error"
+                }
+                for symbol in symbols
+            }
+    
+    async def _fetch_stock_details(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목의 시세와 프로필을 함께 조회
+        
+        시세(/v7/finance/quote)는 종목 수와 무관하게 한 번의 요청으로 받고,
+        프로필은 시세 조회와 동시에 _get_profiles()로 캐시/저장소에 없는 종목만 조회합니다.
+        
+        Args:
+            symbols: 정규화된(대문자) 종목 심볼 목록
+        
+        Returns:
+            {티커: 종목 상세 정보} 딕셔너리
+        """
+        # 시세 요청 자체가 실패하면 예외를 전파하여 빈 값이 캐시되지 않도록 함
+        quotes, profiles = await asyncio.gather(
+            self.executor.run(self._fetch_quotes, symbols),
+            self._get_profiles(symbols)
+        )
+        return {
+            symbol: self._parse_stock_detail(symbol, quotes.get(symbol), profiles[symbol])
+            for symbol in symbols
+        }
+    
+    def _fetch_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        다중 심볼 quote 조회 (동기 호출, 1,500종목당 요청 1회)
+        
+        Args:
+            symbols: 정규화된(대문자) 종목 심볼 목록
+        
+        Returns:
+            {티커: quote 항목} 딕셔너리 (응답이 없는 종목은 제외)
+        """
+        with self._ticker(symbols) as stock:
+            quotes = stock.quotes
+        if not isinstance(quotes, dict):
+            raise ValueError(f"quote 응답 형식 오류 ({symbols}): {quotes}")
+        return {symbol: quote for symbol, quote in quotes.items() if isinstance(quote, dict)}
+    
+    @staticmethod
+    def _parse_stock_detail(ticker: str, quote: Any, profile: Dict[str, str]) -> Dict[str, Any]:
+        """
+        quote 항목과 프로필에서 한 종목의 상세 정보 추출
+        
+        Args:
+            ticker: 종목 심볼
+            quote: 해당 종목의 quote 항목 (응답에 없으면 None)
+            profile: 회사명/섹터/산업 프로필
+        
+        Returns:
+            종목의 상세 정보 (프론트엔드 호환 형식)
+        """
+        if not isinstance(quote, dict):
+            quote = {}
+        
+        # 기본값 설정
+        name = quote.get("longName") or quote.get("shortName") or profile["name"]
+        sector = profile["sector"]
+        industry = profile["industry"]
+        price = 0
+        previous_close = 0
+        day_high = 0
+        day_low = 0
+        week_52_high = 0
+        week_52_low = 0
+        volume = 0
+        avg_volume = 0
+        market_cap = "N/A"
+        pe_ratio = "N/A"
+        
+        # quote에서 가격 정보
+        try:
+            if quote:
+                # 현재가 구하기 (regularMarketPrice가 없으면 bid/ask 평균 또는 open 사용)
+                if "regularMarketPrice" in quote and quote["regularMarketPrice"] and quote["regularMarketPrice"] > 0:
+                    price = quote["regularMarketPrice"]
+                    logger.debug(f"가격 source: regularMarketPrice ({ticker})")
+                elif "bid" in quote and "ask" in quote and quote.get("bid", 0) > 0 and quote.get("ask", 0) > 0:
+                    price = (quote["bid"] + quote["ask"]) / 2
+                    logger.debug(f"가격 source: bid/ask average ({ticker})")
+                elif "regularMarketOpen" in quote and quote["regularMarketOpen"] and quote["regularMarketOpen"] > 0:
+                    price = quote["regularMarketOpen"]
+                    logger.debug(f"가격 source: regularMarketOpen ({ticker})")
+                else:
+                    logger.warning(f"유효한 가격 정보를 찾을 수 없습니다 ({ticker})")
+                
+                previous_close = quote.get("regularMarketPreviousClose", 0) or 0
+                day_high = quote.get("regularMarketDayHigh", 0) or 0
+                day_low = quote.get("regularMarketDayLow", 0) or 0
+                week_52_high = quote.get("fiftyTwoWeekHigh", 0) or 0
+                week_52_low = quote.get("fiftyTwoWeekLow", 0) or 0
+                volume = quote.get("regularMarketVolume", 0) or 0
+                avg_volume = quote.get("averageDailyVolume3Month", 0) or 0
+                market_cap = StockService._format_market_cap(quote.get("marketCap", 0))
+                pe_ratio = StockService._format_pe_ratio(quote.get("trailingPE"))
+        except Exception as e:
+            logger.warning(f"quote 파싱 실패 ({ticker}): {e}")
+        
+        # change_percent 계산 (0으로 나누기 방지)
+        change_percent = 0
+        if previous_close and previous_close > 0 and price:
+            change_percent = ((price - previous_close) / previous_close) * 100
+        elif previous_close == 0 and price > 0:
+            logger.warning(f"previous_close가 0입니다 ({ticker}). change_percent를 계산할 수 없습니다.")
+            change_percent = 0
+        
+        # 프론트엔드 호환 형식으로 반환
+        return {
+            "ticker": ticker,
+            "name": name,
+            "price": price,
+            "change_percent": change_percent,
+            "volume": volume,
+            "market_cap": market_cap,
+            "sector": sector,
+            "industry": industry,
+            "pe_ratio": pe_ratio,
+            "status": "success"
+        }
+    
+    def get_history(self, ticker: str, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> Optional[PriceHistory]:
+        """
+        저장된 일봉 히스토리 조회 (업스트림 호출 없음)
+        
+        Args:
+            ticker: 종목 심볼
+            start: 시작일 (포함)
+            end: 종료일 (포함)
+        
+        Returns:
+            PriceHistory (저장된 히스토리가 없으면 None)
+        """
+        return self.history_store.read(ticker.upper().strip(), start, end)
+    
+    async def get_indicators(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목의 기술적 지표 조회 (이동평균, RSI, ATR, 변동성, 거래량 z-score)
+        
+        저장된 일봉 히스토리로 계산하며, 히스토리가 없는 종목은 먼저 백필하고
+        마지막 거래일보다 오래된 종목은 누락된 봉을 먼저 추가합니다 (거래일당 한 번 시도).
+        
+        Args:
+            tickers: 종목 심볼 목록
+        
+        Returns:
+            {티커: 지표 딕셔너리} (히스토리를 구하지 못한 종목은 status "error")
+        """
+        symbols = list(dict.fromkeys(t.upper().strip() for t in tickers or [] if t and isinstance(t, str)))
+        
+        latest = latest_trading_day()
+        last_dates = await asyncio.to_thread(self._last_dates, symbols)
+        outdated = []
+        for symbol in symbols:
+            last_date = last_dates[symbol]
+            if last_date is None or (last_date < latest and self._history_checked.get(symbol) != latest):
+                outdated.append(symbol)
+        if outdated:
+            await self.update_history(outdated)
+            self._history_checked.update((symbol, latest) for symbol in outdated)
+        
+        # 히스토리 파일(메모리 맵) 읽기와 계산은 이벤트 루프 밖에서
+        indicators = await asyncio.to_thread(self._compute_indicators, symbols)
+        
+        results = {}
+        for symbol in symbols:
+            if symbol in indicators:
+                results[symbol] = {"ticker": symbol, **indicators[symbol], "status": "success"}
+            else:
+                results[symbol] = {
+                    "ticker": symbol,
+                    "error": f"{symbol}의 가격 히스토리가 없습니다.",
+                    "status": "error"
+                }
+        return results
+    
+    async def update_history(self, tickers: List[str]) -> Dict[str, int]:
+        """
+        일봉 히스토리 갱신
+        
+        저장된 히스토리가 없는 종목은 HISTORY_BACKFILL_PERIOD 만큼 백필하고,
+        있는 종목은 마지막 저장일부터의 봉만 조회하여 추가합니다.
+        (마지막 저장일도 다시 조회하여 장중에 저장된 봉을 확정값으로 교체)
+        같은 시작일의 종목은 다중 심볼 Ticker 하나로 함께 조회합니다.
+        
+        Args:
+            tickers: 종목 심볼 목록
+        
+        Returns:
+            {티커: 새로 추가된 봉 개수} 딕셔너리 (조회 실패 종목은 0)
+        """
+        symbols = list(dict.fromkeys(t.upper().strip() for t in tickers or [] if t and isinstance(t, str)))
+        if not symbols or not self.history_store.enabled:
+            return {}
+        
+        # 시작일별로 묶어 조회 (None은 최초 백필, 파일 작업은 이벤트 루프 밖에서)
+        groups: Dict[Optional[np.datetime64], List[str]] = {}
+        for symbol, last_date in (await asyncio.to_thread(self._last_dates, symbols)).items():
+            groups.setdefault(last_date, []).append(symbol)
+        
+        added = {symbol: 0 for symbol in symbols}
+        for start, group in groups.items():
+            try:
+                bars = await self.executor.run(self._fetch_history, group, start)
+            except Exception as e:
+                logger.warning(f"히스토리 조회 실패 ({group}): {e}")
+                continue
+            bars = {symbol: columns for symbol, columns in bars.items() if symbol in added}
+            added.update(await asyncio.to_thread(self._append_history, bars))
+        
+        logger.info(f"히스토리 갱신 완료: {sum(added.values())}개 봉 추가 ({len(symbols)}개 종목)")
+        return added
+    
+    def _last_dates(self, symbols: List[str]) -> Dict[str, Optional[np.datetime64]]:
+        """종목별 저장된 마지막 거래일 (파일 읽기이므로 스레드에서 호출)"""
+        return {symbol: self.history_store.last_date(symbol) for symbol in symbols}
+    
+    def _append_history(self, bars: Dict[str, Dict[str, np.ndarray]]) -> Dict[str, int]:
+        """조회한 일봉을 종목별 파일에 추가 (파일 쓰기이므로 스레드에서 호출)"""
+        return {symbol: self.history_store.append(symbol, columns) for symbol, columns in bars.items()}
+    
+    def _compute_indicators(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """저장된 히스토리로 지표 계산 (파일 읽기이므로 스레드에서 호출)"""
+        return compute_indicators({symbol: self.history_store.read(symbol) for symbol in symbols})
+    
+    def _fetch_history(self, symbols: List[str], start: Optional[np.datetime64]) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        yahooquery로 일봉 조회 (동기 호출)
+        
+        Args:
+            symbols: 정규화된(대문자) 종목 심볼 목록
+            start: 조회 시작일 (None이면 백필 기간 전체)
+        
+        Returns:
+            {티커: {"date": datetime64[D] 배열, "open": ..., "volume": ...}} 딕셔너리
+        """
+        with self._ticker(symbols) as stock:
+            if start is None:
+                frame = stock.history(period=self.history_backfill_period, interval="1d")
+            else:
+                frame = stock.history(start=str(start), interval="1d")
+        
+        # 전체 실패 시 yahooquery는 DataFrame 대신 {심볼: 오류} 딕셔너리 반환
+        if not hasattr(frame, "groupby") or getattr(frame, "empty", True):
+            logger.warning(f"히스토리 응답 없음 ({symbols}): {frame}")
+            return {}
+        
+        bars = {}
+        for symbol, rows in frame.groupby(level=0):
+            rows = rows.dropna(subset=list(PRICE_COLUMNS))
+            if rows.empty:
+                continue
+            # 일봉 인덱스는 date, 당일 봉은 장중 timestamp일 수 있으므로 날짜만 사용
+            dates = rows.index.get_level_values(-1)
+            columns = {"date": np.array([str(d)[:10] for d in dates], dtype="datetime64[D]")}
+            for column in PRICE_COLUMNS:
+                columns[column] = rows[column].to_numpy(dtype=np.float64)
+            bars[str(symbol).upper()] = columns
+        return bars
+    
+    async def refresh_snapshot(self) -> MarketSnapshot:
+        """
+        시장 스냅샷 재구성
+        
+        유니버스 스크리너 전체를 get_screeners 한 번으로 조회하여 새 스냅샷을 만든 뒤
+        참조를 한 번에 교체하므로, 조회 중인 쪽은 항상 완성된 스냅샷만 봅니다.
+        
+        Returns:
+            새 스냅샷
+        """
+        screened_result = await self.singleflight.do(
+            ("snapshot", tuple(self.snapshot_screeners)),
+            lambda: self.executor.run(
+                self.screener.get_screeners, self.snapshot_screeners, SNAPSHOT_SCREENER_COUNT
+            )
+        )
+        if not isinstance(screened_result, dict):
+            raise ValueError(f"스크리너 응답 형식 오류: {screened_result}")
+        
+        snapshot = self._build_snapshot(screened_result)
+        self.snapshot = snapshot
+        logger.info(f"시장 스냅샷 갱신: {len(snapshot)}개 종목")
+        await self._update_search_index(snapshot)
+        return snapshot
+    
+    async def _update_search_index(self, snapshot: MarketSnapshot) -> None:
+        """
+        스냅샷에 새 종목이 있을 때만 검색 인덱스에 합치고 파일로 저장 (거래량을 인기도 점수로 사용)
+        
+        유니버스가 그대로면 (대부분의 갱신) 아무 것도 하지 않고, 재구성/gzip 저장은
+        이벤트 루프를 막지 않도록 워커 스레드에서 실행합니다.
+        """
+        if not len(snapshot):
+            return
+        previous = self.search_index
+        if all(stock["ticker"] in previous for stock in snapshot.stocks):
+            return
+        volumes = snapshot.columns["volume"]
+        entries = [
+            (stock["ticker"], stock.get("name"), 0.0 if np.isnan(volume) else float(volume))
+            for stock, volume in zip(snapshot.stocks, volumes)
+        ]
+        
+        def rebuild() -> SearchIndex:
+            index = previous.merged(entries)
+            index.save(self.search_index_path)
+            return index
+        
+        self.search_index = await asyncio.to_thread(rebuild)
+        logger.info(f"검색 인덱스 갱신: {len(previous)} → {len(self.search_index)}개 종목")
+    
+    def _build_snapshot(self, screened_result: Dict[str, Any]) -> MarketSnapshot:
+        """
+        스크리너 응답으로 시장 스냅샷 생성
+        
+        Args:
+            screened_result: {스크리너: {"quotes": [...]}} 형태의 get_screeners 응답
+        
+        Returns:
+            MarketSnapshot
+        """
+        stocks: Dict[str, Dict[str, Any]] = {}
+        quotes: Dict[str, Dict[str, Any]] = {}
+        for screener_name, screened_data in screened_result.items():
+            if not isinstance(screened_data, dict):
+                continue
+            sector = SECTOR_SCREENERS.get(screener_name)
+            for quote in screened_data.get("quotes", []):
+                stock = self._parse_screener_quote(quote)
+                if stock is None:
+                    continue
+                symbol = stock["ticker"]
+                if symbol not in stocks:
+                    stocks[symbol] = stock
+                    quotes[symbol] = quote
+                if sector:
+                    stocks[symbol]["sector"] = sector
+        
+        # 회사명/산업 등 프로필 보강은 응답할 종목에만 (_with_known_profiles)
+        symbols = list(stocks)
+        
+        def raw(key: str) -> List[Optional[float]]:
+            values = []
+            for symbol in symbols:
+                value = quotes[symbol].get(key)
+                values.append(value if isinstance(value, (int, float)) else None)
+            return values
+        
+        avg_volume = [
+            three_month if three_month is not None else ten_day
+            for three_month, ten_day in zip(raw("averageDailyVolume3Month"), raw("averageDailyVolume10Day"))
+        ]
+        return MarketSnapshot(
+            [stocks[symbol] for symbol in symbols],
+            quotes=[quotes[symbol] for symbol in symbols],
+            columns={
+                "price": [stocks[symbol]["price"] for symbol in symbols],
+                "change_percent": [stocks[symbol]["change_percent"] for symbol in symbols],
+                "volume": [stocks[symbol]["volume"] for symbol in symbols],
+                "avg_volume": avg_volume,
+                "market_cap": raw("marketCap"),
+                "pe_ratio": raw("trailingPE"),
+            }
+        )
+    
+    async def _with_known_profiles(self, stocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        응답할 스냅샷 종목만 이미 알고 있는 프로필(캐시/저장소)로 회사명/섹터/산업 보강
+        
+        유니버스 전체(수천 종목)를 갱신마다 조회하지 않도록 응답 시점에 결과 종목만 조회합니다.
+        (스크리닝의 섹터 조건은 섹터별 스크리너에서 얻은 섹터 기준)
+        """
+        profiles = await self._known_profiles([stock["ticker"] for stock in stocks])
+        for stock in stocks:
+            profile = profiles.get(stock["ticker"])
+            if profile:
+                stock.update({key: value for key, value in profile.items() if value and value != "N/A"})
+        return stocks
+    
+    async def _current_snapshot(self) -> MarketSnapshot:
+        """현재 스냅샷 (SNAPSHOT_TTL이 지났으면 재구성, 실패하면 기존 스냅샷)"""
+        snapshot = self.snapshot
+        if snapshot.age > self.snapshot_ttl:
+            try:
+                snapshot = await self.refresh_snapshot()
+            except Exception as e:
+                logger.warning(f"시장 스냅샷 갱신 실패, 기존 스냅샷 사용 ({len(snapshot)}개 종목): {e}")
+        return snapshot
+    
+    def _snapshot_quotes(self, ranking: str, count: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        신선한 스냅샷의 순위 상위 quote 목록 (업스트림 호출 없음)
+        
+        Returns:
+            quote 목록 (스냅샷이 비었거나 SNAPSHOT_TTL이 지났으면 None)
+        """
+        snapshot = self.snapshot
+        if not self.trending_from_snapshot or not len(snapshot) or snapshot.age > self.snapshot_ttl:
+            return None
+        return snapshot.top_quotes(ranking, count)
+    
+    def start_snapshot_refresh(self, interval: float) -> None:
+        """
+        시장 스냅샷 주기적 갱신 시작 (이벤트 루프 안에서 호출)
+        
+        Args:
+            interval: 갱신 주기 (초)
+        """
+        if self._snapshot_task is not None and not self._snapshot_task.done():
+            return
+        self._snapshot_task = asyncio.ensure_future(self._snapshot_refresh_loop(interval))
+        logger.info(f"시장 스냅샷 주기 갱신 시작 (주기: {interval}s)")
+    
+    async def stop_snapshot_refresh(self) -> None:
+        """시장 스냅샷 주기적 갱신 중지"""
+        task, self._snapshot_task = self._snapshot_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    async def _snapshot_refresh_loop(self, interval: float) -> None:
+        """interval마다 스냅샷 재구성 (실패 시 기존 스냅샷 유지)"""
+        while True:
+            try:
+                await self.refresh_snapshot()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"시장 스냅샷 주기 갱신 실패: {e}")
+            await asyncio.sleep(interval)
+    
+    async def get_ranking(self, ranking: str, count: int = 10) -> Dict[str, Any]:
         """
-        조건에 맞는 종목 스크리닝
+        시장 스냅샷 순위 조회 (most_actives, day_gainers, day_losers, unusual_volume)
+        
+        Args:
+            ranking: 순위 이름
+            count: 조회할 종목 수
+        
+        Returns:
+            {"status", "ranking", "count", "stocks"} (스냅샷 기준, 업스트림 호출 없음)
+        """
+        try:
+            if ranking not in RANKINGS:
+                raise ValueError(f"유효하지 않은 순위: {ranking}. 허용값: {list(RANKINGS)}")
+            if not isinstance(count, int) or count < 1 or count > MAX_SCREEN_LIMIT:
+                raise ValueError(f"유효하지 않은 count: {count}. 허용 범위: 1~{MAX_SCREEN_LIMIT}")
+            
+            snapshot = await self._current_snapshot()
+            if not len(snapshot):
+                return self._snapshot_unavailable()
+            stocks = await self._with_known_profiles(snapshot.rows(snapshot.top(ranking, count)))
+            return {
+                "status": "success",
+                "ranking": ranking,
+                "count": len(stocks),
+                "stocks": stocks
+            }
+        
+        except ValueError as e:
+            logger.error(f"입력값 오류: {str(e)}")
+            return {
+                "status": "error",
+                "error_type": "validation_error",
+                "message": str(e),
+                "data": None
+            }
+    
+    def search_stocks(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        티커/회사명으로 종목 검색 (메모리 내 검색 인덱스 기준, 업스트림 호출 없음)
+        
+        Args:
+            query: 검색어 (티커 접두어 또는 회사명 일부, 오타 허용)
+            limit: 최대 결과 수
+        
+        Returns:
+            [{"ticker", "name", "score", "match"}] 목록 (정확 일치 > 티커 접두어 > 회사명 접두어 > 유사 회사명)
+        """
+        return self.search_index.search(query, limit)
+    
+    async def screen_stocks(self, criteria: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        조건에 맞는 종목 스크리닝 (메모리 내 시장 스냅샷 기준, 업스트림 호출 없음)
+        
+        스냅샷이 SNAPSHOT_TTL보다 오래되었으면 먼저 재구성합니다.
+        (재구성에 실패하면 기존 스냅샷으로 응답, 사용할 스냅샷이 없으면 snapshot_unavailable 오류)
         
         Args:
             criteria: 스크리닝 조건
+                - min_/max_ price, change_percent, volume, volume_ratio, market_cap, pe_ratio
+                - sectors: 섹터 목록 (예: ["Technology"])
+                - sort_by: 정렬 컬럼 (기본값: volume), descending: 내림차순 여부 (기본값: True)
+                - limit: 최대 결과 수 (기본값: 50)
         
         Returns:
-            조건에 맞는 종목 목록
+            {"status", "count", "universe_size", "snapshot_at", "results"}
+            (잘못된 조건은 validation_error, 스냅샷이 없으면 snapshot_unavailable 오류)
         """
         try:
             logger.info(f"종목 스크리닝 시작: {criteria}")
             
-            # TODO: 커스텀 스크리닝 로직 구현
-            # 현재는 기본 스크리닝만 지원
-            return []
+            snapshot = await self._current_snapshot()
+            if not len(snapshot):
+                return self._snapshot_unavailable()
+            results = await self._with_known_profiles(snapshot.rows(snapshot.screen(criteria)))
+            logger.info(f"종목 스크리닝 완료: {len(results)}개 / {len(snapshot)}개")
+            return {
+                "status": "success",
+                "count": len(results),
+                "universe_size": len(snapshot),
+                "snapshot_at": datetime.fromtimestamp(snapshot.created_at).isoformat(),
+                "results": results
+            }
         
+        except ValueError as e:
+            logger.error(f"입력값 오류: {str(e)}")
+            return {
+                "status": "error",
+                "error_type": "validation_error",
+                "message": str(e),
+                "data": None
+            }
         except Exception as e:
             logger.error(f"종목 스크리닝 중 오류: {str(e)}")
-            return []
+            return {
+                "status": "error",
+                "error_type": type(e).__name__,
+                "message": str(e),
+                "data": None
+            }
+    
+    def _snapshot_unavailable(self) -> Dict[str, Any]:
+        """스냅샷을 만들지 못해 비어 있을 때의 오류 응답"""
+        logger.error("시장 스냅샷이 비어 있어 응답할 수 없습니다.")
+        return {
+            "status": "error",
+            "error_type": "snapshot_unavailable",
+            "message": "시장 스냅샷을 불러올 수 없습니다. 잠시 후 다시 시도하세요.",
+            "data": None
+        }
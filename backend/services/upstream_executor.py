@@ -0,0 +1,196 @@
+"""
+업스트림 호출 실행기
+yahooquery / Exa 같은 동기 HTTP 클라이언트 호출을 이벤트 루프 밖에서 실행
+"""
+
+from typing import Any, Callable, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+
+from .circuit_breaker import CircuitBreaker, get_circuit_breaker
+from .rate_limiter import RateLimiter, RateLimitExceeded, get_rate_limiter
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 기본 워커 수 (환경 변수 UPSTREAM_MAX_WORKERS 로 변경 가능)
+DEFAULT_MAX_WORKERS = 8
+
+
+def _max_workers_from_env(name: str) -> int:
+    """업스트림별 워커 수 설정 조회 ({NAME}_MAX_WORKERS > UPSTREAM_MAX_WORKERS > 기본값)"""
+    for key in (f"{name.upper()}_MAX_WORKERS", "UPSTREAM_MAX_WORKERS"):
+        value = os.getenv(key)
+        if not value:
+            continue
+        try:
+            workers = int(value)
+            if workers > 0:
+                return workers
+        except (ValueError, TypeError):
+            pass
+        logger.warning(f"유효하지 않은 {key}: {value}, 무시합니다.")
+    return DEFAULT_MAX_WORKERS
+
+
+class UpstreamExecutor:
+    """크기가 제한된 스레드 풀에서 블로킹 업스트림 호출을 실행"""
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        UpstreamExecutor 초기화
+
+        Args:
+            name: 업스트림 이름 (예: "yahoo", "exa")
+            max_workers: 동시 실행 워커 수 (미지정 시 환경 변수에서 조회)
+            rate_limiter: 호출 전에 토큰을 획득할 속도 제한기 (None이면 제한 없음, 호출 중 HTTP 요청이
+                여러 건이면 세션 어댑터가 두 번째 요청부터 같은 제한기로 토큰을 추가 획득)
+            circuit_breaker: 호출 결과를 기록하고 장애 시 호출을 차단할 서킷 브레이커 (None이면 사용 안 함)
+        """
+        self.name = name
+        self.max_workers = max_workers or _max_workers_from_env(name)
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"upstream-{name}"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_wait = 0.0
+        self._total_run = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        블로킹 함수를 워커 스레드에서 실행하고 결과를 기다림
+
+        Args:
+            func: 실행할 동기 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 반환값 (예외는 그대로 전파)
+
+        Raises:
+            CircuitOpenError: 서킷 브레이커가 열려 있는 경우 (업스트림 호출 없이 즉시)
+            RateLimitExceeded: 속도 제한기가 즉시 실패 모드이고 토큰이 없는 경우
+        """
+        generation = self.circuit_breaker.before_call() if self.circuit_breaker is not None else 0
+        # 첫 요청의 속도 제한 대기는 스레드를 점유하지 않도록 제출 전에 이벤트 루프에서 처리
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        prepaid = self.rate_limiter.prepaid if self.rate_limiter is not None else nullcontext
+
+        submitted_at = time.monotonic()
+
+        def _call() -> Any:
+            started_at = time.monotonic()
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._total_wait += started_at - submitted_at
+            try:
+                with prepaid():
+                    return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._total_run += time.monotonic() - started_at
+
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        future = self._executor.submit(functools.partial(_call))
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 아직 시작되지 않은 작업이면 대기열에서 제거
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+        except Exception as e:
+            with self._lock:
+                self._failed += 1
+            # 호출 중 추가 요청의 속도 제한 거절은 업스트림 장애가 아님
+            if self.circuit_breaker is not None and not isinstance(e, RateLimitExceeded):
+                self.circuit_breaker.record_failure(generation)
+            raise
+
+        with self._lock:
+            self._completed += 1
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success(generation)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 깊이 및 처리 통계"""
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "max_queue_depth": self._max_queue_depth,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_wait_ms": round(self._total_wait / finished * 1000, 2) if finished else 0.0,
+                "avg_run_ms": round(self._total_run / finished * 1000, 2) if finished else 0.0,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """스레드 풀 종료"""
+        self._executor.shutdown(wait=wait)
+
+
+# 업스트림별 공유 실행기
+_executors: Dict[str, UpstreamExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str) -> UpstreamExecutor:
+    """
+    업스트림 이름별 공유 실행기 조회 (없으면 생성)
+
+    Args:
+        name: 업스트림 이름 (예: "yahoo", "exa")
+
+    Returns:
+        해당 업스트림의 UpstreamExecutor
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = UpstreamExecutor(
+                name,
+                rate_limiter=get_rate_limiter(name),
+                circuit_breaker=get_circuit_breaker(name)
+            )
+            _executors[name] = executor
+            logger.info(f"업스트림 실행기 생성: {name} (workers: {executor.max_workers})")
+        return executor
+
+
+def executor_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 업스트림 실행기의 통계"""
+    with _executors_lock:
+        executors = list(_executors.values())
+    return {executor.name: executor.stats() for executor in executors}
@@ -0,0 +1,324 @@
+"""
+업스트림 녹화/재생 서버
+Yahoo / Exa 응답을 픽스처 파일로 녹화하고, 로컬 HTTP 서버에서 지연/오류를 주입해 재생 (부하 테스트용)
+
+사용법 (backend 디렉토리에서):
+    # 1) 녹화: 실제 업스트림으로 전달하면서 응답을 픽스처로 저장
+    python -m services.upstream_replay --record --port 8765
+    # 2) 재생: 저장된 픽스처만으로 응답 (평균 80ms 지연, 5% 503 오류)
+    python -m services.upstream_replay --port 8765 --latency-ms 80 --jitter-ms 20 --error-rate 0.05 --seed 1
+    # 3) API 서버를 재생 서버에 연결
+    UPSTREAM_REPLAY_URL=http://127.0.0.1:8765 uvicorn main:app
+"""
+
+from typing import Any, Dict, Optional, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import argparse
+import base64
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+
+import requests
+
+from .http_session import DEFAULT_HEADERS
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 기본 픽스처 경로 (backend/fixtures/upstream) / 기본 포트
+DEFAULT_FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "upstream"
+DEFAULT_REPLAY_PORT = 8765
+
+# 요청마다 바뀌어 픽스처 키에서 제외하는 쿼리 파라미터 / JSON 본문 필드
+IGNORED_QUERY_PARAMS = frozenset({"crumb"})
+IGNORED_BODY_FIELDS = frozenset({"startPublishedDate", "endPublishedDate", "startCrawlDate", "endCrawlDate"})
+
+# 업스트림으로 전달하지 않는 요청 헤더 (소문자)
+HOP_BY_HOP_HEADERS = frozenset({"host", "connection", "content-length", "accept-encoding", "keep-alive"})
+
+
+def _normalized_body(body: bytes) -> bytes:
+    """JSON 본문이면 변동 필드를 빼고 키 순서를 고정, 아니면 그대로"""
+    if not body:
+        return b""
+    try:
+        payload = json.loads(body)
+    except (ValueError, UnicodeDecodeError):
+        return body
+    if isinstance(payload, dict):
+        payload = {key: value for key, value in payload.items() if key not in IGNORED_BODY_FIELDS}
+    return json.dumps(payload, sort_keys=True).encode()
+
+
+def fixture_key(method: str, host: str, path: str, query: str, body: bytes = b"") -> str:
+    """
+    요청을 식별하는 픽스처 키 (변동 파라미터 제외, 쿼리 순서 무관)
+
+    Args:
+        method: HTTP 메서드
+        host: 원래 업스트림 호스트 (예: "query2.finance.yahoo.com")
+        path: 요청 경로
+        query: 쿼리 문자열
+        body: 요청 본문
+    """
+    params = sorted((k, v) for k, v in parse_qsl(query, keep_blank_values=True) if k not in IGNORED_QUERY_PARAMS)
+    digest = hashlib.sha1()
+    for part in (method.upper(), host.lower(), path, urlencode(params)):
+        digest.update(part.encode() + b"\0")
+    digest.update(_normalized_body(body))
+    return digest.hexdigest()[:20]
+
+
+class FixtureStore:
+    """호스트별 디렉토리에 요청 하나당 JSON 파일 하나로 응답을 보관하는 픽스처 저장소"""
+
+    def __init__(self, root: Path):
+        """
+        FixtureStore 초기화
+
+        Args:
+            root: 픽스처 디렉토리
+        """
+        self.root = Path(root)
+
+    def _path(self, host: str, key: str) -> Path:
+        return self.root / host.lower() / f"{key}.json"
+
+    def load(self, host: str, key: str) -> Optional[Dict[str, Any]]:
+        """저장된 응답 조회 (없거나 읽을 수 없으면 None)"""
+        path = self._path(host, key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"픽스처 읽기 실패 ({path}): {e}")
+            return None
+
+    def save(self, host: str, key: str, request: Dict[str, Any], status: int, content_type: str, body: bytes) -> None:
+        """응답 저장 (UTF-8로 읽을 수 없는 본문은 base64)"""
+        path = self._path(host, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fixture: Dict[str, Any] = {"request": request, "status": status, "content_type": content_type}
+        try:
+            fixture["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            fixture["body_base64"] = base64.b64encode(body).decode("ascii")
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def body(fixture: Dict[str, Any]) -> bytes:
+        """픽스처의 응답 본문"""
+        if "body_base64" in fixture:
+            return base64.b64decode(fixture["body_base64"])
+        return fixture.get("body", "").encode("utf-8")
+
+
+class _ReplayRequestHandler(BaseHTTPRequestHandler):
+    """/{원래 호스트}/{경로} 형식의 요청을 재생 서버로 전달"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, content_type, payload = self.server.respond(self.command, self.path, dict(self.headers), body)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"재생 서버 요청: {format % args}")
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    업스트림 대역 HTTP 서버
+
+    record=True이면 요청을 실제 업스트림(https)으로 전달하고 응답을 픽스처로 저장하며,
+    record=False이면 픽스처만으로 응답합니다. 재생 시에는 지연과 오류(503)를 주입할 수 있고,
+    seed를 지정하면 주입 순서가 실행마다 같습니다.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        fixtures: Path = DEFAULT_FIXTURES_PATH,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        record: bool = False,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        ReplayServer 초기화
+
+        Args:
+            fixtures: 픽스처 디렉토리
+            host: 바인딩 주소
+            port: 포트 (0이면 임의의 빈 포트)
+            record: 녹화 모드 여부
+            latency: 응답마다 추가할 평균 지연 (초)
+            jitter: 지연의 표준편차 (초)
+            error_rate: 503 오류를 반환할 확률 (0~1)
+            seed: 지연/오류 주입용 난수 시드
+        """
+        super().__init__((host, port), _ReplayRequestHandler)
+        self.store = FixtureStore(fixtures)
+        self.record = record
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._upstream = requests.Session() if record else None
+        self._thread: Optional[threading.Thread] = None
+        self._counts = {"requests": 0, "replayed": 0, "recorded": 0, "misses": 0, "injected_errors": 0}
+
+    @property
+    def url(self) -> str:
+        """서버 주소 (UPSTREAM_REPLAY_URL 값)"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def _injected(self) -> Tuple[float, bool]:
+        """이번 요청에 주입할 (지연, 오류 여부)"""
+        with self._lock:
+            delay = max(0.0, self._random.gauss(self.latency, self.jitter)) if self.latency or self.jitter else 0.0
+            fail = self._random.random() < self.error_rate
+        return delay, fail
+
+    def respond(self, method: str, raw_path: str, headers: Dict[str, str], body: bytes) -> Tuple[int, str, bytes]:
+        """
+        요청 하나에 대한 (상태 코드, Content-Type, 본문)
+
+        Args:
+            method: HTTP 메서드
+            raw_path: "/{원래 호스트}/{경로}?{쿼리}"
+            headers: 요청 헤더
+            body: 요청 본문
+        """
+        self._count("requests")
+        parts = urlsplit(raw_path)
+        upstream_host, _, path = parts.path.lstrip("/").partition("/")
+        path = "/" + path
+        key = fixture_key(method, upstream_host, path, parts.query, body)
+
+        if self.record:
+            return self._forward(method, upstream_host, path, parts.query, headers, body, key)
+
+        delay, fail = self._injected()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self._count("injected_errors")
+            return 503, "application/json", b'{"error": "injected upstream error"}'
+
+        fixture = self.store.load(upstream_host, key)
+        if fixture is None:
+            self._count("misses")
+            logger.warning(f"픽스처 없음: {method} {upstream_host}{path}?{parts.query} ({key})")
+            message = {"error": "fixture not found", "key": key, "host": upstream_host, "path": path}
+            return 404, "application/json", json.dumps(message).encode()
+        self._count("replayed")
+        return fixture["status"], fixture.get("content_type") or "application/json", FixtureStore.body(fixture)
+
+    def _forward(
+        self, method: str, host: str, path: str, query: str, headers: Dict[str, str], body: bytes, key: str
+    ) -> Tuple[int, str, bytes]:
+        """녹화 모드: 실제 업스트림으로 전달하고 응답 저장 (쿠키는 서버 쪽 세션이 유지)"""
+        url = f"https://{host}{path}" + (f"?{query}" if query else "")
+        forward_headers = {k: v for k, v in headers.items() if k.lower() not in HOP_BY_HOP_HEADERS}
+        forward_headers.setdefault("User-Agent", DEFAULT_HEADERS["User-Agent"])
+        try:
+            response = self._upstream.request(method, url, headers=forward_headers, data=body or None, timeout=30)
+        except requests.RequestException as e:
+            logger.warning(f"녹화 중 업스트림 오류 ({url}): {e}")
+            return 502, "application/json", json.dumps({"error": str(e)}).encode()
+
+        content_type = response.headers.get("Content-Type", "application/octet-stream")
+        # 인증 헤더는 저장하지 않고 요청 식별 정보만 기록
+        request_info = {"method": method, "url": url.split("?")[0], "query": query, "body": _normalized_body(body).decode("utf-8", "replace")}
+        self.store.save(host, key, request_info, response.status_code, content_type, response.content)
+        self._count("recorded")
+        logger.info(f"녹화: {method} {url} → {response.status_code}")
+        return response.status_code, content_type, response.content
+
+    def start(self) -> "ReplayServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.serve_forever, name="upstream-replay", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """서버 중지"""
+        self.shutdown()
+        self.server_close()
+        if self._upstream is not None:
+            self._upstream.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """요청/재생/녹화/미스/주입 오류 횟수"""
+        with self._lock:
+            return dict(self._counts)
+
+
+def main(argv: Optional[list] = None) -> None:
+    """명령줄 실행 (녹화 또는 재생 서버)"""
+    parser = argparse.ArgumentParser(description="Yahoo / Exa 업스트림 녹화·재생 서버")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES_PATH), help="픽스처 디렉토리")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_REPLAY_PORT)
+    parser.add_argument("--record", action="store_true", help="실제 업스트림으로 전달하며 응답 녹화")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="재생 시 평균 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="재생 지연의 표준편차 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="재생 시 503 오류 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=None, help="지연/오류 주입 난수 시드")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    server = ReplayServer(
+        Path(args.fixtures),
+        host=args.host,
+        port=args.port,
+        record=args.record,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    mode = "녹화" if args.record else "재생"
+    logger.info(f"업스트림 {mode} 서버 시작: {server.url} (픽스처: {args.fixtures})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"업스트림 {mode} 서버 종료: {server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
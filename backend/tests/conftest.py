@@ -0,0 +1,21 @@
+"""
+pytest 공통 설정
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_profile_store(tmp_path, monkeypatch):
+    """테스트마다 임시 경로의 프로필 저장소 사용 (실제 output 폴더에 쓰지 않도록)"""
+    monkeypatch.setenv("PROFILE_STORE_PATH", str(tmp_path / "profiles.db"))
+    monkeypatch.setenv("HISTORY_STORE_PATH", str(tmp_path / "history"))
+    monkeypatch.setenv("SEARCH_INDEX_PATH", str(tmp_path / "search_index.tsv.gz"))
+    monkeypatch.setenv("NEWS_CACHE_PATH", str(tmp_path / "news.db"))
+    monkeypatch.setenv("NEWS_INDEX_PATH", str(tmp_path / "news_index.db"))
+    # 공유 실행기의 속도 제한은 테스트 속도에 영향을 주지 않도록 비활성화
+    monkeypatch.setenv("YAHOO_RATE_LIMIT", "0")
+    monkeypatch.setenv("EXA_RATE_LIMIT", "0")
+    # 오류를 흉내 내는 테스트가 공유 서킷 브레이커를 열지 않도록 비활성화
+    monkeypatch.setenv("YAHOO_CIRCUIT_FAILURES", "0")
+    monkeypatch.setenv("EXA_CIRCUIT_FAILURES", "0")
@@ -0,0 +1,55 @@
+"""
+TTLCache 단위 테스트
+TTL 만료, stale 제공, LRU 제거 테스트
+"""
+
+import time
+
+from services.cache import TTLCache, CACHE_HIT, CACHE_STALE, CACHE_MISS
+
+
+class TestTTLCache:
+    """TTLCache 테스트"""
+    
+    def test_hit_and_miss(self):
+        """저장된 키는 hit, 없는 키는 miss인지 테스트"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('TSLA', {'price': 100})
+        
+        assert cache.get('TSLA') == ({'price': 100}, CACHE_HIT)
+        assert cache.get('NVDA') == (None, CACHE_MISS)
+        
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+    
+    def test_stale_within_max_stale(self):
+        """TTL이 지나도 max_stale 이내면 stale로 제공되는지 테스트"""
+        cache = TTLCache(maxsize=10, ttl=0.01, max_stale=60)
+        cache.set('TSLA', 1)
+        time.sleep(0.02)
+        
+        assert cache.get('TSLA') == (1, CACHE_STALE)
+        assert cache.stats()['stale_hits'] == 1
+    
+    def test_expired_after_max_stale(self):
+        """max_stale까지 지나면 miss가 되고 항목이 제거되는지 테스트"""
+        cache = TTLCache(maxsize=10, ttl=0.01, max_stale=0.01)
+        cache.set('TSLA', 1)
+        time.sleep(0.03)
+        
+        assert cache.get('TSLA') == (None, CACHE_MISS)
+        assert len(cache) == 0
+    
+    def test_lru_eviction(self):
+        """크기 초과 시 가장 오래 사용하지 않은 항목이 제거되는지 테스트"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('A', 1)
+        cache.set('B', 2)
+        cache.get('A')  # A를 최근 사용으로 갱신
+        cache.set('C', 3)
+        
+        assert cache.get('B')[1] == CACHE_MISS
+        assert cache.get('A')[1] == CACHE_HIT
+        assert cache.get('C')[1] == CACHE_HIT
+        assert cache.stats()['evictions'] == 1
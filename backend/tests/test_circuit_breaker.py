@@ -0,0 +1,160 @@
+"""
+CircuitBreaker 단위 테스트
+연속 실패 시 회로 열림 / 시험 호출 / 마지막 정상 응답 테스트
+"""
+
+import time
+
+import pytest
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError, LastKnownGood
+from services.upstream_executor import UpstreamExecutor
+
+
+def _fail():
+    raise ConnectionError("upstream down")
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+    
+    def test_opens_after_threshold(self):
+        """연속 실패가 임계값에 도달하면 호출을 즉시 거절하는지 테스트"""
+        breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=60)
+        
+        for _ in range(2):
+            breaker.record_failure(breaker.before_call())
+        assert breaker.state == "closed"
+        
+        breaker.record_failure(breaker.before_call())
+        
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_after > 0
+        assert breaker.stats()['rejected'] == 1
+    
+    def test_success_resets_failure_count(self):
+        """성공하면 연속 실패 횟수가 초기화되는지 테스트"""
+        breaker = CircuitBreaker("test", failure_threshold=2)
+        
+        breaker.record_failure(breaker.before_call())
+        breaker.record_success(breaker.before_call())
+        breaker.record_failure(breaker.before_call())
+        
+        assert breaker.state == "closed"
+    
+    def test_half_open_allows_single_probe(self):
+        """reset_timeout 후 시험 호출 하나만 허용하고, 성공하면 회로를 닫는지 테스트"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure(breaker.before_call())
+        time.sleep(0.06)
+        
+        assert breaker.state == "half_open"
+        probe = breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        
+        breaker.record_success(probe)
+        
+        assert breaker.state == "closed"
+        breaker.before_call()
+    
+    def test_failed_probe_reopens(self):
+        """시험 호출이 실패하면 다시 열리는지 테스트"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure(breaker.before_call())
+        time.sleep(0.06)
+        
+        breaker.record_failure(breaker.before_call())
+        
+        assert breaker.state == "open"
+        assert breaker.stats()['opens'] == 2
+    
+    def test_only_probe_closes_circuit(self):
+        """회로가 열리기 전에 시작된 호출의 늦은 성공/실패는 회로 상태를 바꾸지 않는지 테스트"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        slow = breaker.before_call()
+        breaker.record_failure(breaker.before_call())
+        
+        breaker.record_success(slow)
+        assert breaker.state == "open"
+        
+        time.sleep(0.06)
+        probe = breaker.before_call()
+        breaker.record_failure(slow)
+        breaker.record_success(slow)
+        assert breaker.state == "half_open"
+        
+        breaker.record_success(probe)
+        assert breaker.state == "closed"
+    
+    def test_expired_probe_result_ignored(self):
+        """만료된 시험 호출의 늦은 성공은 새 시험 호출 중인 회로를 닫지 않는지 테스트"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure(breaker.before_call())
+        time.sleep(0.06)
+        expired = breaker.before_call()
+        time.sleep(0.06)
+        probe = breaker.before_call()
+        
+        breaker.record_success(expired)
+        assert breaker.state == "half_open"
+        
+        breaker.record_failure(probe)
+        assert breaker.state == "open"
+    
+    def test_disabled_when_threshold_zero(self):
+        """failure_threshold가 0이면 실패해도 열리지 않는지 테스트"""
+        breaker = CircuitBreaker("test", failure_threshold=0)
+        
+        for _ in range(10):
+            breaker.record_failure(breaker.before_call())
+        
+        breaker.before_call()
+        assert breaker.state == "closed"
+
+
+class TestExecutorCircuitBreaker:
+    """UpstreamExecutor 서킷 브레이커 연동 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_upstream(self):
+        """회로가 열리면 업스트림 함수를 호출하지 않고 즉시 실패하는지 테스트"""
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=60)
+        executor = UpstreamExecutor("test", max_workers=1, circuit_breaker=breaker)
+        calls = []
+        
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await executor.run(_fail)
+        with pytest.raises(CircuitOpenError):
+            await executor.run(calls.append, 1)
+        
+        assert calls == []
+        assert breaker.state == "open"
+
+
+class TestLastKnownGood:
+    """LastKnownGood 테스트"""
+    
+    def test_recall_flags_age(self):
+        """저장한 응답을 stale 표시와 경과 시간을 붙여 돌려주는지 테스트"""
+        store = LastKnownGood()
+        value = {"ticker": "TSLA", "price": 400.0, "status": "success"}
+        store.remember(("quote", "TSLA"), value)
+        
+        recalled = store.recall(("quote", "TSLA"))
+        
+        assert recalled["price"] == 400.0
+        assert recalled["stale"] is True
+        assert recalled["data_age_seconds"] >= 0
+        assert "stale" not in value
+        assert store.recall(("quote", "NVDA")) is None
+    
+    def test_recall_respects_max_age(self):
+        """max_age가 지난 응답은 제공하지 않는지 테스트"""
+        store = LastKnownGood(max_age=0.01)
+        store.remember("key", {"status": "success"})
+        time.sleep(0.02)
+        
+        assert store.recall("key") is None
@@ -0,0 +1,101 @@
+"""
+뉴스 종목 태깅 테스트
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.entity_tagger import EntityTagger
+from services.search_index import SearchIndex
+
+
+@pytest.fixture
+def tagger():
+    return EntityTagger([
+        ('TSLA', 'Tesla, Inc.', 100.0),
+        ('NVDA', 'NVIDIA Corporation', 90.0),
+        ('AAPL', 'Apple Inc.', 95.0),
+        ('GOOGL', 'Alphabet Inc. Class A', 80.0),
+        ('GOOG', 'Alphabet Inc. Class C', 70.0),
+        ('BAC', 'Bank of America Corporation', 40.0),
+        ('BA', 'The Boeing Company', 30.0),
+        ('BRK-B', 'Berkshire Hathaway Inc.', 60.0),
+        ('T', 'AT&T Inc.', 50.0),
+        ('AI', 'C3.ai, Inc.', 10.0),
+    ])
+
+
+class TestTag:
+    """텍스트 태깅 테스트"""
+
+    def test_names_and_symbols_in_order(self, tagger):
+        """회사명과 종목 코드를 처음 언급된 순서대로 찾는지 테스트"""
+        assert tagger.tag("Nvidia rallies while TSLA and Apple slip") == ['NVDA', 'TSLA', 'AAPL']
+
+    def test_suffixes_and_multiword_names(self, tagger):
+        """법인 형태를 뺀 회사명과 여러 단어 회사명 일치 테스트"""
+        assert tagger.tag("Bank of America and The Boeing Co. report earnings") == ['BAC', 'BA']
+
+    def test_shared_name_uses_most_popular_symbol(self, tagger):
+        """같은 회사명의 여러 종목은 인기도가 높은 종목으로 태깅하는지 테스트"""
+        assert tagger.tag("Alphabet beats estimates") == ['GOOGL']
+
+    def test_word_boundaries(self, tagger):
+        """단어 일부에는 일치하지 않는지 테스트"""
+        assert tagger.tag("Teslas and Appleton") == []
+
+    def test_case_rules(self, tagger):
+        """소문자 종목 코드와 소문자 한 단어 회사명은 무시하는지 테스트"""
+        assert tagger.tag("tsla holders eat apple pie") == []
+
+    def test_ambiguous_symbols_need_cashtag(self, tagger):
+        """한 글자/일반 단어 종목 코드는 캐시태그일 때만 태깅하는지 테스트"""
+        assert tagger.tag("T-Mobile says AI demand is strong") == []
+        assert tagger.tag("$T and $AI jump") == ['T', 'AI']
+
+    def test_multi_token_symbol(self, tagger):
+        """구분자가 있는 종목 코드 테스트"""
+        assert tagger.tag("BRK.B hits a record; $brk-b") == ['BRK-B']
+
+    def test_non_ascii_text(self, tagger):
+        """비ASCII 문장부호 사이의 이름도 찾는지 테스트"""
+        assert tagger.tag("“Tesla” — 테슬라 NVIDIA’s chips") == ['TSLA', 'NVDA']
+
+    def test_empty_dictionary(self):
+        """사전이 비어 있으면 빈 결과"""
+        assert EntityTagger().tag("Tesla") == []
+
+
+class TestTagArticles:
+    """기사 목록 태깅 테스트"""
+
+    def test_primary_first_and_summary_scanned(self, tagger):
+        """검색한 종목을 맨 앞에 두고 요약까지 훑는지 테스트"""
+        articles = [{'title': 'EV stocks rally', 'summary': 'Tesla and Nvidia led gains.', 'url': 'https://a.com/1'}]
+
+        tagged = tagger.tag_articles(articles, primary='NVDA')
+
+        assert tagged[0]['related_tickers'] == ['NVDA', 'TSLA']
+        assert 'related_tickers' not in articles[0]
+
+    def test_summary_placeholder(self, tagger):
+        """요약이 없거나 "N/A"여도 제목으로 태깅하는지 테스트"""
+        tagged = tagger.tag_articles([{'title': 'Apple event', 'summary': None}, {'title': 'N/A', 'summary': 'N/A'}])
+
+        assert [a['related_tickers'] for a in tagged] == [['AAPL'], []]
+
+
+def test_load_from_search_index_file(tmp_path):
+    """저장된 종목 검색 인덱스 파일로 태거를 만드는지 테스트"""
+    path = tmp_path / 'search_index.tsv.gz'
+    SearchIndex([('MSFT', 'Microsoft Corporation', 1.0)]).save(path)
+
+    tagger = EntityTagger.load(path)
+
+    assert len(tagger) == 1
+    assert tagger.tag('Microsoft raises dividend') == ['MSFT']
+    assert len(EntityTagger.load(tmp_path / 'missing.tsv.gz')) == 0
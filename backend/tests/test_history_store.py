@@ -0,0 +1,89 @@
+"""
+HistoryStore 단위 테스트
+종목별 컬럼형 일봉 저장소 테스트
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from services.history_store import HistoryStore, latest_trading_day
+
+
+def make_bars(dates, closes):
+    """테스트용 일봉 딕셔너리 생성"""
+    closes = np.asarray(closes, dtype=np.float64)
+    return {
+        'date': np.array(dates, dtype='datetime64[D]'),
+        'open': closes - 1,
+        'high': closes + 1,
+        'low': closes - 2,
+        'close': closes,
+        'volume': np.full(closes.shape, 1000.0),
+    }
+
+
+class TestHistoryStore:
+    """HistoryStore 테스트"""
+    
+    def test_append_and_read(self, tmp_path):
+        """저장한 일봉을 그대로 조회하는지 테스트"""
+        store = HistoryStore(tmp_path)
+        added = store.append('TSLA', make_bars(['2025-01-02', '2025-01-03'], [100.0, 101.0]))
+        
+        history = store.read('tsla')
+        
+        assert added == 2
+        assert len(history) == 2
+        assert history.dates.tolist() == list(np.array(['2025-01-02', '2025-01-03'], dtype='datetime64[D]'))
+        assert history.close.tolist() == [100.0, 101.0]
+        assert store.last_date('TSLA') == np.datetime64('2025-01-03')
+    
+    def test_incremental_append_replaces_overlap(self, tmp_path):
+        """겹치는 거래일은 새 값으로 교체되고 새 봉만 추가되는지 테스트"""
+        store = HistoryStore(tmp_path)
+        store.append('TSLA', make_bars(['2025-01-02', '2025-01-03'], [100.0, 101.0]))
+        
+        added = store.append('TSLA', make_bars(['2025-01-03', '2025-01-06'], [105.0, 106.0]))
+        
+        assert added == 1
+        assert store.read('TSLA').close.tolist() == [100.0, 105.0, 106.0]
+    
+    def test_read_range_is_zero_copy(self, tmp_path):
+        """기간 조회가 메모리 맵 파일의 뷰를 반환하는지 테스트"""
+        store = HistoryStore(tmp_path)
+        store.append('TSLA', make_bars(['2025-01-02', '2025-01-03', '2025-01-06'], [1.0, 2.0, 3.0]))
+        
+        history = store.read('TSLA', start='2025-01-03', end='2025-01-05')
+        
+        assert history.close.tolist() == [2.0]
+        assert isinstance(history.close, np.memmap)
+        assert not history.close.flags.writeable
+    
+    def test_missing_symbol(self, tmp_path):
+        """저장되지 않은 종목은 None을 반환하는지 테스트"""
+        store = HistoryStore(tmp_path)
+        
+        assert store.read('NVDA') is None
+        assert store.last_date('NVDA') is None
+    
+    def test_symbols_and_stats(self, tmp_path):
+        """저장된 종목 목록과 통계 테스트"""
+        store = HistoryStore(tmp_path)
+        store.append('BRK-B', make_bars(['2025-01-02'], [1.0]))
+        store.append('TSLA', make_bars(['2025-01-02'], [1.0]))
+        
+        assert store.symbols() == ['BRK-B', 'TSLA']
+        assert store.stats()['symbols'] == 2
+
+
+@pytest.mark.parametrize("now, expected", [
+    (datetime(2025, 1, 8, 17, 0), '2025-01-08'),  # 수요일 장 마감 후
+    (datetime(2025, 1, 8, 10, 0), '2025-01-07'),  # 수요일 장중 → 전날
+    (datetime(2025, 1, 6, 9, 0), '2025-01-03'),   # 월요일 개장 전 → 금요일
+    (datetime(2025, 1, 5, 18, 0), '2025-01-03'),  # 일요일 → 금요일
+])
+def test_latest_trading_day(now, expected):
+    """장이 마감된 가장 최근 평일을 반환하는지 테스트"""
+    assert latest_trading_day(now) == np.datetime64(expected)
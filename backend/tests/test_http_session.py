@@ -0,0 +1,33 @@
+"""
+공유 HTTP 세션 테스트
+"""
+
+from services.http_session import TimeoutHTTPAdapter, create_pooled_session
+
+
+class TestCreatePooledSession:
+    """create_pooled_session 함수 테스트"""
+
+    def test_adapter_pool_and_retry(self):
+        """커넥션 풀 크기와 재시도 설정이 어댑터에 반영되는지 테스트"""
+        session = create_pooled_session(pool_size=4, timeout=2.5, retries=3)
+
+        adapter = session.get_adapter("https://query2.finance.yahoo.com")
+
+        assert isinstance(adapter, TimeoutHTTPAdapter)
+        assert adapter.timeout == 2.5
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 3
+        assert 429 not in adapter.max_retries.status_forcelist
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_default_timeout_applied(self, mocker):
+        """timeout 미지정 요청에 기본 timeout이 적용되는지 테스트"""
+        adapter = TimeoutHTTPAdapter(timeout=1.5)
+        send = mocker.patch("requests.adapters.HTTPAdapter.send")
+
+        adapter.send(mocker.Mock())
+        adapter.send(mocker.Mock(), timeout=10)
+
+        assert send.call_args_list[0].kwargs["timeout"] == 1.5
+        assert send.call_args_list[1].kwargs["timeout"] == 10
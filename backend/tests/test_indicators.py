@@ -0,0 +1,103 @@
+"""
+기술적 지표 단위 테스트
+배열 연산 결과를 단순 계산 결과와 비교
+"""
+
+import numpy as np
+import pytest
+
+from services.history_store import PriceHistory
+from services.indicators import atr, compute_indicators, rsi, sma, stack, volatility, volume_zscore
+
+
+def make_history(symbol, close, volume=None):
+    """종가/거래량으로 PriceHistory 생성 (고가/저가는 종가 ±1)"""
+    close = np.asarray(close, dtype=np.float64)
+    data = np.empty((6, close.size))
+    data[0] = np.arange(close.size) + 20000
+    data[1] = close
+    data[2] = close + 1
+    data[3] = close - 1
+    data[4] = close
+    data[5] = volume if volume is not None else np.full(close.size, 1000.0)
+    return PriceHistory(symbol, data)
+
+
+class TestRollingIndicators:
+    """이동 지표 함수 테스트"""
+    
+    def test_sma_matches_naive(self):
+        """이동평균이 구간 평균과 같은지 테스트"""
+        values = np.arange(1.0, 11.0)
+        
+        result = sma(values, 3)
+        
+        assert np.isnan(result[:2]).all()
+        assert result[2:].tolist() == pytest.approx([values[i - 2:i + 1].mean() for i in range(2, 10)])
+    
+    def test_stack_right_aligns_with_nan_padding(self):
+        """길이가 다른 배열이 마지막 봉 기준으로 정렬되고 NaN 구간은 지표에서 제외되는지 테스트"""
+        matrix = stack([np.array([1.0, 2.0, 3.0]), np.array([5.0])])
+        
+        assert np.isnan(matrix[1, :2]).all()
+        assert sma(matrix, 2)[:, -1][0] == 2.5
+        assert np.isnan(sma(matrix, 2)[1, -1])
+    
+    def test_rsi_bounds(self):
+        """상승만 있으면 100, 하락만 있으면 0, 변동이 없으면 50인지 테스트"""
+        rising = np.arange(1.0, 30.0)
+        
+        assert rsi(rising)[-1] == 100.0
+        assert rsi(rising[::-1])[-1] == 0.0
+        assert rsi(np.full(30, 10.0))[-1] == 50.0
+    
+    def test_rsi_matches_naive(self):
+        """RSI가 최근 14개 변동의 평균 상승/하락폭으로 계산되는지 테스트"""
+        close = 100 + np.cumsum(np.random.default_rng(1).normal(0, 1, 60))
+        change = np.diff(close)[-14:]
+        gain, loss = change.clip(min=0).mean(), (-change).clip(min=0).mean()
+        
+        assert rsi(close)[-1] == pytest.approx(100 - 100 / (1 + gain / loss))
+    
+    def test_atr_uses_previous_close(self):
+        """True Range가 전일 종가와의 차이를 반영하는지 테스트"""
+        high = np.array([10.0, 11.0, 20.0])
+        low = np.array([9.0, 10.0, 19.0])
+        close = np.array([9.5, 10.5, 19.5])
+        
+        assert atr(high, low, close, period=2)[-1] == pytest.approx((1.5 + 9.5) / 2)
+    
+    def test_volatility_and_volume_zscore_match_naive(self):
+        """변동성과 거래량 z-score가 단순 계산과 같은지 테스트"""
+        rng = np.random.default_rng(2)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 60)))
+        volume = rng.integers(1_000_000, 5_000_000, 60).astype(float)
+        returns = np.diff(np.log(close))[-20:]
+        previous = volume[-21:-1]
+        
+        assert volatility(close)[-1] == pytest.approx(returns.std(ddof=1) * np.sqrt(252))
+        assert volume_zscore(volume)[-1] == pytest.approx((volume[-1] - previous.mean()) / previous.std(ddof=1))
+
+
+class TestComputeIndicators:
+    """compute_indicators 함수 테스트"""
+    
+    def test_multiple_symbols_at_once(self):
+        """여러 종목을 한 번에 계산하고 봉이 부족한 지표는 None인지 테스트"""
+        histories = {
+            'LONG': make_history('LONG', np.linspace(100, 200, 250)),
+            'SHORT': make_history('SHORT', np.linspace(50, 40, 30)),
+        }
+        
+        result = compute_indicators(histories)
+        
+        assert result['LONG']['bars'] == 250
+        assert result['LONG']['ma_200'] == pytest.approx(np.linspace(100, 200, 250)[-200:].mean(), rel=1e-6)
+        assert result['LONG']['rsi_14'] == 100.0
+        assert result['SHORT']['ma_20'] is not None
+        assert result['SHORT']['ma_50'] is None
+        assert result['SHORT']['rsi_14'] == 0.0
+    
+    def test_empty_histories(self):
+        """히스토리가 없으면 빈 결과를 반환하는지 테스트"""
+        assert compute_indicators({'TSLA': None}) == {}
@@ -0,0 +1,106 @@
+"""
+MarketSnapshot 단위 테스트
+컬럼형 시장 스냅샷의 마스크 스크리닝 테스트
+"""
+
+import pytest
+
+from services.market_snapshot import MarketSnapshot
+
+
+def make_snapshot():
+    """테스트용 스냅샷 (AAA~DDD)"""
+    stocks = [
+        {'ticker': 'AAA', 'sector': 'Technology'},
+        {'ticker': 'BBB', 'sector': 'Energy'},
+        {'ticker': 'CCC', 'sector': 'Technology'},
+        {'ticker': 'DDD', 'sector': 'N/A'},
+    ]
+    columns = {
+        'price': [10.0, 50.0, 200.0, 5.0],
+        'change_percent': [1.0, -3.0, 4.0, None],
+        'volume': [100.0, 500.0, 300.0, 50.0],
+        'avg_volume': [100.0, 100.0, None, 10.0],
+        'market_cap': [1e9, 5e10, 2e12, None],
+        'pe_ratio': [None, 8.0, 40.0, None],
+    }
+    return MarketSnapshot(stocks, columns)
+
+
+def tickers(snapshot, indices):
+    return [snapshot.stocks[i]['ticker'] for i in indices]
+
+
+class TestMarketSnapshot:
+    """MarketSnapshot 테스트"""
+    
+    def test_range_criteria(self):
+        """범위 조건이 모두 AND로 적용되는지 테스트"""
+        snapshot = make_snapshot()
+        
+        indices = snapshot.screen({'min_price': 10, 'max_price': 100})
+        
+        assert tickers(snapshot, indices) == ['BBB', 'AAA']
+    
+    def test_missing_values_excluded(self):
+        """값이 없는 종목은 해당 컬럼 조건에서 제외되는지 테스트"""
+        snapshot = make_snapshot()
+        
+        assert tickers(snapshot, snapshot.screen({'min_volume_ratio': 1})) == ['BBB', 'AAA', 'DDD']
+        assert tickers(snapshot, snapshot.screen({'min_market_cap': 0})) == ['BBB', 'CCC', 'AAA']
+    
+    def test_sector_filter_case_insensitive(self):
+        """섹터 조건이 대소문자 구분 없이 적용되는지 테스트"""
+        snapshot = make_snapshot()
+        
+        assert tickers(snapshot, snapshot.screen({'sectors': ['technology']})) == ['CCC', 'AAA']
+        assert snapshot.screen({'sectors': ['Utilities']}).size == 0
+    
+    def test_sort_and_limit(self):
+        """정렬 방향과 limit, NaN 정렬 위치 테스트"""
+        snapshot = make_snapshot()
+        
+        ascending = snapshot.screen({'sort_by': 'change_percent', 'descending': False})
+        top = snapshot.screen({'sort_by': 'price', 'limit': 2})
+        
+        assert tickers(snapshot, ascending) == ['BBB', 'AAA', 'CCC', 'DDD']
+        assert tickers(snapshot, top) == ['CCC', 'BBB']
+    
+    def test_invalid_criteria(self):
+        """알 수 없는 조건이나 정렬 컬럼은 ValueError인지 테스트"""
+        snapshot = make_snapshot()
+        
+        with pytest.raises(ValueError):
+            snapshot.screen({'minPrice': 10})
+        with pytest.raises(ValueError):
+            snapshot.screen({'sort_by': 'name'})
+    
+    def test_rows_include_volume_ratio(self):
+        """결과 행에 거래량 비율이 포함되는지 테스트"""
+        snapshot = make_snapshot()
+        
+        rows = snapshot.rows([1, 2])
+        
+        assert rows[0] == {'ticker': 'BBB', 'sector': 'Energy', 'volume_ratio': 5.0}
+        assert rows[1]['volume_ratio'] is None
+    
+    def test_empty_snapshot(self):
+        """빈 스냅샷은 항상 만료 상태이고 결과가 없는지 테스트"""
+        snapshot = MarketSnapshot.empty()
+        
+        assert snapshot.age > 1e9
+        assert snapshot.screen({'min_price': 1}).size == 0
+    
+    def test_rankings_precomputed(self):
+        """순위별 정렬 인덱스가 미리 계산되고 조건에 맞는 종목만 포함하는지 테스트"""
+        snapshot = make_snapshot()
+        
+        assert tickers(snapshot, snapshot.top('most_actives', 2)) == ['BBB', 'CCC']
+        assert tickers(snapshot, snapshot.top('day_gainers', 10)) == ['CCC', 'AAA']
+        assert tickers(snapshot, snapshot.top('day_losers', 10)) == ['BBB']
+        assert tickers(snapshot, snapshot.top('unusual_volume', 10)) == ['BBB', 'DDD']
+    
+    def test_unknown_ranking(self):
+        """알 수 없는 순위는 ValueError인지 테스트"""
+        with pytest.raises(ValueError):
+            make_snapshot().top('most_watched', 5)
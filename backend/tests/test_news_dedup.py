@@ -0,0 +1,159 @@
+"""
+뉴스 중복 제거 테스트
+"""
+
+import random
+
+import pytest
+import sys
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services import news_dedup
+from services.news_dedup import (
+    MAX_HAMMING_DISTANCE, SIMHASH_BUCKET_SIZE, _BANDS, _SimHashIndex,
+    canonical_url, dedupe_articles, hamming_distance, simhash,
+)
+
+
+SUMMARY = (
+    "Tesla delivered a record number of vehicles in the third quarter, beating analyst estimates "
+    "as demand for the Model Y held up in China and Europe."
+)
+
+
+def _article(title, url, summary="N/A"):
+    return {"title": title, "url": url, "published_date": "N/A", "summary": summary}
+
+
+class TestCanonicalUrl:
+    """URL 정규화 테스트"""
+
+    @pytest.mark.parametrize("url", [
+        "https://www.reuters.com/business/tesla-deliveries",
+        "http://reuters.com/business/tesla-deliveries/",
+        "https://reuters.com/business/tesla-deliveries?utm_source=twitter&utm_medium=social",
+        "https://reuters.com/business/tesla-deliveries#comments",
+        "https://amp.reuters.com/business/tesla-deliveries",
+        "https://reuters.com/business/tesla-deliveries/amp/",
+        "https://reuters.com/amp/business/tesla-deliveries",
+        "https://m.reuters.com/business/tesla-deliveries?fbclid=abc",
+    ])
+    def test_variants_collapse(self, url):
+        """추적 파라미터/AMP/모바일 변형이 같은 URL로 정규화되는지 테스트"""
+        assert canonical_url(url) == "https://reuters.com/business/tesla-deliveries"
+
+    def test_meaningful_query_kept_and_sorted(self):
+        """기사를 구분하는 쿼리 파라미터는 남기고 정렬하는지 테스트"""
+        assert canonical_url("https://example.com/view?page=2&id=7&utm_campaign=x") == "https://example.com/view?id=7&page=2"
+
+    def test_amp_html_suffix(self):
+        """.amp.html 변형 정규화 테스트"""
+        assert canonical_url("https://cnn.com/2026/01/01/tesla.amp.html") == "https://cnn.com/2026/01/01/tesla.html"
+
+    def test_invalid_url_unchanged(self):
+        """해석할 수 없는 URL은 그대로 반환하는지 테스트"""
+        assert canonical_url("N/A") == "N/A"
+        assert canonical_url("") == ""
+
+
+class TestSimHash:
+    """SimHash 테스트"""
+
+    def test_similar_titles_close(self):
+        """한 단어만 다른 제목은 해밍 거리가 가까운지 테스트"""
+        a = simhash("Tesla shares jump after record deliveries beat Wall Street estimates")
+        b = simhash("Tesla shares jump after record deliveries beat Wall Street's estimates")
+        c = simhash("Nvidia unveils new AI chip at GTC conference")
+
+        assert hamming_distance(a, b) < hamming_distance(a, c)
+
+    def test_empty_text(self):
+        """특징이 없는 텍스트는 0"""
+        assert simhash("") == 0
+        assert simhash("...") == 0
+
+
+class TestSimHashIndex:
+    """SimHash 후보 색인 테스트"""
+
+    def test_finds_all_within_max_distance(self):
+        """최대 거리만큼 다른 해시도 놓치지 않는지 테스트"""
+        rng = random.Random(0)
+        for _ in range(500):
+            fingerprint = rng.getrandbits(64)
+            index = _SimHashIndex()
+            index.add(fingerprint)
+            *flipped, extra = rng.sample(range(64), MAX_HAMMING_DISTANCE + 1)
+            near = fingerprint ^ sum(1 << bit for bit in flipped)
+
+            assert index.contains_near(near)
+            assert not index.contains_near(near ^ (1 << extra))
+
+    def test_comparisons_bounded(self, mocker):
+        """같은 버킷에 해시가 몰려도 조회당 비교 횟수가 기사 수와 무관하게 제한되는지 테스트"""
+        rng = random.Random(0)
+        index = _SimHashIndex()
+        # 첫 밴드 값이 모두 0인 해시
+        for _ in range(2000):
+            index.add(rng.getrandbits(64) & ~_BANDS[0][1])
+        compare = mocker.patch.object(news_dedup, 'hamming_distance', side_effect=hamming_distance)
+
+        for _ in range(100):
+            compare.reset_mock()
+            index.contains_near(rng.getrandbits(64) & ~_BANDS[0][1])
+            assert compare.call_count <= sum(len(probes) for _, _, probes in _BANDS) * SIMHASH_BUCKET_SIZE
+
+
+class TestDedupeArticles:
+    """기사 목록 중복 제거 테스트"""
+
+    def test_same_canonical_url_removed(self):
+        """정규화 URL이 같은 기사는 먼저 나온 것만 남는지 테스트"""
+        articles = [
+            _article("Tesla deliveries beat estimates", "https://www.reuters.com/tesla?utm_source=x"),
+            _article("Different headline for the same page", "https://reuters.com/tesla/amp"),
+        ]
+
+        assert dedupe_articles(articles) == articles[:1]
+
+    def test_syndicated_title_removed(self):
+        """다른 매체에 거의 같은 제목으로 배포된 기사를 제거하는지 테스트"""
+        articles = [
+            _article("Tesla shares jump after record deliveries beat Wall Street estimates", "https://a.com/1"),
+            _article("Nvidia unveils new AI chip at GTC conference", "https://b.com/2"),
+            _article("Tesla shares jump after record deliveries beat Wall Street's estimates", "https://c.com/3"),
+        ]
+
+        assert [a["url"] for a in dedupe_articles(articles)] == ["https://a.com/1", "https://b.com/2"]
+
+    def test_same_summary_removed(self):
+        """제목이 달라도 요약이 같으면 같은 기사로 보는지 테스트"""
+        articles = [
+            _article("Tesla beats delivery estimates", "https://a.com/1", SUMMARY),
+            _article("EV maker posts record quarter", "https://b.com/2", SUMMARY),
+        ]
+
+        assert len(dedupe_articles(articles)) == 1
+
+    def test_distinct_stories_kept_in_order(self):
+        """서로 다른 기사는 모두 순서대로 남는지 테스트"""
+        articles = [
+            _article("Tesla shares jump after record deliveries", "https://a.com/1"),
+            _article("Tesla shares fall after deliveries miss estimates", "https://a.com/2"),
+            _article("Apple unveils new iPhone at September event", "https://a.com/3"),
+            _article("Fed holds rates steady, signals cuts later this year", "https://a.com/4"),
+        ]
+
+        assert dedupe_articles(articles) == articles
+
+    def test_short_summaries_not_compared(self):
+        """짧은 요약("본문" 등)이 같다는 이유만으로 제거하지 않는지 테스트"""
+        articles = [
+            _article("Tesla shares jump", "https://a.com/1", "본문"),
+            _article("Apple unveils iPhone", "https://a.com/2", "본문"),
+        ]
+
+        assert dedupe_articles(articles) == articles
@@ -0,0 +1,98 @@
+"""
+로컬 뉴스 전문 검색 색인 테스트
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.news_index import NewsIndex
+
+
+def _article(title, url, published_date="2026-01-10T12:00:00.000Z", summary="N/A"):
+    return {"title": title, "url": url, "published_date": published_date, "summary": summary}
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = NewsIndex(tmp_path / "news_index.db")
+    index.add_articles([
+        _article("Tesla deliveries beat estimates", "https://a.com/1", "2026-01-10T12:00:00.000Z",
+                 "Tesla delivered a record number of vehicles."),
+        _article("Nvidia unveils new AI chip", "https://a.com/2", "2026-01-05T09:00:00.000Z",
+                 "The chip targets data centers; Tesla is a customer."),
+    ], tickers=["TSLA"])
+    index.add_articles([
+        _article("Nvidia unveils new AI chip", "https://www.a.com/2?utm_source=x"),
+        _article("Fed holds rates steady", "https://b.com/3", "2026-01-08T18:00:00.000Z"),
+    ], tickers=["nvda"])
+    # BM25 IDF가 의미 있도록 관련 없는 기사 추가
+    index.add_articles([_article(f"Market wrap day {i}", f"https://c.com/{i}") for i in range(5)])
+    return index
+
+
+class TestAddArticles:
+    """색인 추가 테스트"""
+
+    def test_same_canonical_url_indexed_once(self, index):
+        """정규화 URL이 같은 기사는 한 번만 색인하고 종목만 추가로 연결하는지 테스트"""
+        results = index.search("nvidia")
+
+        assert len(results) == 1
+        assert results[0]["tickers"] == ["NVDA", "TSLA"]
+        assert index.stats()["articles"] == 8
+
+    def test_returns_added_count(self, tmp_path):
+        """새로 색인된 기사 수를 반환하는지 테스트"""
+        index = NewsIndex(tmp_path / "news_index.db")
+        articles = [_article("Tesla rallies", "https://a.com/1"), _article("Apple slips", "https://a.com/2")]
+
+        assert index.add_articles(articles) == 2
+        assert index.add_articles(articles) == 0
+
+    def test_persists_across_instances(self, index):
+        """파일에 저장되어 다른 인스턴스에서도 검색되는지 테스트"""
+        assert NewsIndex(index.path).search("fed")[0]["url"] == "https://b.com/3"
+
+
+class TestSearch:
+    """BM25 검색 및 필터 테스트"""
+
+    def test_title_match_ranked_first(self, index):
+        """제목 일치가 요약 일치보다 먼저 오는지 테스트"""
+        results = index.search("tesla")
+
+        assert [r["url"] for r in results] == ["https://a.com/1", "https://a.com/2"]
+        assert results[0]["score"] > results[1]["score"]
+
+    def test_all_terms_required_and_stemmed(self, index):
+        """모든 단어를 포함해야 하고 어간이 같으면 일치하는지 테스트"""
+        assert [r["url"] for r in index.search("tesla delivery")] == ["https://a.com/1"]
+        assert index.search("tesla fed") == []
+
+    def test_ticker_filter(self, index):
+        """종목 필터 테스트"""
+        assert index.search("fed", tickers=["TSLA"]) == []
+        assert [r["url"] for r in index.search("fed", tickers=["nvda"])] == ["https://b.com/3"]
+        assert index.search("fed", tickers=[]) == []
+
+    def test_date_filter(self, index):
+        """발행 시각 필터 테스트 (since 포함, until 미포함)"""
+        assert [r["url"] for r in index.search("tesla", since="2026-01-06")] == ["https://a.com/1"]
+        assert [r["url"] for r in index.search("tesla", until="2026-01-10")] == ["https://a.com/2"]
+
+    def test_fts_syntax_ignored(self, index):
+        """FTS 문법 문자가 오류를 일으키지 않는지 테스트"""
+        assert index.search('"tesla*" (') != []
+        assert index.search("!!!") == []
+
+    def test_disabled_index(self):
+        """경로가 없으면 비활성화되어 빈 결과를 반환하는지 테스트"""
+        index = NewsIndex(None)
+
+        assert index.add_articles([_article("Tesla", "https://a.com/1")]) == 0
+        assert index.search("tesla") == []
+        assert index.stats()["enabled"] is False
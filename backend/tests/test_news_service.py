@@ -0,0 +1,388 @@
+"""
+NewsService 단위 테스트
+여러 종목 뉴스 동시 조회 테스트
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import MagicMock
+import services.news_service as news_service_module
+from services.news_service import NewsService, get_news_service
+
+
+def _fake_search(delays):
+    """종목별 지연 후 성공 응답을 돌려주는 search_stock_news 대역"""
+    peak = {"now": 0, "max": 0}
+    
+    async def search(ticker, limit=5):
+        peak["now"] += 1
+        peak["max"] = max(peak["max"], peak["now"])
+        try:
+            await asyncio.sleep(delays.get(ticker, 0.05))
+            return {"status": "success", "ticker": ticker, "count": limit, "news": []}
+        finally:
+            peak["now"] -= 1
+    
+    return search, peak
+
+
+class TestBulkNews:
+    """search_stock_news_bulk / iter_stock_news 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_bulk_runs_concurrently(self, mocker):
+        """여러 종목 검색 시간이 합이 아니라 가장 느린 검색에 가까운지 테스트"""
+        service = NewsService()
+        tickers = [f"T{i}" for i in range(8)]
+        search, _ = _fake_search({ticker: 0.1 for ticker in tickers})
+        mocker.patch.object(service, 'search_stock_news', side_effect=search)
+        
+        started = time.monotonic()
+        results = await service.search_stock_news_bulk(tickers + ['t0'], limit=3)
+        elapsed = time.monotonic() - started
+        
+        assert elapsed < 0.4
+        assert list(results) == tickers
+        assert results['T0']['count'] == 3
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_semaphore(self, mocker, monkeypatch):
+        """동시 검색 수가 NEWS_CONCURRENCY를 넘지 않는지 테스트"""
+        monkeypatch.setenv("NEWS_CONCURRENCY", "3")
+        service = NewsService()
+        search, peak = _fake_search({})
+        mocker.patch.object(service, 'search_stock_news', side_effect=search)
+        
+        results = await service.search_stock_news_bulk([f"T{i}" for i in range(10)])
+        
+        assert len(results) == 10
+        assert peak["max"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_iter_yields_in_completion_order(self, mocker):
+        """먼저 끝난 종목부터 반환하는지 테스트"""
+        service = NewsService()
+        search, _ = _fake_search({'SLOW': 0.2, 'FAST': 0.01, 'MID': 0.08})
+        mocker.patch.object(service, 'search_stock_news', side_effect=search)
+        
+        order = [ticker async for ticker, _ in service.iter_stock_news(['SLOW', 'FAST', 'MID'])]
+        
+        assert order == ['FAST', 'MID', 'SLOW']
+    
+    @pytest.mark.asyncio
+    async def test_stopping_iteration_cancels_pending(self, mocker):
+        """반복을 중간에 멈추면 남은 검색이 취소되는지 테스트"""
+        service = NewsService()
+        search, peak = _fake_search({'SLOW': 5.0, 'FAST': 0.01})
+        mocker.patch.object(service, 'search_stock_news', side_effect=search)
+        
+        updates = service.iter_stock_news(['SLOW', 'FAST'])
+        first, _ = await updates.__anext__()
+        await updates.aclose()
+        await asyncio.sleep(0)
+        
+        assert first == 'FAST'
+        assert peak["now"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_stock_news_bulk_formats_per_ticker(self, mocker, monkeypatch):
+        """get_stock_news_bulk가 세마포어 안에서 조회하고 종목별 뉴스 목록으로 변환하는지 테스트"""
+        monkeypatch.setenv("NEWS_CONCURRENCY", "2")
+        service = NewsService()
+        service.client = MagicMock()
+        search, peak = _fake_search({})
+        
+        async def with_news(ticker, limit=5):
+            result = await search(ticker, limit)
+            if ticker == 'FAIL':
+                return {"status": "error", "message": "실패", "data": None}
+            return {**result, "news": [{"title": f"{ticker} news", "url": "u", "published_date": "d", "summary": "s"}]}
+        
+        mocker.patch.object(service, 'search_stock_news', side_effect=with_news)
+        
+        results = await service.get_stock_news_bulk(['AAPL', 'fail', 'TSLA', 'MSFT', 'aapl'])
+        
+        assert list(results) == ['AAPL', 'FAIL', 'TSLA', 'MSFT']
+        assert results['AAPL'][0]["title"] == "AAPL news"
+        assert results['AAPL'][0]["related_tickers"] == ['AAPL']
+        assert results['FAIL'] == []
+        assert peak["max"] == 2
+
+
+
+class TestSharedNewsService:
+    """공유 NewsService 테스트"""
+    
+    def test_routers_and_briefing_share_one_instance(self, monkeypatch):
+        """브리핑 서비스가 공유 인스턴스(캐시/세마포어)를 쓰는지 테스트"""
+        from services.briefing_service import BriefingService
+        monkeypatch.setattr(news_service_module, "_news_service", None)
+        
+        shared = get_news_service()
+        
+        assert get_news_service() is shared
+        assert BriefingService().news_service is shared
+
+def _published(hours_ago):
+    """hours_ago 시간 전 발행 시각 (Exa 형식)"""
+    return (datetime.now(timezone.utc) - timedelta(hours=hours_ago)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _search_response(*titles, hours_ago=1, url_prefix="https://news.example.com/"):
+    """Exa search() 응답 대역 (앞의 기사일수록 최신)"""
+    items = [MagicMock(title=title, url=f"{url_prefix}{title}", published_date=_published(hours_ago + i / 10), text="본문")
+             for i, title in enumerate(titles)]
+    return MagicMock(results=items)
+
+
+def _service_with_client(response):
+    service = NewsService()
+    service.client = MagicMock()
+    service.client.search.return_value = response
+    return service
+
+
+class TestNewsCache:
+    """뉴스 검색 결과 캐시 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_repeat_search_uses_memory_cache(self):
+        """같은 종목/개수/기간의 반복 검색은 업스트림을 호출하지 않는지 테스트"""
+        service = _service_with_client(_search_response("Tesla rallies"))
+        
+        first = await service.search_stock_news('TSLA', limit=5)
+        second = await service.search_stock_news(' tsla ', limit=5)
+        
+        assert service.client.search.call_count == 1
+        assert first == second
+        assert second['news'][0]['title'] == "Tesla rallies"
+        
+        await service.search_stock_news('TSLA', limit=3)
+        assert service.client.search.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_disk_tier_shared_between_instances(self):
+        """다른 인스턴스(예: 브리핑 서비스)도 디스크 캐시로 업스트림 호출 없이 응답하는지 테스트"""
+        first = _service_with_client(_search_response("Tesla rallies"))
+        await first.search_stock_news('TSLA')
+        second = _service_with_client(_search_response("other"))
+        
+        result = await second.search_stock_news('TSLA')
+        
+        second.client.search.assert_not_called()
+        assert result['news'][0]['title'] == "Tesla rallies"
+        assert second.news_store.stats()['hits'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_new_window_bucket_misses(self, mocker):
+        """검색 기간 시작 시각이 바뀌면 새로 검색하는지 테스트"""
+        service = _service_with_client(_search_response("Tesla rallies"))
+        window = mocker.patch.object(service, '_window_start', return_value="2026-01-01T00:00:00")
+        await service.search_stock_news('TSLA')
+        
+        window.return_value = "2026-01-01T01:00:00"
+        await service.search_stock_news('TSLA')
+        
+        assert service.client.search.call_count == 2
+        assert service.client.search.call_args.kwargs['start_published_date'] == "2026-01-01T01:00:00"
+    
+    @pytest.mark.asyncio
+    async def test_empty_results_cached_errors_not(self):
+        """결과 없는 검색은 캐시하고 오류는 캐시하지 않는지 테스트"""
+        service = _service_with_client(_search_response())
+        
+        await service.search_stock_news('ZZZZ')
+        empty = await service.search_stock_news('ZZZZ')
+        service.client.search.side_effect = Exception("Exa down")
+        error = await service.search_stock_news('NVDA')
+        
+        assert empty['status'] == 'empty'
+        assert error['status'] == 'error'
+        assert service.client.search.call_count == 2
+        assert len(service.news_cache) == 1
+    
+    def test_window_start_is_bucketed(self):
+        """기간 시작 시각이 단위 시간으로 내림되는지 테스트"""
+        service = NewsService()
+        
+        assert service._window_start().endswith(":00:00")
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_work_runs_off_event_loop(self, mocker):
+        """캐시/기사 창/색인 SQLite 작업이 이벤트 루프 스레드 밖에서 실행되는지 테스트"""
+        service = _service_with_client(_search_response("Tesla rallies"))
+        loop_thread = threading.current_thread()
+        threads = {}
+        
+        def record(target, name):
+            original = getattr(target, name)
+            
+            def wrapper(*args, **kwargs):
+                threads[name] = threading.current_thread()
+                return original(*args, **kwargs)
+            
+            mocker.patch.object(target, name, side_effect=wrapper)
+        
+        for name in ("get", "put", "window_state", "merge_articles", "articles"):
+            record(service.news_store, name)
+        record(service.news_index, "add_articles")
+        
+        result = await service.search_stock_news('TSLA')
+        
+        assert result['news'][0]['title'] == "Tesla rallies"
+        assert set(threads) == {"get", "put", "window_state", "merge_articles", "articles", "add_articles"}
+        assert all(thread is not loop_thread for thread in threads.values())
+
+
+class TestNewsWatermark:
+    """발행 시각 워터마크 기반 증분 조회 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_refresh_requests_only_newer_articles(self):
+        """다시 조회할 때 보유한 최신 기사 발행 시각 이후만 요청하고 창에 합치는지 테스트"""
+        service = _service_with_client(_search_response("a", "b", hours_ago=3))
+        first = await service.search_stock_news('TSLA', limit=2)
+        watermark = service.news_store.window_state('TSLA', service._window_start())[1]
+        
+        service.news_cache.clear()
+        service.news_store.ttl = 0
+        service.client.search.return_value = _search_response("c", hours_ago=1)
+        second = await service.search_stock_news('TSLA', limit=2)
+        
+        assert service.client.search.call_args.kwargs['start_published_date'] == watermark
+        assert [news['title'] for news in first['news']] == ['a', 'b']
+        assert [news['title'] for news in second['news']] == ['c', 'a']
+    
+    @pytest.mark.asyncio
+    async def test_full_window_when_not_enough_articles(self):
+        """보유 기사가 요청 개수보다 적으면 전체 기간을 다시 조회하는지 테스트"""
+        service = _service_with_client(_search_response("a", hours_ago=3))
+        await service.search_stock_news('TSLA', limit=1)
+        
+        service.client.search.return_value = _search_response("a", "b", hours_ago=3)
+        result = await service.search_stock_news('TSLA', limit=5)
+        
+        assert service.client.search.call_args.kwargs['start_published_date'] == service._window_start()
+        assert [news['title'] for news in result['news']] == ['a', 'b']
+    
+    @pytest.mark.asyncio
+    async def test_no_new_articles_serves_window(self):
+        """새 기사가 없어도 보유한 기사 창으로 응답하는지 테스트"""
+        service = _service_with_client(_search_response("a", hours_ago=2))
+        await service.search_stock_news('TSLA', limit=1)
+        service.news_cache.clear()
+        service.news_store.ttl = 0
+        service.client.search.return_value = _search_response()
+        
+        result = await service.search_stock_news('TSLA', limit=1)
+        
+        assert result['status'] == 'success'
+        assert result['news'][0]['title'] == 'a'
+
+
+class TestNewsDedup:
+    """여러 매체에 배포된 중복 기사 제거 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_syndicated_copies_removed(self):
+        """같은 기사의 배포본은 최신 하나만 남기고 나머지 기사로 요청 개수를 채우는지 테스트"""
+        service = _service_with_client(_search_response(
+            "Tesla shares jump after record deliveries beat Wall Street estimates",
+            "Tesla shares jump after record deliveries beat Wall Street's estimates",
+            "Fed holds rates steady",
+            "Apple unveils new iPhone",
+        ))
+        
+        result = await service.search_stock_news('TSLA', limit=3)
+        
+        assert service.client.search.call_args.kwargs['num_results'] == 6
+        assert [news['title'] for news in result['news']] == [
+            "Tesla shares jump after record deliveries beat Wall Street estimates",
+            "Fed holds rates steady",
+            "Apple unveils new iPhone",
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_tracking_url_variants_removed(self):
+        """추적 파라미터만 다른 URL은 한 번만 응답하는지 테스트"""
+        service = _service_with_client(_search_response("Tesla rallies", url_prefix="https://news.example.com/?utm_source=x&id="))
+        service.client.search.return_value.results.append(
+            MagicMock(title="Tesla stock rallies on deliveries", url="https://news.example.com/?id=Tesla rallies",
+                      published_date=_published(2), text="본문")
+        )
+        
+        result = await service.search_stock_news('TSLA', limit=5)
+        
+        assert result['count'] == 1
+
+
+class TestIndexedNewsSearch:
+    """수집한 기사의 로컬 색인 검색 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_ingested_articles_searchable(self):
+        """종목 뉴스로 수집한 기사가 색인되어 업스트림 호출 없이 검색되는지 테스트"""
+        service = _service_with_client(_search_response("Tesla rallies on deliveries", "Fed holds rates"))
+        await service.search_stock_news('TSLA', limit=2)
+        
+        result = service.search_indexed_news("deliveries", tickers=["TSLA"])
+        
+        assert service.client.search.call_count == 1
+        assert result['status'] == 'success'
+        assert [news['title'] for news in result['results']] == ["Tesla rallies on deliveries"]
+        assert result['results'][0]['tickers'] == ['TSLA']
+    
+    @pytest.mark.asyncio
+    async def test_date_filter_is_inclusive(self):
+        """종료 날짜 당일 발행 기사도 포함하는지 테스트"""
+        service = _service_with_client(_search_response("Tesla rallies"))
+        await service.search_stock_news('TSLA')
+        today = datetime.now(timezone.utc).date()
+        
+        assert service.search_indexed_news("tesla", to_date=today - timedelta(days=1))['status'] == 'empty'
+        assert service.search_indexed_news("tesla", from_date=today - timedelta(days=1), to_date=today)['count'] == 1
+    
+    def test_validation_errors(self):
+        """빈 검색어와 잘못된 날짜 범위 테스트"""
+        service = NewsService()
+        today = datetime.now(timezone.utc).date()
+        
+        assert service.search_indexed_news("  ")['error_type'] == 'validation_error'
+        assert service.search_indexed_news("tesla", from_date=today, to_date=today - timedelta(days=1))['error_type'] == 'validation_error'
+
+
+class TestNewsTagging:
+    """기사 관련 종목 태깅 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_related_tickers_tagged_and_indexed(self, tmp_path, monkeypatch):
+        """종목 사전으로 관련 종목을 채우고, 다른 종목 필터로도 색인에서 찾을 수 있는지 테스트"""
+        from services.search_index import SearchIndex
+        path = tmp_path / "search_index.tsv.gz"
+        SearchIndex([('TSLA', 'Tesla, Inc.', 1.0), ('NVDA', 'NVIDIA Corporation', 1.0)]).save(path)
+        monkeypatch.setenv("SEARCH_INDEX_PATH", str(path))
+        service = _service_with_client(_search_response("Nvidia supplies chips for Tesla robotaxi", "Fed holds rates"))
+        
+        result = await service.search_stock_news('TSLA', limit=2)
+        
+        assert [news['related_tickers'] for news in result['news']] == [['TSLA', 'NVDA'], ['TSLA']]
+        found = service.search_indexed_news("robotaxi", tickers=["NVDA"])
+        assert found['results'][0]['tickers'] == ['NVDA', 'TSLA']
+    
+    @pytest.mark.asyncio
+    async def test_tagger_rebuilt_when_dictionary_changes(self, tmp_path, monkeypatch):
+        """종목 사전 파일이 새로 생기면 태거를 다시 만드는지 테스트"""
+        from services.search_index import SearchIndex
+        path = tmp_path / "search_index.tsv.gz"
+        monkeypatch.setenv("SEARCH_INDEX_PATH", str(path))
+        service = _service_with_client(_search_response("Apple unveils new iPhone"))
+        assert len(service.entity_tagger) == 0
+        
+        SearchIndex([('AAPL', 'Apple Inc.', 1.0)]).save(path)
+        result = await service.search_stock_news('MSFT', limit=1)
+        
+        assert result['news'][0]['related_tickers'] == ['MSFT', 'AAPL']
@@ -0,0 +1,72 @@
+"""
+ProfileStore 단위 테스트
+SQLite 기반 회사 프로필 저장소 테스트
+"""
+
+import sqlite3
+
+import pytest
+from services.profile_store import ProfileStore
+
+
+PROFILE = {'name': 'Tesla, Inc.', 'sector': 'Consumer Cyclical', 'industry': 'Auto Manufacturers'}
+
+
+class TestProfileStore:
+    """ProfileStore 테스트"""
+    
+    def test_put_and_get(self, tmp_path):
+        """저장한 프로필을 조회하는지 테스트"""
+        store = ProfileStore(tmp_path / 'profiles.db')
+        store.put_many({'TSLA': PROFILE})
+        
+        assert store.get_many(['TSLA', 'NVDA']) == {'TSLA': PROFILE}
+        assert store.stats()['hits'] == 1
+        assert store.stats()['misses'] == 1
+    
+    def test_survives_restart(self, tmp_path):
+        """새 인스턴스에서도 저장된 프로필이 유지되는지 테스트"""
+        ProfileStore(tmp_path / 'profiles.db').put_many({'TSLA': PROFILE})
+        
+        store = ProfileStore(tmp_path / 'profiles.db')
+        
+        assert store.get_many(['TSLA']) == {'TSLA': PROFILE}
+        assert store.stats()['size'] == 1
+    
+    def test_expired_after_refresh_interval(self, tmp_path):
+        """갱신 주기가 지난 프로필은 조회되지 않는지 테스트"""
+        store = ProfileStore(tmp_path / 'profiles.db', refresh_days=0)
+        store.put_many({'TSLA': PROFILE})
+        
+        store.refresh_seconds = -1
+        
+        assert store.get_many(['TSLA']) == {}
+    
+    def test_disabled_store(self):
+        """경로가 없으면 저장소가 비활성화되는지 테스트"""
+        store = ProfileStore(None)
+        store.put_many({'TSLA': PROFILE})
+        
+        assert store.enabled is False
+        assert store.get_many(['TSLA']) == {}
+    
+    def test_connections_closed(self, tmp_path, mocker):
+        """조회/저장마다 연 SQLite 연결을 닫는지 테스트"""
+        connections = []
+        connect = sqlite3.connect
+        
+        def tracked_connect(*args, **kwargs):
+            connections.append(connect(*args, **kwargs))
+            return connections[-1]
+        
+        mocker.patch('services.profile_store.sqlite3.connect', side_effect=tracked_connect)
+        store = ProfileStore(tmp_path / 'profiles.db')
+        
+        store.put_many({'TSLA': PROFILE})
+        store.get_many(['TSLA'])
+        store.stats()
+        
+        assert len(connections) >= 3
+        for conn in connections:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute('SELECT 1')
@@ -0,0 +1,91 @@
+"""
+QuoteStreamHub 단위 테스트
+종목별 폴러 공유 / 변경 시에만 전달 / 구독 해제 테스트
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.quote_stream import QuoteStreamHub
+
+
+def make_service(prices):
+    """호출할 때마다 prices의 다음 가격을 반환하는 StockService 대역"""
+    service = MagicMock()
+    prices = iter(prices)
+    
+    async def get_stock_info(ticker, fresh=False):
+        return {'ticker': ticker, 'price': next(prices), 'change_percent': 1.0, 'volume': 100, 'status': 'success'}
+    
+    service.get_stock_info = AsyncMock(side_effect=get_stock_info)
+    return service
+
+
+class TestQuoteStreamHub:
+    """QuoteStreamHub 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_fan_out_single_poller(self):
+        """같은 종목 구독자 여럿이 폴러 하나를 공유하는지 테스트"""
+        service = make_service([100.0] * 10)
+        hub = QuoteStreamHub(service, interval=60)
+        
+        subscriptions = [hub.subscribe(['tsla']) for _ in range(3)]
+        batches = await asyncio.gather(*(s.next_batch(timeout=1) for s in subscriptions))
+        
+        assert service.get_stock_info.await_count == 1
+        # 폴러는 시세 캐시를 건너뛰고 조회
+        service.get_stock_info.assert_awaited_with('TSLA', fresh=True)
+        assert all(batch == [{'ticker': 'TSLA', 'price': 100.0, 'change_percent': 1.0, 'volume': 100}] for batch in batches)
+        assert hub.stats()['tickers'] == 1
+        assert hub.stats()['subscriptions'] == 3
+        await hub.close()
+    
+    @pytest.mark.asyncio
+    async def test_publish_only_on_change(self):
+        """값이 바뀐 경우에만 전달되는지 테스트"""
+        service = make_service([100.0, 100.0, 101.0] + [101.0] * 10)
+        hub = QuoteStreamHub(service, interval=0.01)
+        subscription = hub.subscribe(['TSLA'])
+        
+        first = await subscription.next_batch(timeout=1)
+        second = await subscription.next_batch(timeout=1)
+        
+        assert [u['price'] for u in first] == [100.0]
+        assert [u['price'] for u in second] == [101.0]
+        assert hub.stats()['published'] == 2
+        await hub.close()
+    
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_gets_latest_only(self):
+        """느린 구독자는 종목별 최신 값만 받는지 테스트"""
+        hub = QuoteStreamHub(make_service([]), interval=60)
+        subscription = hub.subscribe([])
+        
+        subscription.push({'ticker': 'TSLA', 'price': 1.0})
+        subscription.push({'ticker': 'TSLA', 'price': 2.0})
+        subscription.push({'ticker': 'NVDA', 'price': 3.0})
+        
+        assert await subscription.next_batch(timeout=1) == [
+            {'ticker': 'TSLA', 'price': 2.0}, {'ticker': 'NVDA', 'price': 3.0}
+        ]
+        assert await subscription.next_batch(timeout=0.01) == []
+    
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_poller(self):
+        """마지막 구독자가 떠나면 폴러가 중지되는지 테스트"""
+        hub = QuoteStreamHub(make_service([100.0] * 10), interval=60)
+        first = hub.subscribe(['TSLA'])
+        second = hub.subscribe(['TSLA'])
+        poller = hub._pollers['TSLA']
+        
+        hub.unsubscribe(first)
+        assert hub.stats()['tickers'] == 1
+        
+        hub.unsubscribe(second)
+        await asyncio.sleep(0)
+        
+        assert hub.stats()['tickers'] == 0
+        assert poller.cancelled()
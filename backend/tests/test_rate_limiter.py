@@ -0,0 +1,154 @@
+"""
+RateLimiter 단위 테스트
+토큰 버킷 속도 제한 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+from services.circuit_breaker import CircuitBreaker
+from services.http_session import TimeoutHTTPAdapter
+from services.rate_limiter import RateLimiter, RateLimitExceeded, get_rate_limiter
+from services.upstream_executor import UpstreamExecutor
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        """버스트만큼은 즉시 통과하고 이후 요청은 rate 간격으로 나가는지 테스트"""
+        limiter = RateLimiter("test", rate=20.0, burst=2)
+        
+        started = time.monotonic()
+        waits = [await limiter.acquire() for _ in range(4)]
+        elapsed = time.monotonic() - started
+        
+        assert waits[:2] == [0.0, 0.0]
+        assert all(wait > 0 for wait in waits[2:])
+        # 토큰 2개를 추가로 채우는 데 약 0.1초
+        assert 0.08 <= elapsed < 0.5
+        stats = limiter.stats()
+        assert stats['acquired'] == 4
+        assert stats['waited'] == 2
+        assert stats['max_wait_ms'] > 0
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_are_spaced(self):
+        """동시에 대기하는 요청도 예약 순서대로 간격을 두고 통과하는지 테스트"""
+        limiter = RateLimiter("test", rate=50.0, burst=1)
+        
+        waits = await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+        
+        assert sorted(waits) == waits
+        assert waits[-1] == pytest.approx(0.08, abs=0.02)
+    
+    @pytest.mark.asyncio
+    async def test_fail_fast_rejects_without_token(self):
+        """즉시 실패 모드에서 토큰이 없으면 RateLimitExceeded가 발생하는지 테스트"""
+        limiter = RateLimiter("test", rate=1.0, burst=1, mode="fail_fast")
+        
+        await limiter.acquire()
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await limiter.acquire()
+        
+        assert exc_info.value.retry_after > 0
+        assert limiter.stats()['rejected'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_max_wait_rejects_long_queue(self):
+        """대기열 모드에서 대기 시간이 max_wait를 넘으면 실패하는지 테스트"""
+        limiter = RateLimiter("test", rate=1.0, burst=1, max_wait=0.5)
+        
+        await limiter.acquire()
+        with pytest.raises(RateLimitExceeded):
+            await limiter.acquire()
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_returns_token(self):
+        """대기 중 취소된 요청의 예약 토큰이 반환되는지 테스트"""
+        limiter = RateLimiter("test", rate=1.0, burst=1)
+        await limiter.acquire()
+        
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        assert limiter.stats()['tokens'] > -0.5
+    
+    @pytest.mark.asyncio
+    async def test_disabled_when_rate_zero(self):
+        """rate가 0이면 제한 없이 통과하는지 테스트"""
+        limiter = RateLimiter("test", rate=0)
+        
+        waits = [await limiter.acquire() for _ in range(100)]
+        
+        assert not limiter.enabled
+        assert set(waits) == {0.0}
+    
+    def test_invalid_mode(self):
+        """유효하지 않은 모드는 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            RateLimiter("test", rate=1.0, mode="drop")
+    
+    def test_get_rate_limiter_reads_env(self, monkeypatch):
+        """환경 변수 설정으로 공유 속도 제한기가 생성되는지 테스트"""
+        monkeypatch.setenv("ENVTEST_RATE_LIMIT", "3")
+        monkeypatch.setenv("ENVTEST_RATE_BURST", "6")
+        monkeypatch.setenv("ENVTEST_RATE_MODE", "fail_fast")
+        
+        limiter = get_rate_limiter("envtest")
+        
+        assert (limiter.rate, limiter.burst, limiter.mode) == (3.0, 6.0, "fail_fast")
+        assert get_rate_limiter("envtest") is limiter
+
+
+class TestExecutorRateLimit:
+    """UpstreamExecutor 속도 제한 연동 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_executor_fail_fast_does_not_submit(self):
+        """토큰이 없으면 함수를 실행하지 않고 예외를 전파하는지 테스트"""
+        limiter = RateLimiter("test", rate=1.0, burst=1, mode="fail_fast")
+        executor = UpstreamExecutor("test", max_workers=1, rate_limiter=limiter)
+        calls = []
+        
+        await executor.run(calls.append, 1)
+        with pytest.raises(RateLimitExceeded):
+            await executor.run(calls.append, 2)
+        
+        assert calls == [1]
+        assert executor.stats()['completed'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_token_per_http_request(self, mocker):
+        """호출 한 번에 여러 HTTP 요청이 나가면 요청마다 토큰을 소비하는지 테스트"""
+        mocker.patch("requests.adapters.HTTPAdapter.send")
+        limiter = RateLimiter("test", rate=1.0, burst=3, mode="fail_fast")
+        executor = UpstreamExecutor("test", max_workers=1, rate_limiter=limiter)
+        adapter = TimeoutHTTPAdapter(rate_limiter=limiter)
+        
+        # 예: 다중 심볼 quoteSummary처럼 호출 한 번에 요청 3건
+        await executor.run(lambda: [adapter.send(mocker.Mock()) for _ in range(3)])
+        
+        assert limiter.stats()['acquired'] == 3
+        with pytest.raises(RateLimitExceeded):
+            await executor.run(lambda: None)
+    
+    @pytest.mark.asyncio
+    async def test_extra_request_rejection_not_counted_as_failure(self, mocker):
+        """호출 중 추가 요청이 속도 제한으로 거절되어도 서킷 브레이커 실패로 기록하지 않는지 테스트"""
+        mocker.patch("requests.adapters.HTTPAdapter.send")
+        limiter = RateLimiter("test", rate=1.0, burst=1, mode="fail_fast")
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60)
+        executor = UpstreamExecutor("test", max_workers=1, rate_limiter=limiter, circuit_breaker=breaker)
+        adapter = TimeoutHTTPAdapter(rate_limiter=limiter)
+        
+        with pytest.raises(RateLimitExceeded):
+            await executor.run(lambda: [adapter.send(mocker.Mock()) for _ in range(2)])
+        
+        assert limiter.stats()['acquired'] == 1
+        assert breaker.stats()['state'] == 'closed'
@@ -0,0 +1,77 @@
+"""
+종목 검색 인덱스 테스트
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.search_index import SearchIndex
+
+
+@pytest.fixture
+def index():
+    return SearchIndex([
+        ('TSLA', 'Tesla, Inc.', 100.0),
+        ('TSM', 'Taiwan Semiconductor Manufacturing', 50.0),
+        ('T', 'AT&T Inc.', 80.0),
+        ('MSFT', 'Microsoft Corporation', 90.0),
+        ('AAPL', 'Apple Inc.', 95.0),
+    ])
+
+
+class TestSearch:
+    """검색 순위 테스트"""
+    
+    def test_exact_ticker_first(self, index):
+        """정확히 일치하는 티커가 접두어 매칭보다 먼저 오는지 테스트"""
+        results = index.search('t')
+        
+        assert results[0] == {'ticker': 'T', 'name': 'AT&T Inc.', 'score': 80.0, 'match': 'exact'}
+        # 접두어 매칭끼리는 인기도 순
+        assert [r['ticker'] for r in results[1:3]] == ['TSLA', 'TSM']
+    
+    def test_name_prefix(self, index):
+        """회사명 접두어 검색 테스트 (대소문자/구두점 무시)"""
+        results = index.search('micro')
+        
+        assert results[0]['ticker'] == 'MSFT'
+        assert results[0]['match'] == 'name_prefix'
+    
+    def test_fuzzy_name(self, index):
+        """오타가 있는 회사명도 유사도로 찾는지 테스트"""
+        results = index.search('microsfot')
+        
+        assert results[0]['ticker'] == 'MSFT'
+        assert results[0]['match'] == 'fuzzy'
+    
+    def test_limit_and_empty_query(self, index):
+        """결과 수 제한과 빈 검색어 테스트"""
+        assert len(index.search('t', limit=2)) == 2
+        assert index.search('  ') == []
+        assert SearchIndex().search('tsla') == []
+
+
+class TestPersistence:
+    """병합 및 저장/로드 테스트"""
+    
+    def test_merged_overrides_existing(self, index):
+        """병합 시 같은 심볼은 새 값으로 덮어쓰고 기존 인덱스는 변경되지 않는지 테스트"""
+        merged = index.merged([('tsla', 'Tesla, Inc.', 500.0), ('NVDA', 'NVIDIA Corporation', 1.0)])
+        
+        assert len(merged) == 6
+        assert merged.search('tsla')[0]['score'] == 500.0
+        assert index.search('nvda') == []
+    
+    def test_save_and_load_round_trip(self, index, tmp_path):
+        """gzip TSV로 저장한 인덱스를 다시 불러오는지 테스트"""
+        path = tmp_path / 'cache' / 'search_index.tsv.gz'
+        index.save(path)
+        
+        loaded = SearchIndex.load(path)
+        
+        assert loaded.entries() == index.entries()
+        assert SearchIndex.load(tmp_path / 'missing.tsv.gz').entries() == []
@@ -0,0 +1,87 @@
+"""
+SingleFlight 단위 테스트
+동일 키 동시 호출 병합 테스트
+"""
+
+import asyncio
+
+import pytest
+from services.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """같은 키의 동시 호출이 한 번만 실행되는지 테스트"""
+        flight = SingleFlight()
+        calls = 0
+        
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {'price': 100}
+        
+        results = await asyncio.gather(*(flight.do('TSLA', fetch) for _ in range(10)))
+        
+        assert calls == 1
+        assert all(result == {'price': 100} for result in results)
+        assert flight.stats()['shared'] == 9
+        assert flight.stats()['inflight'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_different_keys_not_merged(self):
+        """다른 키는 각각 실행되는지 테스트"""
+        flight = SingleFlight()
+        
+        async def fetch(value):
+            await asyncio.sleep(0.01)
+            return value
+        
+        results = await asyncio.gather(
+            flight.do('A', lambda: fetch('A')),
+            flight.do('B', lambda: fetch('B')),
+        )
+        
+        assert results == ['A', 'B']
+        assert flight.stats()['calls'] == 2
+    
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_waiters(self):
+        """예외가 모든 대기자에게 전파되고 다음 호출은 새로 실행되는지 테스트"""
+        flight = SingleFlight()
+        
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+        
+        results = await asyncio.gather(
+            flight.do('TSLA', fail),
+            flight.do('TSLA', fail),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        
+        async def ok():
+            return 'ok'
+        
+        assert await flight.do('TSLA', ok) == 'ok'
+    
+    @pytest.mark.asyncio
+    async def test_waiter_cancellation_does_not_cancel_shared_call(self):
+        """한 대기자가 취소되어도 다른 대기자는 결과를 받는지 테스트"""
+        flight = SingleFlight()
+        
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return 'done'
+        
+        first = asyncio.create_task(flight.do('TSLA', fetch))
+        second = asyncio.create_task(flight.do('TSLA', fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        
+        assert await second == 'done'
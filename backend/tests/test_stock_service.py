@@ -3,11 +3,31 @@ StockService 단위 테스트
 pytest를 사용한 주식 데이터 수집 서비스 테스트
 """
 
+import asyncio
+import threading
+
+import numpy as np
 import pytest
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from unittest.mock import Mock, AsyncMock, patch, MagicMock, PropertyMock
+from services.circuit_breaker import CircuitBreaker
 from services.stock_service import StockService
 
 
+def with_quotes(mock_ticker):
+    """Mock Ticker의 summary_detail 값을 다중 심볼 quotes 응답으로 설정 (요청 횟수는 property_mock()으로 확인)"""
+    summary_detail = mock_ticker.summary_detail if isinstance(mock_ticker.summary_detail, dict) else {}
+    # 조회되지 않는 종목은 quote 응답에서 빠짐
+    type(mock_ticker).quotes = PropertyMock(return_value={
+        symbol: summary for symbol, summary in summary_detail.items() if isinstance(summary, dict)
+    })
+    return mock_ticker
+
+
+def property_mock(mock_ticker, name):
+    """Mock Ticker에 설정한 PropertyMock (속성 조회 = 업스트림 요청 횟수 확인용)"""
+    return vars(type(mock_ticker))[name]
+
+
 class TestStockServiceInit:
     """StockService 초기화 테스트"""
     
@@ -172,6 +192,227 @@ class TestGetTrendingStocks:
         assert 'API Error' in result['message']
 
 
+class TestTrendingFastPath:
+    """스크리너 quote 기반 화제 종목 응답 테스트"""
+    
+    SCREENER_RESPONSE = {
+        'day_gainers': {
+            'quotes': [
+                {
+                    'symbol': 'NVDA',
+                    'longName': 'NVIDIA Corporation',
+                    'regularMarketPrice': 142.50,
+                    'regularMarketChangePercent': 5.2,
+                    'regularMarketVolume': 89000000,
+                    'marketCap': 3500000000000,
+                    'trailingPE': 52.1,
+                }
+            ]
+        }
+    }
+    
+    @pytest.mark.asyncio
+    async def test_trending_built_from_screener_quote(self, mocker):
+        """quote에 시세가 있으면 상세 재조회 없이 응답을 구성하는지 테스트"""
+        service = StockService()
+        
+        mocker.patch.object(service.screener, 'get_screeners', return_value=self.SCREENER_RESPONSE)
+        get_stock_info = mocker.patch.object(service, 'get_stock_info')
+        mock_ticker = MagicMock()
+        mock_ticker.asset_profile = {'NVDA': {'sector': 'Technology', 'industry': 'Semiconductors'}}
+        ticker_cls = mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        result = await service.get_trending_stocks('day_gainers')
+        
+        get_stock_info.assert_not_called()
+        top_stock = result['top_stock']
+        assert top_stock['name'] == 'NVIDIA Corporation'
+        assert top_stock['price'] == 142.50
+        assert top_stock['change_percent'] == 5.2
+        assert top_stock['market_cap'] == '$3.5T'
+        assert top_stock['pe_ratio'] == '52.10'
+        assert top_stock['sector'] == 'Technology'
+        
+        # 프로필이 캐시되면 업스트림 호출은 스크리너 1회뿐
+        await service.get_trending_stocks('day_gainers')
+        assert ticker_cls.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_trending_fast_path_disabled(self, mocker):
+        """fast path를 끄면 기존처럼 상세 정보를 조회하는지 테스트"""
+        service = StockService()
+        service.use_screener_quotes = False
+        
+        mocker.patch.object(service.screener, 'get_screeners', return_value=self.SCREENER_RESPONSE)
+        get_stock_info = mocker.patch.object(service, 'get_stock_info', return_value={'ticker': 'NVDA', 'status': 'success'})
+        
+        await service.get_trending_stocks('day_gainers')
+        
+        get_stock_info.assert_called_once_with('NVDA')
+    
+    @pytest.mark.asyncio
+    async def test_trending_profile_failure_falls_back_to_na(self, mocker):
+        """프로필 조회가 실패해도 quote 시세로 응답하는지 테스트"""
+        service = StockService()
+        
+        mocker.patch.object(service.screener, 'get_screeners', return_value=self.SCREENER_RESPONSE)
+        mocker.patch('services.stock_service.Ticker', side_effect=Exception("Connection Error"))
+        
+        result = await service.get_trending_stocks('day_gainers')
+        
+        assert result['status'] == 'success'
+        assert result['top_stock']['price'] == 142.50
+        assert result['top_stock']['sector'] == 'N/A'
+
+
+class TestTrendingTopN:
+    """get_trending_stocks 상위 N개 조회 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_top_n_from_screener_quotes(self, mocker):
+        """상위 N개 종목 프로필만 보강하는지 테스트"""
+        service = StockService()
+        
+        quotes = [
+            {'symbol': symbol, 'shortName': symbol, 'regularMarketPrice': 100.0 + i}
+            for i, symbol in enumerate(['TSLA', 'NVDA', 'AAPL', 'AMD'])
+        ]
+        get_screeners = mocker.patch.object(
+            service.screener, 'get_screeners', return_value={'most_actives': {'quotes': quotes}}
+        )
+        mock_ticker = MagicMock()
+        type(mock_ticker).asset_profile = PropertyMock(
+            return_value={symbol: {'sector': 'Technology'} for symbol in ['TSLA', 'NVDA', 'AAPL']}
+        )
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        result = await service.get_trending_stocks('most_actives', count=3)
+        
+        get_screeners.assert_called_once_with('most_actives', 25)
+        # 상위 3개 종목만 종목별로 조회
+        assert property_mock(mock_ticker, 'asset_profile').call_count == 3
+        assert result['count'] == 3
+        assert [stock['ticker'] for stock in result['stocks']] == ['TSLA', 'NVDA', 'AAPL']
+        assert result['top_stock']['ticker'] == 'TSLA'
+        assert all(stock['sector'] == 'Technology' for stock in result['stocks'])
+    
+    @pytest.mark.asyncio
+    async def test_top_n_batch_fallback(self, mocker):
+        """quote에 시세가 없으면 상세 정보를 한 번에 일괄 조회하는지 테스트"""
+        service = StockService()
+        
+        mocker.patch.object(
+            service.screener, 'get_screeners',
+            return_value={'most_actives': {'quotes': [{'symbol': 'TSLA'}, {'symbol': 'NVDA'}]}}
+        )
+        mock_ticker = MagicMock()
+        mock_ticker.asset_profile = {'TSLA': {'longName': 'Tesla'}, 'NVDA': {'longName': 'NVIDIA'}}
+        mock_ticker.summary_detail = {'TSLA': {'regularMarketPrice': 1.0}, 'NVDA': {'regularMarketPrice': 2.0}}
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
+        
+        result = await service.get_trending_stocks('most_actives', count=2)
+        
+        property_mock(mock_ticker, 'quotes').assert_called_once()
+        assert [stock['price'] for stock in result['stocks']] == [1.0, 2.0]
+    
+    @pytest.mark.asyncio
+    async def test_top_n_parallel_fallback_when_batch_fails(self, mocker):
+        """일괄 조회가 실패하면 종목별 병렬 조회로 전환하는지 테스트"""
+        service = StockService()
+        
+        mocker.patch.object(
+            service.screener, 'get_screeners',
+            return_value={'most_actives': {'quotes': [{'symbol': 'TSLA'}, {'symbol': 'NVDA'}]}}
+        )
+        mocker.patch.object(service, 'get_stock_info_batch', return_value={
+            'TSLA': {'ticker': 'TSLA', 'status': 'error', 'error': 'batch failed'},
+            'NVDA': {'ticker': 'NVDA', 'status': 'error', 'error': 'batch failed'},
+        })
+        get_stock_info = mocker.patch.object(
+            service, 'get_stock_info', side_effect=lambda symbol: {'ticker': symbol, 'status': 'success'}
+        )
+        
+        result = await service.get_trending_stocks('most_actives', count=2)
+        
+        assert get_stock_info.call_count == 2
+        assert all(stock['status'] == 'success' for stock in result['stocks'])
+    
+    @pytest.mark.asyncio
+    async def test_top_n_invalid_count(self):
+        """유효하지 않은 count 테스트"""
+        service = StockService()
+        
+        result = await service.get_trending_stocks('most_actives', count=0)
+        
+        assert result['status'] == 'error'
+        assert result['error_type'] == 'validation_error'
+
+
+class TestGetAllTrendingStocks:
+    """get_all_trending_stocks 메서드 테스트"""
+    
+    @staticmethod
+    def _quote(symbol, price):
+        return {'symbol': symbol, 'shortName': symbol, 'regularMarketPrice': price, 'regularMarketChangePercent': 1.0}
+    
+    @pytest.mark.asyncio
+    async def test_all_screeners_in_one_call(self, mocker):
+        """세 스크리너를 한 번에 조회하고 중복 종목 프로필은 한 번만 조회하는지 테스트"""
+        service = StockService()
+        
+        mock_screener_response = {
+            'most_actives': {'quotes': [self._quote('TSLA', 385.20)]},
+            'day_gainers': {'quotes': [self._quote('TSLA', 385.20)]},
+            'day_losers': {'quotes': [self._quote('INTC', 20.10)]},
+        }
+        get_screeners = mocker.patch.object(service.screener, 'get_screeners', return_value=mock_screener_response)
+        mock_ticker = MagicMock()
+        type(mock_ticker).asset_profile = PropertyMock(return_value={
+            'TSLA': {'sector': 'Consumer Cyclical'},
+            'INTC': {'sector': 'Technology'},
+        })
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        result = await service.get_all_trending_stocks()
+        
+        get_screeners.assert_called_once_with(['most_actives', 'day_gainers', 'day_losers'])
+        assert property_mock(mock_ticker, 'asset_profile').call_count == 2
+        assert result['status'] == 'success'
+        assert list(result['results'].keys()) == ['most_actives', 'day_gainers', 'day_losers']
+        assert result['results']['day_gainers']['top_stock']['ticker'] == 'TSLA'
+        assert result['results']['day_losers']['top_stock']['sector'] == 'Technology'
+    
+    @pytest.mark.asyncio
+    async def test_all_screeners_partial_empty(self, mocker):
+        """일부 스크리너 결과가 비어 있으면 해당 섹션만 empty인지 테스트"""
+        service = StockService()
+        
+        mock_screener_response = {
+            'most_actives': {'quotes': [{'symbol': 'TSLA'}]},
+            'day_gainers': {'quotes': []},
+        }
+        mocker.patch.object(service.screener, 'get_screeners', return_value=mock_screener_response)
+        mocker.patch.object(service, 'get_stock_info', return_value={'ticker': 'TSLA', 'status': 'success'})
+        
+        result = await service.get_all_trending_stocks()
+        
+        assert result['results']['most_actives']['status'] == 'success'
+        assert result['results']['day_gainers']['status'] == 'empty'
+        assert result['results']['day_losers']['status'] == 'empty'
+    
+    @pytest.mark.asyncio
+    async def test_all_screeners_api_exception(self, mocker):
+        """스크리너 호출 예외 시 오류를 반환하는지 테스트"""
+        service = StockService()
+        
+        mocker.patch.object(service.screener, 'get_screeners', side_effect=Exception("API Error"))
+        
+        result = await service.get_all_trending_stocks()
+        
+        assert result['status'] == 'error'
+        assert 'API Error' in result['message']
+
+
 class TestGetStockInfo:
     """get_stock_info 메서드 테스트"""
     
@@ -199,7 +440,7 @@ class TestGetStockInfo:
             }
         }
         
-        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
         
         result = await service.get_stock_info('TSLA')
         
@@ -235,7 +476,7 @@ class TestGetStockInfo:
             }
         }
         
-        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
         
         result = await service.get_stock_info('AAPL')
         
@@ -263,7 +504,7 @@ class TestGetStockInfo:
             }
         }
         
-        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
         
         result = await service.get_stock_info('TEST')
         
@@ -308,7 +549,7 @@ class TestGetStockInfo:
             }
         }
         
-        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
         
         result = await service.get_stock_info('tsla')  # 소문자 입력
         
@@ -330,7 +571,7 @@ class TestGetStockInfo:
             }
         }
         
-        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
         
         result = await service.get_stock_info('TSLA')
         
@@ -352,7 +593,7 @@ class TestGetStockInfo:
             }
         }
         
-        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
         
         result = await service.get_stock_info('TEST')
         
@@ -373,7 +614,7 @@ class TestGetStockInfo:
             }
         }
         
-        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
         
         result = await service.get_stock_info('TSLA')
         
@@ -393,7 +634,7 @@ class TestGetStockInfo:
             }
         }
         
-        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
         
         result = await service.get_stock_info('TEST')
         
@@ -413,7 +654,7 @@ class TestGetStockInfo:
             }
         }
         
-        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
         
         result = await service.get_stock_info('TEST')
         
@@ -446,7 +687,7 @@ class TestGetStockInfo:
             }
         }
         
-        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
         
         result = await service.get_stock_info('TSLA')
         
@@ -457,36 +698,628 @@ class TestGetStockInfo:
         assert result['pe_ratio'] == 'N/A'
 
 
+class TestBatchQuotes:
+    """다중 심볼 quote 조회 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_batch_single_quote_request(self, mocker):
+        """여러 종목 시세를 quote 요청 한 번으로 조회하고 프로필은 따로 보강하는지 테스트"""
+        service = StockService()
+        
+        mock_ticker = MagicMock()
+        mock_ticker.asset_profile = {'TSLA': {'sector': 'Consumer Cyclical'}, 'NVDA': {'sector': 'Technology'}}
+        type(mock_ticker).quotes = PropertyMock(return_value={
+            'TSLA': {'longName': 'Tesla, Inc.', 'regularMarketPrice': 385.20, 'regularMarketPreviousClose': 381.50},
+            'NVDA': {'shortName': 'NVIDIA', 'regularMarketPrice': 142.50},
+        })
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        result = await service.get_stock_info_batch(['TSLA', 'NVDA'])
+        
+        property_mock(mock_ticker, 'quotes').assert_called_once()
+        mock_ticker.get_modules.assert_not_called()
+        assert result['TSLA']['name'] == 'Tesla, Inc.'
+        assert result['TSLA']['sector'] == 'Consumer Cyclical'
+        assert result['NVDA']['name'] == 'NVIDIA'
+        assert result['NVDA']['price'] == 142.50
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_quote_request_failure(self, mocker):
+        """시세 조회 실패 시 오류를 반환하고 캐시하지 않는지 테스트"""
+        service = StockService()
+        
+        mock_ticker = MagicMock()
+        type(mock_ticker).quotes = PropertyMock(side_effect=Exception("Read timed out"))
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        result = await service.get_stock_info('TSLA')
+        
+        assert result['status'] == 'error'
+        assert 'Read timed out' in result['error']
+        assert len(service.quote_cache) == 0
+
+
+class TestProfileStore:
+    """프로필 영구 저장소 연동 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_known_profile_fetches_only_quotes(self, mocker):
+        """재시작 후에도 저장된 프로필이 있으면 시세만 조회하는지 테스트"""
+        mock_ticker = MagicMock()
+        mock_ticker.asset_profile = {'TSLA': {'longName': 'Tesla, Inc.', 'sector': 'Consumer Cyclical', 'industry': 'Auto'}}
+        mock_ticker.summary_detail = {'TSLA': {'regularMarketPrice': 385.20}}
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
+        
+        await StockService().get_stock_info('TSLA')
+        
+        # 재시작: 새 인스턴스는 메모리 캐시가 비어 있음
+        service = StockService()
+        restarted_ticker = MagicMock()
+        type(restarted_ticker).asset_profile = PropertyMock(return_value={})
+        type(restarted_ticker).quotes = PropertyMock(return_value={'TSLA': {'regularMarketPrice': 390.00}})
+        mocker.patch('services.stock_service.Ticker', return_value=restarted_ticker)
+        
+        result = await service.get_stock_info('TSLA')
+        
+        property_mock(restarted_ticker, 'asset_profile').assert_not_called()
+        property_mock(restarted_ticker, 'quotes').assert_called_once()
+        assert result['price'] == 390.00
+        assert result['name'] == 'Tesla, Inc.'
+        assert result['sector'] == 'Consumer Cyclical'
+        assert result['industry'] == 'Auto'
+    
+    @pytest.mark.asyncio
+    async def test_store_access_runs_off_event_loop(self, mocker):
+        """프로필 저장소 조회/저장이 이벤트 루프 스레드 밖에서 실행되는지 테스트"""
+        service = StockService()
+        loop_thread = threading.current_thread()
+        get_many = service.profile_store.get_many
+        put_many = service.profile_store.put_many
+        threads = {}
+        
+        def recording(name, func):
+            def wrapper(*args):
+                threads[name] = threading.current_thread()
+                return func(*args)
+            return wrapper
+        
+        mocker.patch.object(service.profile_store, 'get_many', side_effect=recording('get_many', get_many))
+        mocker.patch.object(service.profile_store, 'put_many', side_effect=recording('put_many', put_many))
+        
+        await service._store_profiles({'TSLA': {'name': 'Tesla', 'sector': 'Consumer Cyclical', 'industry': 'Auto'}})
+        service.profile_cache.clear()
+        profiles = await service._known_profiles(['TSLA'])
+        
+        assert profiles['TSLA']['name'] == 'Tesla'
+        assert set(threads) == {'get_many', 'put_many'}
+        assert all(thread is not loop_thread for thread in threads.values())
+
+
+class TestProfileFetch:
+    """종목별 프로필 동시 조회 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_profiles_fetched_per_symbol_and_merged(self, mocker):
+        """겹치는 종목의 동시 조회는 종목별로 한 번만 요청하는지 테스트"""
+        service = StockService()
+        
+        fetch_profile = mocker.patch.object(
+            service, '_fetch_profile', side_effect=lambda symbol: {'name': symbol, 'sector': 'Technology', 'industry': 'N/A'}
+        )
+        
+        first, second = await asyncio.gather(
+            service._get_profiles(['TSLA', 'NVDA']),
+            service._get_profiles(['NVDA', 'AAPL'])
+        )
+        
+        assert sorted(call.args[0] for call in fetch_profile.call_args_list) == ['AAPL', 'NVDA', 'TSLA']
+        assert first['NVDA'] == second['NVDA'] == {'name': 'NVDA', 'sector': 'Technology', 'industry': 'N/A'}
+    
+    @pytest.mark.asyncio
+    async def test_one_symbol_failure_keeps_others(self, mocker):
+        """한 종목 조회가 실패해도 나머지 프로필은 저장하는지 테스트"""
+        service = StockService()
+        
+        def fetch_profile(symbol):
+            if symbol == 'XXXX':
+                raise ValueError("Quote not found")
+            return {'name': symbol, 'sector': 'Technology', 'industry': 'N/A'}
+        
+        mocker.patch.object(service, '_fetch_profile', side_effect=fetch_profile)
+        
+        profiles = await service._get_profiles(['TSLA', 'XXXX'])
+        
+        assert profiles['TSLA']['sector'] == 'Technology'
+        assert profiles['XXXX']['sector'] == 'N/A'
+        assert (await service._known_profiles(['TSLA', 'XXXX'])).keys() == {'TSLA'}
+    
+    @pytest.mark.asyncio
+    async def test_missing_profile_cached(self, mocker):
+        """assetProfile이 없는 종목(ETF 등)은 TTL 동안 다시 조회하지 않는지 테스트"""
+        service = StockService()
+        fetch_profile = mocker.patch.object(service, '_fetch_profile', return_value=None)
+        
+        first = await service._get_profiles(['SPY'])
+        second = await service._get_profiles(['SPY'])
+        
+        fetch_profile.assert_called_once_with('SPY')
+        assert first['SPY'] == second['SPY'] == {'name': 'N/A', 'sector': 'N/A', 'industry': 'N/A'}
+        
+        service.profile_misses.ttl = 0
+        await asyncio.sleep(0.01)
+        await service._get_profiles(['SPY'])
+        assert fetch_profile.call_count == 2
+
+
+class TestQuoteCache:
+    """get_stock_info 시세 캐시 테스트"""
+    
+    @staticmethod
+    def _mock_ticker(price=385.20):
+        mock_ticker = MagicMock()
+        mock_ticker.asset_profile = {'TSLA': {'longName': 'Tesla, Inc.'}}
+        mock_ticker.summary_detail = {'TSLA': {'regularMarketPrice': price}}
+        return with_quotes(mock_ticker)
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_cache_hit(self, mocker):
+        """같은 종목 재조회 시 업스트림을 호출하지 않는지 테스트"""
+        service = StockService()
+        ticker_cls = mocker.patch('services.stock_service.Ticker', return_value=self._mock_ticker())
+        
+        first = await service.get_stock_info('TSLA')
+        second = await service.get_stock_info('tsla')
+        
+        assert property_mock(ticker_cls.return_value, 'quotes').call_count == 1
+        assert first == second
+        assert service.quote_cache.stats()['hits'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_fresh_bypasses_cache(self, mocker):
+        """fresh=True 조회는 신선한 캐시가 있어도 업스트림에서 조회하고 캐시를 갱신하는지 테스트"""
+        service = StockService()
+        mock_ticker = self._mock_ticker(100.0)
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        await service.get_stock_info('TSLA')
+        property_mock(mock_ticker, 'quotes').return_value = {'TSLA': {'regularMarketPrice': 200.0}}
+        
+        cached = await service.get_stock_info('TSLA')
+        fresh = await service.get_stock_info('TSLA', fresh=True)
+        
+        assert cached['price'] == 100.0
+        assert fresh['price'] == 200.0
+        assert property_mock(mock_ticker, 'quotes').call_count == 2
+        assert (await service.get_stock_info('TSLA'))['price'] == 200.0
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_errors_not_cached(self, mocker):
+        """오류 응답은 캐시되지 않는지 테스트"""
+        service = StockService()
+        mocker.patch('services.stock_service.Ticker', side_effect=Exception("Connection Error"))
+        
+        await service.get_stock_info('TSLA')
+        
+        assert len(service.quote_cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_stale_while_revalidate(self, mocker):
+        """stale 항목은 즉시 반환되고 백그라운드에서 갱신되는지 테스트"""
+        service = StockService()
+        service.quote_cache.ttl = 0
+        mock_ticker = self._mock_ticker(100.0)
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        await service.get_stock_info('TSLA')
+        property_mock(mock_ticker, 'quotes').return_value = {'TSLA': {'regularMarketPrice': 200.0}}
+        
+        stale = await service.get_stock_info('TSLA')
+        assert stale['price'] == 100.0
+        
+        await asyncio.gather(*service._background_tasks)
+        
+        assert property_mock(mock_ticker, 'quotes').call_count == 2
+        cached, _ = service.quote_cache.get('TSLA')
+        assert cached['price'] == 200.0
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_batch_uses_cache(self, mocker):
+        """일괄 조회 시 캐시된 종목은 업스트림 조회에서 제외되는지 테스트"""
+        service = StockService()
+        service.quote_cache.set('TSLA', {'ticker': 'TSLA', 'price': 1.0, 'status': 'success'})
+        
+        mock_ticker = MagicMock()
+        mock_ticker.asset_profile = {'NVDA': {'longName': 'NVIDIA Corporation'}}
+        mock_ticker.summary_detail = {'NVDA': {'regularMarketPrice': 142.50}}
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
+        
+        result = await service.get_stock_info_batch(['TSLA', 'NVDA'])
+        
+        assert mock_ticker.symbols == ['NVDA']
+        assert result['TSLA']['price'] == 1.0
+        assert result['NVDA']['price'] == 142.50
+
+
+class TestLastKnownGood:
+    """업스트림 장애 시 마지막 정상 응답 대체 테스트"""
+    
+    @staticmethod
+    def _open_breaker():
+        breaker = CircuitBreaker("yahoo", failure_threshold=1, reset_timeout=60)
+        breaker.record_failure(breaker.before_call())
+        return breaker
+    
+    @pytest.mark.asyncio
+    async def test_open_circuit_serves_last_known_good(self, mocker):
+        """회로가 열리면 업스트림 호출 없이 마지막 정상 응답을 경과 시간과 함께 반환하는지 테스트"""
+        service = StockService()
+        ticker_cls = mocker.patch('services.stock_service.Ticker', return_value=TestQuoteCache._mock_ticker())
+        await service.get_stock_info('TSLA')
+        service.quote_cache.clear()
+        mocker.patch.object(service.executor, 'circuit_breaker', self._open_breaker())
+        
+        result = await service.get_stock_info('TSLA')
+        batch = await service.get_stock_info_batch(['TSLA', 'NVDA'])
+        
+        assert property_mock(ticker_cls.return_value, 'quotes').call_count == 1
+        assert result['price'] == 385.20
+        assert result['stale'] is True
+        assert result['data_age_seconds'] >= 0
+        assert batch['TSLA']['stale'] is True
+        assert batch['NVDA']['status'] == 'error'
+    
+    @pytest.mark.asyncio
+    async def test_open_circuit_without_history_returns_error(self, mocker):
+        """마지막 정상 응답이 없으면 기존처럼 오류를 반환하는지 테스트"""
+        service = StockService()
+        mocker.patch.object(service.executor, 'circuit_breaker', self._open_breaker())
+        
+        result = await service.get_trending_stocks('most_actives')
+        
+        assert result['status'] == 'error'
+        assert result['error_type'] == 'CircuitOpenError'
+
+
+class TestSingleFlight:
+    """동시 동일 요청 병합 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_get_stock_info_single_upstream_call(self, mocker):
+        """같은 종목 동시 조회가 업스트림 호출 1회로 병합되는지 테스트"""
+        service = StockService()
+        
+        mock_ticker = MagicMock()
+        mock_ticker.asset_profile = {'TSLA': {'longName': 'Tesla, Inc.'}}
+        mock_ticker.summary_detail = {'TSLA': {'regularMarketPrice': 385.20}}
+        ticker_cls = mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
+        
+        results = await asyncio.gather(*(service.get_stock_info('TSLA') for _ in range(10)))
+        
+        property_mock(mock_ticker, 'quotes').assert_called_once()
+        assert all(result['price'] == 385.20 for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_get_trending_stocks_single_screener_call(self, mocker):
+        """같은 스크리너 동시 조회가 get_screeners 1회로 병합되는지 테스트"""
+        service = StockService()
+        
+        mock_screener_response = {'most_actives': {'quotes': [{'symbol': 'TSLA'}]}}
+        get_screeners = mocker.patch.object(service.screener, 'get_screeners', return_value=mock_screener_response)
+        mocker.patch.object(service, 'get_stock_info', return_value={'ticker': 'TSLA', 'status': 'success'})
+        
+        results = await asyncio.gather(*(service.get_trending_stocks('most_actives') for _ in range(5)))
+        
+        assert get_screeners.call_count == 1
+        assert all(result['status'] == 'success' for result in results)
+
+
+class TestSharedSession:
+    """공유 HTTP 세션 / Ticker 재사용 테스트"""
+    
+    def test_screener_uses_shared_session(self):
+        """Screener가 서비스의 공유 세션을 사용하는지 테스트"""
+        service = StockService()
+        
+        assert service.screener.session is service.session
+    
+    @pytest.mark.asyncio
+    async def test_ticker_reused_across_requests(self, mocker):
+        """연속 조회 시 Ticker를 새로 만들지 않고 심볼만 바꿔 재사용하는지 테스트"""
+        service = StockService()
+        
+        # 프로필은 이미 알고 있으므로 시세만 조회
+        await service._store_profiles({
+            'TSLA': {'name': 'Tesla', 'sector': 'N/A', 'industry': 'N/A'},
+            'NVDA': {'name': 'NVIDIA', 'sector': 'N/A', 'industry': 'N/A'},
+        })
+        mock_ticker = MagicMock()
+        type(mock_ticker).quotes = PropertyMock(side_effect=[
+            {'TSLA': {'regularMarketPrice': 1.0}},
+            {'NVDA': {'regularMarketPrice': 2.0}},
+        ])
+        ticker_cls = mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        first = await service.get_stock_info('TSLA')
+        second = await service.get_stock_info('NVDA')
+        
+        ticker_cls.assert_called_once_with(['TSLA'], session=service.session)
+        assert mock_ticker.symbols == ['NVDA']
+        assert (first['price'], second['price']) == (1.0, 2.0)
+
+
+class TestGetStockInfoBatch:
+    """get_stock_info_batch 메서드 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_batch_single_request(self, mocker):
+        """여러 종목을 quote 요청 한 번으로 조회하는지 테스트"""
+        service = StockService()
+        
+        mock_ticker = MagicMock()
+        mock_ticker.asset_profile = {
+            'TSLA': {'longName': 'Tesla, Inc.', 'sector': 'Consumer Cyclical'},
+            'NVDA': {'longName': 'NVIDIA Corporation', 'sector': 'Technology'},
+        }
+        mock_ticker.summary_detail = {
+            'TSLA': {'regularMarketPrice': 110.00, 'regularMarketPreviousClose': 100.00},
+            'NVDA': {'regularMarketPrice': 142.50, 'regularMarketPreviousClose': 142.50},
+        }
+        
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
+        
+        result = await service.get_stock_info_batch(['tsla', 'NVDA', 'TSLA'])
+        
+        property_mock(mock_ticker, 'quotes').assert_called_once()
+        assert list(result.keys()) == ['TSLA', 'NVDA']
+        assert result['TSLA']['name'] == 'Tesla, Inc.'
+        assert pytest.approx(result['TSLA']['change_percent'], 0.01) == 10.0
+        assert result['NVDA']['sector'] == 'Technology'
+        assert result['NVDA']['status'] == 'success'
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_batch_symbol_error_string(self, mocker):
+        """일부 종목이 오류 문자열로 응답해도 나머지는 정상 파싱되는지 테스트"""
+        service = StockService()
+        
+        mock_ticker = MagicMock()
+        mock_ticker.asset_profile = {
+            'TSLA': {'longName': 'Tesla, Inc.'},
+            'XXXX': 'Quote not found for ticker symbol: XXXX',
+        }
+        mock_ticker.summary_detail = {
+            'TSLA': {'regularMarketPrice': 385.20},
+            'XXXX': 'Quote not found for ticker symbol: XXXX',
+        }
+        
+        mocker.patch('services.stock_service.Ticker', return_value=with_quotes(mock_ticker))
+        
+        result = await service.get_stock_info_batch(['TSLA', 'XXXX'])
+        
+        assert result['TSLA']['price'] == 385.20
+        assert result['XXXX']['status'] == 'success'
+        assert result['XXXX']['name'] == 'N/A'
+        assert result['XXXX']['price'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_batch_api_exception(self, mocker):
+        """API 호출 중 예외 발생 시 종목별 오류 반환 테스트"""
+        service = StockService()
+        
+        mocker.patch('services.stock_service.Ticker', side_effect=Exception("Connection Error"))
+        
+        result = await service.get_stock_info_batch(['TSLA', 'NVDA'])
+        
+        assert set(result.keys()) == {'TSLA', 'NVDA'}
+        assert all(item['status'] == 'error' for item in result.values())
+        assert 'Connection Error' in result['TSLA']['error']
+    
+    @pytest.mark.asyncio
+    async def test_get_stock_info_batch_empty_list(self):
+        """빈 목록 입력 테스트"""
+        service = StockService()
+        
+        result = await service.get_stock_info_batch([])
+        
+        assert result == {}
+
+
 class TestScreenStocks:
     """screen_stocks 메서드 테스트"""
     
+    @staticmethod
+    def _screener_response():
+        return {
+            'most_actives': {'quotes': [
+                {'symbol': 'TSLA', 'shortName': 'Tesla', 'regularMarketPrice': 400.0,
+                 'regularMarketChangePercent': 5.0, 'regularMarketVolume': 3_000_000,
+                 'averageDailyVolume3Month': 1_000_000, 'marketCap': 1.2e12, 'trailingPE': 90.0},
+                {'symbol': 'F', 'shortName': 'Ford', 'regularMarketPrice': 11.0,
+                 'regularMarketChangePercent': -1.0, 'regularMarketVolume': 5_000_000,
+                 'averageDailyVolume3Month': 5_000_000, 'marketCap': 4.5e10},
+            ]},
+            'ms_technology': {'quotes': [
+                {'symbol': 'NVDA', 'shortName': 'NVIDIA', 'regularMarketPrice': 140.0,
+                 'regularMarketChangePercent': 2.0, 'regularMarketVolume': 2_000_000,
+                 'averageDailyVolume3Month': 500_000, 'marketCap': 3.4e12},
+            ]},
+        }
+    
     @pytest.mark.asyncio
-    async def test_screen_stocks_returns_empty_list(self):
-        """스크리닝이 빈 리스트를 반환하는지 테스트"""
+    async def test_screen_stocks_filters_snapshot(self, mocker):
+        """가격/섹터 조건과 정렬이 스냅샷에 적용되는지 테스트"""
         service = StockService()
+        mocker.patch.object(service.screener, 'get_screeners', return_value=self._screener_response())
         
-        criteria = {
-            'minPrice': 100,
-            'maxPrice': 500
-        }
+        response = await service.screen_stocks({'min_price': 100, 'max_price': 500, 'sort_by': 'change_percent'})
+        result = response['results']
+        
+        assert response['status'] == 'success'
+        assert response['count'] == 2
+        assert response['universe_size'] == 3
+        assert [stock['ticker'] for stock in result] == ['TSLA', 'NVDA']
+        assert result[1]['sector'] == 'Technology'
+        assert result[0]['volume_ratio'] == 3.0
+        
+        result = (await service.screen_stocks({'sectors': ['technology']}))['results']
+        
+        assert [stock['ticker'] for stock in result] == ['NVDA']
+    
+    @pytest.mark.asyncio
+    async def test_screen_stocks_profiles_only_for_results(self, mocker):
+        """저장된 프로필은 응답할 종목에 대해서만 조회해 보강하는지 테스트"""
+        service = StockService()
+        mocker.patch.object(service.screener, 'get_screeners', return_value=self._screener_response())
+        await service._store_profiles({'NVDA': {'name': 'NVIDIA Corporation', 'sector': 'Technology', 'industry': 'Semiconductors'}})
+        known_profiles = mocker.spy(service, '_known_profiles')
+        
+        result = (await service.screen_stocks({'sectors': ['technology']}))['results']
+        
+        assert known_profiles.call_args_list == [mocker.call(['NVDA'])]
+        assert result[0]['name'] == 'NVIDIA Corporation'
+        assert result[0]['industry'] == 'Semiconductors'
+    
+    @pytest.mark.asyncio
+    async def test_screen_stocks_reuses_snapshot_within_ttl(self, mocker):
+        """TTL 이내의 반복 스크리닝은 업스트림을 호출하지 않는지 테스트"""
+        service = StockService()
+        get_screeners = mocker.patch.object(service.screener, 'get_screeners', return_value=self._screener_response())
         
-        result = await service.screen_stocks(criteria)
+        await service.screen_stocks({'min_volume_ratio': 2})
+        result = (await service.screen_stocks({'min_volume_ratio': 2}))['results']
         
-        assert isinstance(result, list)
-        assert len(result) == 0
+        get_screeners.assert_called_once()
+        assert [stock['ticker'] for stock in result] == ['TSLA', 'NVDA']
     
     @pytest.mark.asyncio
     async def test_screen_stocks_exception_handling(self, mocker):
-        """스크리닝 중 예외 처리 테스트"""
+        """스냅샷을 만들 수 없으면 snapshot_unavailable, 조건이 잘못되면 validation_error를 반환하는지 테스트"""
         service = StockService()
+        get_screeners = mocker.patch.object(service.screener, 'get_screeners', side_effect=Exception("Connection Error"))
         
-        # screen_stocks에서 예외 발생 유도
-        # (현재는 TODO이므로 직접 예외를 발생시키지 않음)
-        criteria = {}
-        result = await service.screen_stocks(criteria)
+        unavailable = await service.screen_stocks({'min_price': 100})
+        ranking = await service.get_ranking('most_actives')
         
-        assert isinstance(result, list)
-        assert len(result) == 0
+        assert unavailable['status'] == ranking['status'] == 'error'
+        assert unavailable['error_type'] == ranking['error_type'] == 'snapshot_unavailable'
+        
+        get_screeners.side_effect = None
+        get_screeners.return_value = self._screener_response()
+        invalid = await service.screen_stocks({'unknown': 1})
+        
+        assert invalid['status'] == 'error'
+        assert invalid['error_type'] == 'validation_error'
+
+
+class TestSnapshotRankings:
+    """시장 스냅샷 순위 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_trending_reads_fresh_snapshot(self, mocker):
+        """신선한 스냅샷이 있으면 화제 종목을 스냅샷 순위에서 읽는지 테스트"""
+        service = StockService()
+        get_screeners = mocker.patch.object(
+            service.screener, 'get_screeners', return_value=TestScreenStocks._screener_response()
+        )
+        await service.refresh_snapshot()
+        get_screeners.reset_mock()
+        
+        gainers = await service.get_trending_stocks('day_gainers', count=2)
+        losers = await service.get_all_trending_stocks()
+        
+        get_screeners.assert_not_called()
+        assert [stock['ticker'] for stock in gainers['stocks']] == ['TSLA', 'NVDA']
+        assert losers['results']['day_losers']['top_stock']['ticker'] == 'F'
+    
+    @pytest.mark.asyncio
+    async def test_trending_falls_back_when_snapshot_stale(self, mocker):
+        """스냅샷이 만료되면 스크리너를 직접 조회하는지 테스트"""
+        service = StockService()
+        get_screeners = mocker.patch.object(
+            service.screener, 'get_screeners', return_value=TestScreenStocks._screener_response()
+        )
+        await service.refresh_snapshot()
+        service.snapshot_ttl = -1
+        
+        await service.get_trending_stocks('most_actives')
+        
+        get_screeners.assert_called_with('most_actives', 25)
+    
+    @pytest.mark.asyncio
+    async def test_get_ranking_unusual_volume(self, mocker):
+        """거래량 급증 순위 조회 테스트"""
+        service = StockService()
+        mocker.patch.object(service.screener, 'get_screeners', return_value=TestScreenStocks._screener_response())
+        
+        result = await service.get_ranking('unusual_volume', count=5)
+        invalid = await service.get_ranking('unknown')
+        
+        assert [stock['ticker'] for stock in result['stocks']] == ['NVDA', 'TSLA']
+        assert invalid['status'] == 'error'
+    
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_snapshot(self, mocker):
+        """갱신에 실패하면 기존 스냅샷을 그대로 사용하는지 테스트"""
+        service = StockService()
+        get_screeners = mocker.patch.object(
+            service.screener, 'get_screeners', return_value=TestScreenStocks._screener_response()
+        )
+        first = await service.refresh_snapshot()
+        service.snapshot_ttl = -1
+        get_screeners.side_effect = Exception("Connection Error")
+        
+        result = await service.screen_stocks({})
+        
+        assert service.snapshot is first
+        assert result['status'] == 'success'
+        assert result['count'] == 3
+    
+    @pytest.mark.asyncio
+    async def test_background_refresh_swaps_snapshot(self, mocker):
+        """주기 갱신이 새 스냅샷으로 참조를 교체하는지 테스트"""
+        service = StockService()
+        mocker.patch.object(service.screener, 'get_screeners', return_value=TestScreenStocks._screener_response())
+        empty = service.snapshot
+        
+        service.start_snapshot_refresh(interval=60)
+        for _ in range(100):
+            if service.snapshot is not empty:
+                break
+            await asyncio.sleep(0.01)
+        await service.stop_snapshot_refresh()
+        
+        assert len(empty) == 0
+        assert len(service.snapshot) == 3
+    
+    @pytest.mark.asyncio
+    async def test_refresh_populates_search_index(self, mocker):
+        """스냅샷 갱신 시 종목이 검색 인덱스에 추가되고 파일로 저장되는지 테스트"""
+        service = StockService()
+        mocker.patch.object(service.screener, 'get_screeners', return_value=TestScreenStocks._screener_response())
+        
+        await service.refresh_snapshot()
+        
+        assert service.search_stocks('nvd')[0]['ticker'] == 'NVDA'
+        assert service.search_stocks('tesla')[0]['ticker'] == 'TSLA'
+        assert len(StockService().search_index) == 3
+    
+    @pytest.mark.asyncio
+    async def test_search_index_rebuilt_only_for_new_symbols(self, mocker):
+        """유니버스가 그대로면 검색 인덱스를 다시 만들지 않고, 새 종목이 생기면 다시 만드는지 테스트"""
+        service = StockService()
+        response = TestScreenStocks._screener_response()
+        mocker.patch.object(service.screener, 'get_screeners', return_value=response)
+        
+        await service.refresh_snapshot()
+        first = service.search_index
+        await service.refresh_snapshot()
+        
+        assert service.search_index is first
+        
+        response['most_actives']['quotes'].append({'symbol': 'PLTR', 'longName': 'Palantir', 'regularMarketPrice': 25.0})
+        await service.refresh_snapshot()
+        
+        assert service.search_index is not first
+        assert service.search_stocks('pltr')[0]['ticker'] == 'PLTR'
 
 
 class TestIntegration:
@@ -530,3 +1363,128 @@ class TestIntegration:
         assert result['status'] == 'success'
         assert result['top_stock']['ticker'] == 'TSLA'
         assert result['top_stock']['market_cap'] == '$4,326.9B'
+
+
+class TestHistory:
+    """일봉 히스토리 갱신 테스트"""
+    
+    @staticmethod
+    def _history_frame(rows):
+        """yahooquery history() 응답과 같은 (symbol, date) 인덱스의 DataFrame 생성"""
+        import pandas as pd
+        from datetime import date
+        
+        index = pd.MultiIndex.from_tuples(
+            [(symbol, date.fromisoformat(day)) for symbol, day, _ in rows], names=['symbol', 'date']
+        )
+        closes = [close for _, _, close in rows]
+        return pd.DataFrame(
+            {'open': closes, 'high': closes, 'low': closes, 'close': closes, 'volume': [100] * len(rows)},
+            index=index
+        )
+    
+    @pytest.mark.asyncio
+    async def test_update_history_backfill_then_incremental(self, mocker):
+        """최초에는 백필 기간으로, 이후에는 마지막 저장일부터 조회하는지 테스트"""
+        service = StockService()
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = self._history_frame([
+            ('TSLA', '2025-01-02', 100.0), ('TSLA', '2025-01-03', 101.0),
+            ('NVDA', '2025-01-02', 140.0),
+        ])
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        first = await service.update_history(['TSLA', 'nvda'])
+        
+        mock_ticker.history.assert_called_once_with(period='2y', interval='1d')
+        assert first == {'TSLA': 2, 'NVDA': 1}
+        
+        mock_ticker.history.reset_mock()
+        mock_ticker.history.return_value = self._history_frame([
+            ('TSLA', '2025-01-03', 102.0), ('TSLA', '2025-01-06', 103.0),
+        ])
+        
+        second = await service.update_history(['TSLA'])
+        
+        mock_ticker.history.assert_called_once_with(start='2025-01-03', interval='1d')
+        assert second == {'TSLA': 1}
+        assert service.get_history('TSLA').close.tolist() == [100.0, 102.0, 103.0]
+    
+    @pytest.mark.asyncio
+    async def test_history_file_work_runs_off_event_loop(self, mocker):
+        """마지막 거래일 조회와 파일 추가가 이벤트 루프 스레드 밖에서 실행되는지 테스트"""
+        service = StockService()
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = self._history_frame([('TSLA', '2025-01-02', 100.0)])
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        loop_thread = threading.current_thread()
+        last_date = service.history_store.last_date
+        append = service.history_store.append
+        threads = {}
+        
+        def recording(name, func):
+            def wrapper(*args):
+                threads[name] = threading.current_thread()
+                return func(*args)
+            return wrapper
+        
+        mocker.patch.object(service.history_store, 'last_date', side_effect=recording('last_date', last_date))
+        mocker.patch.object(service.history_store, 'append', side_effect=recording('append', append))
+        
+        result = await service.update_history(['TSLA'])
+        
+        assert result == {'TSLA': 1}
+        assert set(threads) == {'last_date', 'append'}
+        assert all(thread is not loop_thread for thread in threads.values())
+    
+    @pytest.mark.asyncio
+    async def test_update_history_error_response(self, mocker):
+        """조회 실패 시 저장하지 않고 0을 반환하는지 테스트"""
+        service = StockService()
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = {'TSLA': 'No data found'}
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        result = await service.update_history(['TSLA'])
+        
+        assert result == {'TSLA': 0}
+        assert service.get_history('TSLA') is None
+    
+    @pytest.mark.asyncio
+    async def test_get_indicators_backfills_missing_history(self, mocker):
+        """히스토리가 없는 종목은 백필 후 지표를 계산하는지 테스트"""
+        service = StockService()
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = self._history_frame([
+            ('TSLA', f'2025-01-{day:02d}', 100.0 + day) for day in range(1, 31)
+        ])
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        
+        result = await service.get_indicators(['tsla', 'NVDA'])
+        
+        mock_ticker.history.assert_called_once()
+        assert result['TSLA']['status'] == 'success'
+        assert result['TSLA']['as_of'] == '2025-01-30'
+        assert result['TSLA']['ma_20'] == pytest.approx(120.5)
+        assert result['NVDA']['status'] == 'error'
+    
+    @pytest.mark.asyncio
+    async def test_get_indicators_updates_stale_history(self, mocker):
+        """저장된 히스토리가 마지막 거래일보다 오래되면 누락된 봉을 추가한 뒤 계산하는지 테스트 (거래일당 한 번)"""
+        service = StockService()
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = self._history_frame([
+            ('TSLA', f'2025-01-{day:02d}', 100.0 + day) for day in range(1, 31)
+        ])
+        mocker.patch('services.stock_service.Ticker', return_value=mock_ticker)
+        await service.update_history(['TSLA'])
+        mocker.patch('services.stock_service.latest_trading_day', return_value=np.datetime64('2025-01-31'))
+        mock_ticker.history.reset_mock()
+        mock_ticker.history.return_value = self._history_frame([('TSLA', '2025-01-31', 200.0)])
+        
+        first = await service.get_indicators(['TSLA'])
+        second = await service.get_indicators(['TSLA'])
+        
+        mock_ticker.history.assert_called_once_with(start='2025-01-30', interval='1d')
+        assert first['TSLA']['as_of'] == '2025-01-31'
+        assert second['TSLA']['as_of'] == '2025-01-31'
@@ -0,0 +1,79 @@
+"""
+UpstreamExecutor 단위 테스트
+블로킹 업스트림 호출의 스레드 풀 실행 테스트
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from services.upstream_executor import UpstreamExecutor, get_executor
+
+
+class TestUpstreamExecutor:
+    """UpstreamExecutor 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_run_returns_result(self):
+        """함수 결과가 그대로 반환되는지 테스트"""
+        executor = UpstreamExecutor("test", max_workers=2)
+        
+        result = await executor.run(lambda a, b=0: a + b, 1, b=2)
+        
+        assert result == 3
+        assert executor.stats()['completed'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_run_does_not_block_event_loop(self):
+        """블로킹 호출이 병렬로 겹쳐 실행되는지 테스트"""
+        executor = UpstreamExecutor("test", max_workers=4)
+        
+        started = time.monotonic()
+        await asyncio.gather(*(executor.run(time.sleep, 0.2) for _ in range(4)))
+        elapsed = time.monotonic() - started
+        
+        assert elapsed < 0.6
+    
+    @pytest.mark.asyncio
+    async def test_queue_depth_bounded_by_workers(self):
+        """워커 수를 넘는 호출은 대기열에 쌓이는지 테스트"""
+        executor = UpstreamExecutor("test", max_workers=1)
+        release = threading.Event()
+        
+        tasks = [asyncio.create_task(executor.run(release.wait, 1)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        
+        stats = executor.stats()
+        assert stats['running'] == 1
+        assert stats['queue_depth'] == 2
+        
+        release.set()
+        await asyncio.gather(*tasks)
+        
+        stats = executor.stats()
+        assert stats['queue_depth'] == 0
+        assert stats['max_queue_depth'] >= 2
+        assert stats['completed'] == 3
+    
+    @pytest.mark.asyncio
+    async def test_run_propagates_exception(self):
+        """예외가 호출자에게 전파되는지 테스트"""
+        executor = UpstreamExecutor("test", max_workers=1)
+        
+        def fail():
+            raise RuntimeError("upstream down")
+        
+        with pytest.raises(RuntimeError):
+            await executor.run(fail)
+        
+        assert executor.stats()['failed'] == 1
+    
+    def test_max_workers_from_env(self, monkeypatch):
+        """환경 변수로 워커 수를 설정하는지 테스트"""
+        monkeypatch.setenv("ENVTEST_MAX_WORKERS", "3")
+        
+        executor = get_executor("envtest")
+        
+        assert executor.max_workers == 3
+        assert get_executor("envtest") is executor
@@ -0,0 +1,144 @@
+"""
+업스트림 녹화/재생 서버 테스트
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from services.http_session import create_pooled_session, to_replay_url
+from services.upstream_replay import ReplayServer, FixtureStore, fixture_key
+
+QUOTE_URL = "https://query2.finance.yahoo.com/v7/finance/quote"
+
+
+@pytest.fixture
+def fixtures(tmp_path):
+    return tmp_path / "fixtures"
+
+
+def _serve(fixtures, **kwargs):
+    return ReplayServer(fixtures, **kwargs).start()
+
+
+def _store_quote(fixtures, body='{"price": 400.0}'):
+    key = fixture_key("GET", "query2.finance.yahoo.com", "/v7/finance/quote", "symbols=TSLA")
+    FixtureStore(fixtures).save("query2.finance.yahoo.com", key, {}, 200, "application/json", body.encode())
+
+
+class TestFixtureKey:
+    """픽스처 키 테스트"""
+    
+    def test_ignores_volatile_params(self):
+        """crumb 파라미터, 쿼리 순서, 날짜 필드가 키에 영향을 주지 않는지 테스트"""
+        base = fixture_key("GET", "query2.finance.yahoo.com", "/v7/quote", "symbols=TSLA&formatted=false")
+        
+        assert fixture_key("GET", "QUERY2.finance.yahoo.com", "/v7/quote", "formatted=false&symbols=TSLA&crumb=x") == base
+        assert fixture_key("GET", "query2.finance.yahoo.com", "/v7/quote", "symbols=NVDA&formatted=false") != base
+        
+        first = fixture_key("POST", "api.exa.ai", "/search", "", b'{"query": "TSLA", "startPublishedDate": "2026-01-01"}')
+        second = fixture_key("POST", "api.exa.ai", "/search", "", b'{"startPublishedDate": "2026-02-02", "query": "TSLA"}')
+        assert first == second
+    
+    def test_to_replay_url(self):
+        """업스트림 URL이 재생 서버 경로로 변환되는지 테스트"""
+        assert to_replay_url("http://127.0.0.1:8765/", "https://api.exa.ai/search?a=1") == "http://127.0.0.1:8765/api.exa.ai/search?a=1"
+        assert to_replay_url("http://127.0.0.1:8765", "https://fc.yahoo.com") == "http://127.0.0.1:8765/fc.yahoo.com"
+
+
+class TestReplayServer:
+    """재생 서버 테스트"""
+    
+    def test_replays_fixture_through_pooled_session(self, fixtures):
+        """재생 URL을 지정한 세션의 요청이 픽스처로 응답되는지 테스트"""
+        _store_quote(fixtures)
+        server = _serve(fixtures)
+        try:
+            session = create_pooled_session(retries=0, replay_url=server.url)
+            
+            response = session.get(QUOTE_URL, params={"symbols": "TSLA", "crumb": "abc"})
+            missing = session.get(QUOTE_URL, params={"symbols": "NVDA"})
+            
+            assert response.status_code == 200
+            assert response.json() == {"price": 400.0}
+            assert missing.status_code == 404
+            assert server.stats()['replayed'] == 1
+            assert server.stats()['misses'] == 1
+        finally:
+            server.stop()
+    
+    def test_injects_errors_and_latency(self, fixtures):
+        """지정한 비율로 503 오류와 지연을 주입하는지 테스트"""
+        _store_quote(fixtures)
+        server = _serve(fixtures, latency=0.05, error_rate=1.0, seed=1)
+        try:
+            response = requests.get(to_replay_url(server.url, QUOTE_URL + "?symbols=TSLA"), timeout=5)
+            
+            assert response.status_code == 503
+            assert response.elapsed.total_seconds() >= 0.04
+            assert server.stats()['injected_errors'] == 1
+        finally:
+            server.stop()
+    
+    def test_replay_session_does_not_retry_injected_errors(self, fixtures):
+        """재생 모드 세션은 재시도하지 않아 주입한 오류가 그대로 관측되는지 테스트"""
+        _store_quote(fixtures)
+        server = _serve(fixtures, error_rate=1.0, seed=1)
+        try:
+            session = create_pooled_session(retries=3, replay_url=server.url)
+            
+            response = session.get(QUOTE_URL, params={"symbols": "TSLA"})
+            
+            assert response.status_code == 503
+            assert server.stats()['requests'] == 1
+        finally:
+            server.stop()
+    
+    def test_record_then_replay(self, fixtures):
+        """녹화 모드 응답이 저장되어 이후 재생 모드에서 그대로 제공되는지 테스트"""
+        recorder = ReplayServer(fixtures, record=True)
+        upstream = MagicMock()
+        upstream.request.return_value = MagicMock(
+            status_code=200, content=b'{"results": []}', headers={"Content-Type": "application/json"}
+        )
+        recorder._upstream = upstream
+        recorder.start()
+        try:
+            requests.post(
+                to_replay_url(recorder.url, "https://api.exa.ai/search"),
+                json={"query": "TSLA stock news", "startPublishedDate": "2026-01-01"},
+                headers={"x-api-key": "secret"},
+                timeout=5
+            )
+        finally:
+            recorder.stop()
+        
+        method, url = upstream.request.call_args.args
+        assert (method, url) == ("POST", "https://api.exa.ai/search")
+        
+        server = _serve(fixtures)
+        try:
+            response = requests.post(
+                to_replay_url(server.url, "https://api.exa.ai/search"),
+                json={"query": "TSLA stock news", "startPublishedDate": "2026-03-03"},
+                timeout=5
+            )
+            assert response.json() == {"results": []}
+        finally:
+            server.stop()
+        
+        assert "secret" not in next(fixtures.rglob("*.json")).read_text()
+
+
+class TestServiceSwitch:
+    """환경 변수로 재생 모드 전환 테스트"""
+    
+    def test_news_service_uses_replay_url(self, monkeypatch):
+        """UPSTREAM_REPLAY_URL이 있으면 Exa 클라이언트가 재생 서버를 바라보는지 테스트"""
+        from services.news_service import NewsService
+        monkeypatch.delenv("EXA_API_KEY", raising=False)
+        monkeypatch.setenv("UPSTREAM_REPLAY_URL", "http://127.0.0.1:8765")
+        
+        service = NewsService()
+        
+        assert service.client.base_url == "http://127.0.0.1:8765/api.exa.ai"
@@ -1,7 +1,7 @@
 'use client';
 
 import { useState, useEffect } from 'react';
-import { getTrendingStock } from '@/lib/api';
+import { getAllTrendingStocks } from '@/lib/api';
 
 interface StockInfo {
   ticker: string;
@@ -34,44 +34,27 @@ export default function DashboardClient() {
   const fetchAllStocks = async () => {
     setLoading(true);
     setError(null);
+    let timeoutId: ReturnType<typeof setTimeout> | undefined;
 
     try {
-      const screeners = ['most_actives', 'day_gainers', 'day_losers'];
-      
-      // 타임아웃 설정 (15초)
-      const fetchWithTimeout = async (screener: string) => {
-        const timeoutPromise = new Promise((_, reject) =>
-          setTimeout(() => reject(new Error('Request timeout')), 15000)
-        );
-        
-        try {
-          console.log(`Fetching ${screener}...`);
-          const data = await Promise.race([
-            getTrendingStock(screener as any),
-            timeoutPromise
-          ]);
-          console.log(`${screener} response:`, data);
-          return { screener, data };
-        } catch (err) {
-          console.error(`Failed to fetch ${screener}:`, err);
-          return {
-            screener,
-            data: {
-              status: 'error',
-              message: `${screener} 데이터를 가져올 수 없습니다.`
-            }
-          };
-        }
-      };
-
-      // 병렬로 모든 요청 실행
-      const results = await Promise.all(
-        screeners.map(screener => fetchWithTimeout(screener))
-      );
+      const screeners = ['most_actives', 'day_gainers', 'day_losers'] as const;
+
+      // 타임아웃 설정 (15초, 응답이 먼저 오면 finally에서 해제)
+      const timeoutPromise = new Promise<never>((_, reject) => {
+        timeoutId = setTimeout(() => reject(new Error('Request timeout')), 15000);
+      });
+
+      // 세 스크리너를 한 번의 요청으로 조회
+      console.log('Fetching all screeners...');
+      const data = await Promise.race([getAllTrendingStocks(), timeoutPromise]);
+      console.log('trending/all response:', data);
 
       const stocksData: Record<string, any> = {};
-      results.forEach(({ screener, data }) => {
-        stocksData[screener] = data;
+      screeners.forEach((screener) => {
+        stocksData[screener] = data.results[screener] ?? {
+          status: 'error',
+          message: `${screener} 데이터를 가져올 수 없습니다.`
+        };
       });
 
       setStocks(stocksData);
@@ -80,6 +63,7 @@ export default function DashboardClient() {
       setError(`Failed to load stocks: ${errorMsg}`);
       console.error('Stock fetch error:', err);
     } finally {
+      clearTimeout(timeoutId);
       setLoading(false);
     }
   };
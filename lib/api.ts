@@ -35,6 +35,18 @@ export interface ApiTrendingStockResponse {
     pe_ratio?: string;
     news: ApiNewsItem[];
   };
+  count?: number;
+  stocks?: Omit<ApiStockInfo, "news">[];
+  error?: string;
+  message?: string;
+}
+
+export interface ApiAllTrendingStocksResponse {
+  status: string;
+  results: Record<
+    "most_actives" | "day_gainers" | "day_losers",
+    ApiTrendingStockResponse
+  >;
   error?: string;
   message?: string;
 }
@@ -93,6 +105,42 @@ export async function getTrendingStock(
   }
 }
 
+/**
+ * 전체 스크리너 화제 종목 일괄 조회 API 호출
+ * GET /api/stocks/trending/all
+ */
+export async function getAllTrendingStocks(): Promise<ApiAllTrendingStocksResponse> {
+  try {
+    const response = await fetch(`${API_BASE_URL}/stocks/trending/all`, {
+      method: "GET",
+      headers: {
+        "Content-Type": "application/json",
+      },
+    });
+
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({}));
+      throw new Error(`API Error: ${response.status} ${response.statusText} - ${error.detail || ""}`);
+    }
+
+    const data: ApiAllTrendingStocksResponse = await response.json();
+
+    // 응답 검증
+    if (!data.status || !data.results) {
+      throw new Error("Invalid response: missing status or results field");
+    }
+
+    if (data.status === "error") {
+      throw new Error(data.message || "Unknown error");
+    }
+
+    return data;
+  } catch (error) {
+    console.error("getAllTrendingStocks error:", error);
+    throw error;
+  }
+}
+
 /**
  * 종목 상세 정보 조회 API 호출
  * GET /api/stocks/{ticker}